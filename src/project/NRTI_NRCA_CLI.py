@@ -0,0 +1,367 @@
+from __future__ import annotations
+import argparse
+import fnmatch
+import os
+import sys
+from os import path
+
+# Modules of the project are imported as top-level packages, as when running from this directory.
+sys.path.insert(0, path.dirname(path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from element.CompositionFit import fitComposition, getCandidateSpectra
+from element.PeakTables import formatPeakTables, getDistributions, getThreshold
+from element.PeakTables import main as regenerateMain
+from element.ResonanceIndex import getResonanceIndex, parseEnergyQuery
+from element.SpectraDataStructure import SpectraData
+from element.SpectraManifest import getSpectraManifest
+from element.SpectraStore import dataDir, getSpectraStore, loadSpectrumGraphData
+from helpers.measuredData import readMeasuredData
+from helpers.transmission import captureYield, transmission
+
+defaultLength = {"n-g": 22.804, "n-tot": 23.404}
+
+
+def getSpectraNames() -> list[str]:
+    """
+    ``getSpectraNames``
+    -------------------
+
+    Returns:
+        list[str]: Names of the library spectra, sorted.
+    """
+    return getSpectraManifest().spectraNames
+
+
+def getStoredPeakInformation(name: str) -> DataFrame | None:
+    """
+    ``getStoredPeakInformation``
+    ----------------------------
+
+    Args:
+        - ``name`` (str): Spectrum name, e.g. '29-Cu-63_n-g'.
+
+    Returns:
+        DataFrame | None: The shipped peak information table, None if there is none for ``name``.
+    """
+    store = getSpectraStore()
+    if store is not None:
+        return store.getPeakInformation(name)
+    try:
+        return pd.read_csv(f"{dataDir}Peak information/{name}.csv")
+    except FileNotFoundError:
+        return None
+
+
+def createSpectra(name: str, tof: bool = False, threshold: float = None, distributions: dict[str, float] = None,
+                  length: dict[str, float] = None, recalculate: bool = True) -> SpectraData:
+    """
+    ``createSpectra``
+    -----------------
+
+    Loads a library spectrum and analyses it as the GUI would when plotting it, without requiring Qt.
+
+    Args:
+        - ``name`` (str): Spectrum name, e.g. '29-Cu-63_n-g' or 'element_29-Cu_n-g'.
+
+        - ``tof`` (bool, optional): Whether the x-axis is time of flight rather than energy. Defaults to False.
+
+        - ``threshold`` (float, optional): Threshold for peak detection. Defaults to None, the threshold the GUI
+        uses for the spectrum.
+
+        - ``distributions`` (dict[str, float], optional): Abundance of the isotopes of an element which differ from
+        the natural abundance. Defaults to None.
+
+        - ``length`` (dict[str, float], optional): Flight length for n-g and n-tot spectra. Defaults to None, the
+        lengths used by the GUI.
+
+        - ``recalculate`` (bool, optional): Whether to recalculate the peak limits, integrals and table, rather than
+        use those shipped in the data folder. Defaults to True.
+
+    Raises:
+        ValueError: Distributions are given for a spectrum which is not an element, or flight lengths for an unknown
+        type of spectrum.
+        pandas.errors.EmptyDataError: The spectrum has no graph data.
+
+    Returns:
+        SpectraData: The analysed spectra.
+    """
+    if set(length or {}) - set(defaultLength):
+        raise ValueError(f"Flight lengths can only be given for {' and '.join(defaultLength)}")
+    if threshold is None:
+        threshold = getThreshold(name, getSpectraManifest().thresholds)
+    defaultDist = None
+    if "element" in name:
+        defaultDist = getDistributions(name)
+    elif distributions:
+        raise ValueError(f"{name} is not an element, isotopic distributions cannot be changed")
+    elementDist = defaultDist if not distributions else {**defaultDist, **distributions}
+
+    spectra = SpectraData(name=name,
+                          numPeaks=None,
+                          tableData=getStoredPeakInformation(name),
+                          graphData=loadSpectrumGraphData(name),
+                          graphColour=None,
+                          isToF=tof,
+                          distributions=elementDist,
+                          defaultDist=defaultDist,
+                          threshold=threshold,
+                          length={**defaultLength, **(length or {})})
+    if recalculate:
+        spectra.maxPeakLimitsX = {}
+        spectra.maxPeakLimitsY = {}
+        spectra.updatePeaks()
+    return spectra
+
+
+def _parseAssignments(values: list[str], option: str) -> dict[str, float]:
+    """
+    Parses repeated 'key=value' options into a dictionary of floats.
+    """
+    assignments = {}
+    for value in values or []:
+        key, separator, number = value.partition("=")
+        try:
+            assignments[key] = float(number)
+        except ValueError:
+            separator = ""
+        if not separator or not key:
+            raise argparse.ArgumentTypeError(f"{option} expects key=value, got '{value}'")
+    return assignments
+
+
+def _write(data: DataFrame, output: str, **kwargs) -> None:
+    """
+    Writes ``data`` as csv to ``output``, or to the standard output if it is None or '-'.
+    """
+    if output in (None, "-"):
+        data.to_csv(sys.stdout, index=False, lineterminator="\n", **kwargs)
+        return
+    os.makedirs(path.dirname(path.abspath(output)), exist_ok=True)
+    data.to_csv(output, index=False, **kwargs)
+
+
+def listCommand(args: argparse.Namespace) -> int:
+    for name in getSpectraNames():
+        if args.pattern is None or fnmatch.fnmatch(name, args.pattern):
+            print(name)
+    return 0
+
+
+def peaksCommand(args: argparse.Namespace) -> int:
+    spectra = createSpectra(args.name, args.tof, args.threshold, _parseAssignments(args.dist, "--dist"),
+                            _parseAssignments(args.length, "--length"), not args.stored)
+    if args.stored:
+        if len(spectra.tableData.columns) == 0:
+            print(f"No stored peak information for {args.name}", file=sys.stderr)
+            return 1
+        _write(spectra.tableData, args.output)
+        return 0
+    tableData, limits = formatPeakTables(spectra)
+    _write(tableData, args.output, float_format="%.3e")
+    if args.limits is not None:
+        if limits is None:
+            limits = DataFrame([spectra.maxPeakLimitsX[max] for max in spectra.maxima[0]
+                                if max in spectra.maxPeakLimitsX])
+        _write(limits, args.limits, header=False)
+    return 0
+
+
+def exportCommand(args: argparse.Namespace) -> int:
+    spectra = createSpectra(args.name, args.tof, args.threshold, _parseAssignments(args.dist, "--dist"),
+                            _parseAssignments(args.length, "--length"), recalculate=False)
+    broadening = {"timeResolution": args.resolution,
+                  "lengthResolution": args.length_resolution,
+                  "temperature": args.temperature}
+    if any(value < 0 for value in broadening.values()):
+        raise ValueError("--resolution, --length-resolution and --temperature must not be negative")
+    if not any(broadening.values()):
+        _write(spectra.graphData, args.output, header=False)
+        return 0
+    _write(DataFrame({0: spectra.graphArray.x, 1: spectra.getBroadened(**broadening)}), args.output, header=False)
+    return 0
+
+
+def findCommand(args: argparse.Namespace) -> int:
+    resonanceIndex = getResonanceIndex()
+    low, high = parseEnergyQuery(args.energy, args.tolerance)
+    peaks = resonanceIndex.queryNearest(low, high, args.tof, args.mode)
+    _write(resonanceIndex.toDataFrame(peaks), args.output)
+    return 0
+
+
+def _readMeasuredData(args: argparse.Namespace) -> DataFrame:
+    """
+    Reads the measured spectrum ``args.file``, rebinned by ``args.rebin`` and ``args.relative``.
+    """
+    return DataFrame(readMeasuredData(args.file, binWidth=args.rebin, relative=args.relative).T, copy=False)
+
+
+def matchCommand(args: argparse.Namespace) -> int:
+    spectra = SpectraData(name=path.splitext(path.basename(args.file))[0],
+                          numPeaks=None,
+                          tableData=None,
+                          graphData=_readMeasuredData(args),
+                          graphColour=None,
+                          isToF=False,
+                          distributions=None,
+                          defaultDist=None,
+                          threshold=args.threshold,
+                          isImported=True)
+    if spectra.maxima is None or spectra.maxima[0].size == 0:
+        print(f"No peaks found in {args.file}", file=sys.stderr)
+        return 1
+    candidates = getResonanceIndex().match(spectra.maxima[0], args.tolerance, args.tof, args.mode)
+    _write(candidates.head(args.top), args.output, float_format="%.4g")
+    return 0
+
+
+def fitCommand(args: argparse.Namespace) -> int:
+    graphData = _readMeasuredData(args)
+    candidates = getCandidateSpectra([element for value in args.elements for element in value.split(",")
+                                      if element.strip() != ""], args.mode, args.isotopes)
+    window = parseEnergyQuery(args.window) if args.window is not None else None
+    fit = fitComposition(graphData.iloc[:, 0].to_numpy(), graphData.iloc[:, 1].to_numpy(), candidates, window)
+    _write(fit.toDataFrame(args.by_element), args.output, float_format="%.4g")
+    print(f"Fitted {fit.points} points, RMS residual {fit.residual:.4g}", file=sys.stderr)
+    return 0
+
+
+def transmissionCommand(args: argparse.Namespace) -> int:
+    spectra = createSpectra(args.name, args.tof, args.threshold, _parseAssignments(args.dist, "--dist"),
+                            _parseAssignments(args.length, "--length"), recalculate=False)
+    densities = [float(density) for value in args.density for density in value.split(",") if density.strip() != ""]
+    total = spectra.getCrossSection("n-tot")
+    if args.capture:
+        y = captureYield(total, spectra.getCrossSection("n-g"), densities)
+    else:
+        y = transmission(total, densities)
+    x = spectra.energyGraphArray.x
+    if spectra.isToF:
+        x, y = spectra.graphArray.x, y[:, ::-1]
+    model = DataFrame({"TOF (us)" if spectra.isToF else "Energy (eV)": x,
+                       **{f"{density:g}": row for density, row in zip(densities, y)}})
+    _write(model, args.output, float_format="%.6g")
+    return 0
+
+
+def getParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="nrca", description="Headless analysis of the NRTI/NRCA spectra library.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    listParser = commands.add_parser("list", help="List the library spectra.")
+    listParser.add_argument("pattern", nargs="?", help="Shell-style pattern to filter names, e.g. '*Cu*'.")
+    listParser.set_defaults(function=listCommand)
+
+    def addSpectraArguments(commandParser: argparse.ArgumentParser) -> None:
+        commandParser.add_argument("name", help="Spectrum name, e.g. 29-Cu-63_n-g or element_29-Cu_n-g.")
+        commandParser.add_argument("--tof", action="store_true", help="Use time of flight rather than energy.")
+        commandParser.add_argument("-t", "--threshold", type=float, default=None,
+                                   help="Peak detection threshold, the GUI's threshold for the spectrum if omitted.")
+        commandParser.add_argument("-d", "--dist", action="append", metavar="ISOTOPE=ABUNDANCE",
+                                   help="Abundance of an isotope of an element, e.g. 29-Cu-63=0.5. Repeatable.")
+        commandParser.add_argument("-l", "--length", action="append", metavar="TYPE=METRES",
+                                   help="Flight length for n-g or n-tot spectra, e.g. n-g=22.804. Repeatable.")
+        commandParser.add_argument("-o", "--output", default=None, help="Output csv, the standard output if omitted.")
+
+    def addMeasuredArguments(commandParser: argparse.ArgumentParser) -> None:
+        commandParser.add_argument("--rebin", type=float, default=None, metavar="WIDTH",
+                                   help="Rebin the measured spectrum while reading it, to bins of this width.")
+        commandParser.add_argument("--relative", action="store_true",
+                                   help="The rebin width is relative, dx/x, giving logarithmic bins.")
+
+    peaksParser = commands.add_parser("peaks", help="Calculate the peak information table of a spectrum.")
+    addSpectraArguments(peaksParser)
+    peaksParser.add_argument("--limits", default=None, metavar="FILE",
+                             help="Also write the limits of each peak to this csv, '-' for the standard output.")
+    peaksParser.add_argument("--stored", action="store_true",
+                             help="Output the table shipped in the data folder rather than recalculating it.")
+    peaksParser.set_defaults(function=peaksCommand)
+
+    exportParser = commands.add_parser("export", help="Export the graph data of a spectrum.")
+    addSpectraArguments(exportParser)
+    exportParser.add_argument("--resolution", type=float, default=0.0, metavar="US",
+                              help="Standard deviation of the time of flight to broaden by, none if omitted.")
+    exportParser.add_argument("--length-resolution", type=float, default=0.0, metavar="METRES",
+                              help="Standard deviation of the flight length to broaden by, none if omitted.")
+    exportParser.add_argument("--temperature", type=float, default=0.0, metavar="KELVIN",
+                              help="Sample temperature to Doppler broaden by, none if omitted.")
+    exportParser.set_defaults(function=exportCommand)
+
+    transmissionParser = commands.add_parser("transmission", help="Model the transmission or capture yield of a "
+                                                                  "sample of a spectrum's isotope or element.")
+    addSpectraArguments(transmissionParser)
+    transmissionParser.add_argument("-n", "--density", action="append", required=True, metavar="ATOMS/B",
+                                    help="Areal density of the sample, e.g. 0.01 or 0.001,0.01,0.1. Repeatable.")
+    transmissionParser.add_argument("--capture", action="store_true",
+                                    help="Model the capture yield rather than the transmission.")
+    transmissionParser.set_defaults(function=transmissionCommand)
+
+    findParser = commands.add_parser("find", help="Find the isotope resonances near an energy, nearest first.")
+    findParser.add_argument("energy", help="Energy (eV), e.g. 6.67, a range, e.g. 6.6-6.8, or 6.67+-0.05.")
+    findParser.add_argument("--tof", action="store_true", help="Search times of flight (us) rather than energies.")
+    findParser.add_argument("--tolerance", type=float, default=0.01,
+                            help="Relative tolerance of a single value, 0.01 if omitted.")
+    findParser.add_argument("--mode", choices=["n-g", "n-tot"], default=None, help="Only search spectra of this mode.")
+    findParser.add_argument("-o", "--output", default=None, help="Output csv, the standard output if omitted.")
+    findParser.set_defaults(function=findCommand)
+
+    matchParser = commands.add_parser("match", help="Rank the isotopes whose resonances match the peaks of a "
+                                                    "measured spectrum, best first.")
+    matchParser.add_argument("file", help="Graph data csv of the measured spectrum, x-coords then y-coords.")
+    matchParser.add_argument("--tof", action="store_true", help="The x-coords are times of flight (us), not energies.")
+    matchParser.add_argument("-t", "--threshold", type=float, default=100,
+                             help="Peak detection threshold, 100 if omitted as for imports in the GUI.")
+    matchParser.add_argument("--tolerance", type=float, default=None,
+                             help="Relative tolerance of energies, or the maximum in us of times of flight.")
+    matchParser.add_argument("--mode", choices=["n-g", "n-tot"], default=None, help="Only match spectra of this mode.")
+    matchParser.add_argument("-n", "--top", type=int, default=None,
+                             help="Number of isotopes to output, all if omitted.")
+    matchParser.add_argument("-o", "--output", default=None, help="Output csv, the standard output if omitted.")
+    addMeasuredArguments(matchParser)
+    matchParser.set_defaults(function=matchCommand)
+
+    fitParser = commands.add_parser("fit", help="Fit the composition of a measured spectrum from candidate elements "
+                                                "by non-negative least squares.")
+    fitParser.add_argument("file", help="Graph data csv of the measured spectrum, energies then y-coords.")
+    fitParser.add_argument("-e", "--elements", action="append", required=True, metavar="ELEMENTS",
+                           help="Candidate element symbols, e.g. Cu or Cu,Cd,Au. Repeatable.")
+    fitParser.add_argument("--mode", choices=["n-g", "n-tot"], default="n-g",
+                           help="Mode of the spectrum, n-g if omitted.")
+    fitParser.add_argument("--window", default=None, help="Energy range (eV) to fit, e.g. 1-100, all if omitted.")
+    fitParser.add_argument("--isotopes", action="store_true",
+                           help="Fit the isotopes of each element rather than its natural abundance.")
+    fitParser.add_argument("--by-element", action="store_true", help="Sum the fitted isotopes of each element.")
+    fitParser.add_argument("-o", "--output", default=None, help="Output csv, the standard output if omitted.")
+    addMeasuredArguments(fitParser)
+    fitParser.set_defaults(function=fitCommand)
+
+    # Arguments of regenerate are parsed by element.PeakTables, see main.
+    commands.add_parser("regenerate", add_help=False,
+                        help="Regenerate the peak tables of the data folder, see regenerate -h.")
+    return parser
+
+
+def main(args: list[str] = None) -> int:
+    args = sys.argv[1:] if args is None else args
+    if args[:1] == ["regenerate"]:
+        return regenerateMain(args[1:])
+    parser = getParser()
+    args = parser.parse_args(args)
+    try:
+        # Spectra with repeated x-coords produce harmless divisions by zero while finding peak limits.
+        with np.errstate(all="ignore"):
+            return args.function(args)
+    except (ValueError, KeyError, FileNotFoundError, pd.errors.EmptyDataError, argparse.ArgumentTypeError) as error:
+        parser.exit(1, f"{parser.prog}: error: {error}\n")
+    except BrokenPipeError:
+        # The reader of the standard output, e.g. head, exited early.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,23 +1,27 @@
 from __future__ import annotations
+import time
+
+# Start of the import of this module, reported by ``--startup-report``.
+importStart = time.perf_counter()
+
 import os
 import sys
+import threading
 import numpy as np
 import pandas as pd
 import matplotlib.rcsetup
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.ticker import LogLocator, LogFormatter
 
-matplotlib.use('QtAgg')
-
 # from matplotlib.backends.backend_qt5agg import (
 #     FigureCanvasQTAgg as FigureCanvas,
 # )
 
-from matplotlib.backends.backend_qt5agg import (
+from matplotlib.backends.backend_qtagg import (
     NavigationToolbar2QT as NavigationToolbar
 )
 from PyQt6 import QtGui, QtWidgets
-from PyQt6.QtCore import Qt, QModelIndex, QRegularExpression as QRegExp, pyqtSignal
+from PyQt6.QtCore import Qt, QModelIndex, QRegularExpression as QRegExp, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction, QCursor, QRegularExpressionValidator as QRegExpValidator, QIcon
 
 from PyQt6.QtWidgets import (
@@ -39,9 +43,11 @@ from PyQt6.QtWidgets import (
     QMainWindow,
     QMenuBar,
     QMessageBox,
+    QProgressBar,
     QPushButton,
     QRadioButton,
     QSizePolicy,
+    QSlider,
     QSplitter,
     QTableView,
     QVBoxLayout,
@@ -49,22 +55,34 @@ from PyQt6.QtWidgets import (
 
 )
 from copy import deepcopy
+from functools import partial
+from typing import Callable
 
 from pyparsing import Literal
 
+from element.IsotopeBasis import getIsotopeBasis
+from element.ResonanceIndex import getResonanceIndex, parseEnergyQuery
 from element.SpectraDataStructure import SpectraData
+from element.SpectraManifest import getSpectraManifest
+from element.SpectraStore import getSpectraStore
 from myPyQt.ButtonDelegate import ButtonDelegate
 from myPyQt.CustomSortingProxy import CustomSortingProxy
 from myPyQt.ExtendedComboBox import ExtendedComboBox
 from myPyQt.ExtendedTableModel import ExtendedQTableModel
 from myPyQt.InputElementsDialog import InputElementsDialog
+from myPyQt.SpectraLoader import SpectraLoader
 
 from myMatplotlib.CustomFigureCanvas import FigureCanvas
 from myMatplotlib.BlittedCursor import BlittedCursor
+from myMatplotlib.DecimatedLine import DecimatedLine
 
+from helpers.conversion import energyToTOF
 from helpers.nearestNumber import nearestnumber
+from helpers.transmission import captureYield, transmission
 from helpers.getRandomColor import getRandomColor
 from helpers.getWidgets import getLayoutWidgets
+from helpers.graphDataCache import loadGraphData
+from helpers.measuredData import readMeasuredData
 
 
 # todo -------------------- Issues/Feature TODO list --------------------
@@ -100,6 +118,11 @@ from helpers.getWidgets import getLayoutWidgets
 matplotlib.rcParamsDefault["path.simplify"] = True
 matplotlib.rcParamsDefault["agg.path.chunksize"] = 1000
 
+# Seconds taken to import this module and its dependencies.
+importSeconds = time.perf_counter() - importStart
+# Modules only needed once spectra are analysed, imported in the background after the first paint.
+deferredModules = ["scipy.signal", "scipy.ndimage"]
+
 
 class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
     """
@@ -109,12 +132,14 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
     isotopes within the NRTI/NRCA Explorer.
     """
     resized = pyqtSignal()
+    startupFinished = pyqtSignal()
 
     # init constructure for classes
     def __init__(self) -> None:
         """
         Initialisar for ExplorerGUI class
         """
+        initStart = time.perf_counter()
         # Allows for adding more things to the QWidget template
         super(ExplorerGUI, self).__init__()
 
@@ -166,7 +191,8 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
             height: 11px;
         }}
 
-        QLabel#numPeakLabel, #thresholdLabel, #orderlabel, #compoundLabel, #peakLabel, #gridOptionLabel{{
+        QLabel#numPeakLabel, #thresholdLabel, #orderlabel, #compoundLabel, #resonanceLabel, #peakLabel,
+        #gridOptionLabel{{
             font: 11pt 'Roboto Mono';
             color: {text_color};
         }}
@@ -354,39 +380,53 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         self.compoundData = dict()
         self.isCompound = False
 
+        # Table model of the last resonance search or imported peak match, see showResonances.
+        self.resonanceModel = None
+        # Transmission or capture yield lines overlaid on the plot, see modelTransmission.
+        self.modelLines = []
+
         self.maxPeak = 50
         self.thresholds = dict()
         self.length = {"n-g": 22.804, "n-tot": 23.404}
-
-        self.dir = f"{os.path.dirname(__file__)}\\"
-        self.graphDataDir = f"{self.dir}data\\Graph Data\\"
-        self.distributionDir = self.dir + "data\\Distribution Information\\"
-        thresholdFilepath = self.dir + "data\\threshold_exceptions.txt"
+        # Resolution and Doppler broadening of the plotted library spectra, see editBroadening.
+        self.broadening = {"timeResolution": 0.0, "lengthResolution": 0.0, "temperature": 0.0}
+        # Rebinning of imported files as they are read, see editImportSettings.
+        self.importRebin = {"binWidth": 0.0, "relative": True}
+
+        self.dir = f"{os.path.dirname(__file__)}/"
+        self.graphDataDir = f"{self.dir}data/Graph Data/"
+        self.distributionDir = self.dir + "data/Distribution Information/"
         self.plotFilepath = None
 
-        self.defaultDistributions = dict()
-        self.elementDistributions = dict()
-
-        file = pd.read_csv(thresholdFilepath, header=None)
+        # Index of the data folder, rebuilt if the folder has changed since it was last loaded.
+        self.manifest = getSpectraManifest()
 
         # Initialise spectra thresholds dict
-        for line in file.values:
-            symbol = line[0].split(' ')[0]
-            self.thresholds[symbol] = (line[0].split(' ')[1].replace('(', ''), line[1].replace(')', ''))
+        self.thresholds = self.manifest.thresholds
 
-        # Initialise spectra natural abundance / distributions dict
-        dist_filePaths = [f for f in os.listdir(self.distributionDir) if f.endswith(".csv")]
-        for filepath in dist_filePaths:
-            name = filepath[:-4]
-            dist = pd.read_csv(f"{self.distributionDir}{filepath}", header=None)
-            self.defaultDistributions[name] = dict({d[0]: d[1] for d in dist.values})
+        # Packed spectra store, None if it has not been built or the data folder has changed since.
+        self.store = getSpectraStore()
 
+        # Initialise spectra natural abundance / distributions dict
+        self.defaultDistributions = deepcopy(self.manifest.distributions)
         self.elementDistributions = deepcopy(self.defaultDistributions)
 
+        # Loads spectra plotted from the buttons on a background thread.
+        self.spectraLoader = SpectraLoader(self)
+        self.spectraLoader.finished.connect(self.onSpectraLoaded)
+        self.spectraLoader.failed.connect(self.onSpectraFailed)
+        self.spectraLoader.progressChanged.connect(self.onLoadingProgress)
+        self.spectraLoader.taskProgressChanged.connect(self.onImportProgress)
+
         self.setStyleSheet(self.styleMain.format(bg_color="#202020", text_color="#FFF"))
         self.initUI()
         self.setAcceptDrops(True)
 
+        # Seconds taken by each stage of startup, completed by onFirstPaint.
+        self.startupTimes = {"import": importSeconds, "init": time.perf_counter() - initStart}
+        self.firstPaintStart = time.perf_counter()
+        QTimer.singleShot(0, self.onFirstPaint)
+
     def initUI(self) -> None:
         """
         ``initUI``
@@ -447,6 +487,14 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         editLength = QAction(QIcon("./src/img/edit-component.svg"), "&Edit Length", self)
         editLength.setShortcut("Ctrl+Shift+L")
         editLength.triggered.connect(self.editLength)
+
+        modelTransmissionAction = QAction(QIcon("./src/img/edit-component.svg"), "&Model Transmission", self)
+        modelTransmissionAction.setShortcut("Ctrl+Shift+M")
+        modelTransmissionAction.triggered.connect(self.modelTransmission)
+
+        fitCompositionAction = QAction(QIcon("./src/img/edit-component.svg"), "&Fit Composition", self)
+        fitCompositionAction.setShortcut("Ctrl+Shift+F")
+        fitCompositionAction.triggered.connect(self.fitSpectraComposition)
         # fileMenu.addAction(saveAction)
 
         editMenu = menubar.addMenu("&Edit")
@@ -454,6 +502,8 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         editMenu.addAction(editThresholdAction)
         editMenu.addAction(editDistribution)
         editMenu.addAction(editLength)
+        editMenu.addAction(fitCompositionAction)
+        editMenu.addAction(modelTransmissionAction)
 
         menubarLayout.addWidget(menubar, alignment=Qt.AlignmentFlag.AlignLeft)
         # Adding label which shows number of peaks
@@ -510,8 +560,18 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         maxPeaksOption.setShortcut("Ctrl+Shift+Q")
         maxPeaksOption.triggered.connect(self.editMaxPeaks)
 
+        broadeningOption = QAction(QIcon("./src/img/edit-component.svg"), "&Resolution Broadening", self)
+        broadeningOption.setShortcut("Ctrl+Shift+B")
+        broadeningOption.triggered.connect(self.editBroadening)
+
         optionsMenu.addAction(gridlineOptions)
         optionsMenu.addAction(maxPeaksOption)
+        importOption = QAction(QIcon("./src/img/edit-component.svg"), "&Import Settings", self)
+        importOption.setShortcut("Ctrl+Shift+I")
+        importOption.triggered.connect(self.editImportSettings)
+
+        optionsMenu.addAction(broadeningOption)
+        optionsMenu.addAction(importOption)
 
         # * ----------------------------------------------
 
@@ -520,13 +580,7 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         # Establishing source and destination directories
 
         # Creating a list of substances stored in the NRCA database data directory
-        self.spectraNames = [None]
-        for file in os.listdir(f"{self.graphDataDir}"):
-            filename = os.fsdecode(file)
-            if ".csv" not in filename[-4:]:
-                continue
-            filename = filename[:-4]
-            self.spectraNames.append(filename)
+        self.spectraNames = [None] + self.manifest.spectraNames
 
         # Creating combo box (drop down menu)
         self.combobox = ExtendedComboBox()
@@ -568,7 +622,7 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         self.plotEnergyBtn.resize(self.plotEnergyBtn.sizeHint())
         self.plotEnergyBtn.setEnabled(False)
         self.btnLayout.addWidget(self.plotEnergyBtn)
-        self.plotEnergyBtn.clicked.connect(self.updateGuiData)
+        self.plotEnergyBtn.clicked.connect(lambda: self.updateGuiData(background=True))
 
         self.plotTOFBtn = QPushButton("Plot in ToF", self)
         self.plotTOFBtn.setCursor(pointingCursor)
@@ -577,7 +631,7 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         self.plotTOFBtn.resize(self.plotTOFBtn.sizeHint())
         self.plotTOFBtn.setEnabled(False)
         self.btnLayout.addWidget(self.plotTOFBtn)
-        self.plotTOFBtn.clicked.connect(lambda: self.updateGuiData(tof=True))
+        self.plotTOFBtn.clicked.connect(lambda: self.updateGuiData(tof=True, background=True))
 
         self.clearBtn = QPushButton("Clear All", self)
         self.clearBtn.setObjectName("clearBtn")
@@ -599,6 +653,11 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
 
         sidebarLayout.addLayout(self.btnLayout)
 
+        self.loadingBar = QProgressBar(self)
+        self.loadingBar.setFormat("Loading %v of %m")
+        self.loadingBar.setVisible(False)
+        sidebarLayout.addWidget(self.loadingBar)
+
         # * ----------------------------------------------
 
         # ¦ --------------- Checkbox Group ---------------
@@ -664,6 +723,24 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
 
         # * -----------------------------------------------
 
+        # ¦ ----------- Resonance Search Group ------------
+
+        resonanceLayout = QVBoxLayout()
+        resonanceLayout.setSpacing(5)
+        resonanceLabel = QLabel(self, text="Resonance Search")
+        resonanceLabel.setObjectName("resonanceLabel")
+        self.resonanceSearch = QLineEdit(self)
+        self.resonanceSearch.setObjectName("resonanceSearch")
+        self.resonanceSearch.setPlaceholderText("Energy (eV), e.g. 6.67 or 6.6-6.8")
+        self.resonanceSearch.setClearButtonEnabled(True)
+        self.resonanceSearch.returnPressed.connect(self.searchResonances)
+        resonanceLayout.addWidget(resonanceLabel)
+        resonanceLayout.addWidget(self.resonanceSearch)
+
+        sidebarLayout.addLayout(resonanceLayout)
+
+        # * -----------------------------------------------
+
         # ¦ ----------- Compound Creater Group ------------
 
         compoundCreaterLayout = QVBoxLayout()
@@ -680,13 +757,7 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
             index=self.compoundCombobox.currentIndex(),
             comboboxName=self.compoundCombobox.objectName()
         ))
-        self.compoundNames = [None]
-        for file in os.listdir(f"{self.dir}data/Graph Data/Compound Data/"):
-            filename = os.fsdecode(file)
-            if ".csv" not in filename[-4:]:
-                continue
-            filename = filename[:-4]
-            self.compoundNames.append(filename)
+        self.compoundNames = [None] + self.manifest.compoundNames
         self.compoundCombobox.addItems(self.compoundNames)
         compoundCreaterLayout.addWidget(compoundLabel)
         compoundCreaterLayout.addWidget(compoundCreaterBtn)
@@ -697,7 +768,7 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         # * -----------------------------------------------
 
         # ¦ ----------------- Plot Canvas -----------------
-        self.figure = plt.figure()  # Creating canvas to plot graph on and toolbar
+        self.figure = Figure()  # Creating canvas to plot graph on and toolbar
         self.canvas = FigureCanvas(self.figure, self)
 
         self.canvas.__name__ = "canvas"
@@ -750,6 +821,21 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         self.setLayout(mainLayout)  # Generating layout
         self.show()
 
+    def onFirstPaint(self) -> None:
+        """
+        ``onFirstPaint``
+        ----------------
+        Called once the event loop has shown the window, records the time to the first paint and imports the
+        ``deferredModules`` on a background thread so the first plot does not wait on them.
+        """
+        self.startupTimes["first paint"] = time.perf_counter() - self.firstPaintStart
+        self.startupFinished.emit()
+
+        def importDeferred():
+            for module in deferredModules:
+                __import__(module)
+        threading.Thread(target=importDeferred, name="deferredImports", daemon=True).start()
+
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         """
         ``resizeEvent``
@@ -804,7 +890,7 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         for url in event.mimeData().urls():
             filepath = url.toLocalFile()
             name = filepath.split('/')[-1].split('.')[0]
-            self.updateGuiData(False, filepath, True, name)
+            self.updateGuiData(False, filepath, True, name, background=True)
 
     def editPeakLimits(self) -> None:
         """
@@ -1283,7 +1369,7 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
 
                 for line in self.ax.lines:
                     if f"{spectra.name}-{'ToF'}" == line.get_label():
-                        line.set_xdata(spectra.graphData[0])
+                        line.setSeries(spectra.graphArray.x, self.getPlotY(spectra))
                         break
 
             self.canvas.draw()
@@ -1292,6 +1378,308 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         optionsWindow.setModal(False)
         optionsWindow.show()
 
+    def editBroadening(self) -> None:
+        """
+        ``editBroadening``
+        ------------------
+        Opens a dialog setting the time of flight resolution and sample temperature by which plotted library spectra
+        are broadened, redrawing each. Only the plotted lines are broadened, the peaks are those of the point-wise
+        cross-sections.
+        """
+        optionsWindow = QDialog(self)
+        optionsWindow.setObjectName("inputWindow")
+        mainLayout = QVBoxLayout()
+        inputForm = QFormLayout()
+
+        buttonBox = QDialogButtonBox(optionsWindow)
+        applyBtn = buttonBox.addButton(QDialogButtonBox.StandardButton.Apply)
+        resetBtn = buttonBox.addButton(QDialogButtonBox.StandardButton.Reset)
+        cancelBtn = buttonBox.addButton(QDialogButtonBox.StandardButton.Cancel)
+
+        mainLayout.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
+        optionsWindow.setWindowTitle("Resolution Broadening")
+        optionsWindow.setLayout(mainLayout)
+
+        lineEdits = {}
+        for key, label in [("timeResolution", "Time Resolution (uS):"),
+                           ("lengthResolution", "Length Resolution (m):"),
+                           ("temperature", "Temperature (K):")]:
+            lineEdit = QLineEdit()
+            lineEdit.setValidator(QRegExpValidator(QRegExp("([0-9]*[.])?[0-9]+")))
+            lineEdit.setText(f"{self.broadening[key]:g}")
+            inputForm.addRow(QLabel(label), lineEdit)
+            lineEdits[key] = lineEdit
+
+        mainLayout.addLayout(inputForm)
+        mainLayout.addWidget(buttonBox)
+
+        def onCancel():
+            optionsWindow.close()
+        cancelBtn.clicked.connect(onCancel)
+
+        def onAccept():
+            self.broadening = {key: float(lineEdit.text() or 0) for key, lineEdit in lineEdits.items()}
+            for spectra in self.spectraData.values():
+                label = f"{spectra.name}-ToF" if spectra.isToF else f"{spectra.name}-Energy"
+                for line in self.ax.lines:
+                    if line.get_label() == label:
+                        line.setSeries(spectra.graphArray.x, self.getPlotY(spectra))
+                        break
+            self.canvas.draw_idle()
+        applyBtn.clicked.connect(onAccept)
+
+        def onReset():
+            for lineEdit in lineEdits.values():
+                lineEdit.setText("0")
+            onAccept()
+        resetBtn.clicked.connect(onReset)
+
+        optionsWindow.setModal(False)
+        optionsWindow.show()
+
+    def editImportSettings(self) -> None:
+        """
+        ``editImportSettings``
+        ----------------------
+        Opens a dialog setting the resolution imported files are rebinned to as they are read, so that files too large
+        to plot point by point can still be imported. A width of 0 imports every point, event lists always being
+        histogrammed.
+        """
+        optionsWindow = QDialog(self)
+        optionsWindow.setObjectName("inputWindow")
+        mainLayout = QVBoxLayout()
+        inputForm = QFormLayout()
+
+        buttonBox = QDialogButtonBox(optionsWindow)
+        applyBtn = buttonBox.addButton(QDialogButtonBox.StandardButton.Apply)
+        cancelBtn = buttonBox.addButton(QDialogButtonBox.StandardButton.Cancel)
+
+        mainLayout.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
+        optionsWindow.setWindowTitle("Import Settings")
+        optionsWindow.setLayout(mainLayout)
+
+        lineEditWidth = QLineEdit()
+        lineEditWidth.setValidator(QRegExpValidator(QRegExp("([0-9]*[.])?[0-9]+([eE][-]?[0-9]+)?")))
+        lineEditWidth.setText(f"{self.importRebin['binWidth']:g}")
+        relativeCheck = QCheckBox("Relative to x (dx/x)")
+        relativeCheck.setChecked(self.importRebin["relative"])
+
+        inputForm.addRow(QLabel("Rebin Width:"), lineEditWidth)
+        inputForm.addRow(QLabel(""), relativeCheck)
+
+        mainLayout.addLayout(inputForm)
+        mainLayout.addWidget(buttonBox)
+
+        def onCancel():
+            optionsWindow.close()
+        cancelBtn.clicked.connect(onCancel)
+
+        def onAccept():
+            try:
+                binWidth = float(lineEditWidth.text() or 0)
+            except ValueError:
+                QMessageBox.warning(self, "Error", f"Invalid rebin width {lineEditWidth.text()}")
+                return
+            self.importRebin = {"binWidth": binWidth, "relative": relativeCheck.isChecked()}
+            optionsWindow.close()
+        applyBtn.clicked.connect(onAccept)
+
+        optionsWindow.setModal(False)
+        optionsWindow.show()
+
+    def getPlotY(self, spectraData: SpectraData) -> np.ndarray:
+        """
+        ``getPlotY``
+        ------------
+
+        Args:
+            - ``spectraData`` (SpectraData): Spectra to plot.
+
+        Returns:
+            ndarray: y-coords of the spectra to plot, broadened by ``broadening`` unless it is imported.
+        """
+        if spectraData.isImported or not any(self.broadening.values()):
+            return spectraData.graphArray.y
+        try:
+            return spectraData.getBroadened(**self.broadening)
+        except ValueError as error:
+            QMessageBox.warning(self, "Error", str(error))
+            return spectraData.graphArray.y
+
+    def fitSpectraComposition(self) -> None:
+        """
+        ``fitSpectraComposition``
+        -------------------------
+        Opens a dialog to fit a plotted spectra, normally an imported sample, as a weighted sum of the spectra of
+        candidate elements or their isotopes, see ``fitComposition``. The fitted weights are displayed in the table,
+        double clicking one selects its spectrum.
+        """
+        if self.spectraData == {}:
+            QMessageBox.warning(self, "Error", "You have not plotted anything")
+            return
+
+        optionsWindow = InputElementsDialog(self, self.styleSheet())
+        elements = optionsWindow.elements
+        elements.addItems(self.spectraData.keys())
+
+        inputCandidates = QLineEdit()
+        inputCandidates.setPlaceholderText("e.g. Cu, Cd, Au")
+        inputMode = QComboBox()
+        inputMode.addItems(["n-g", "n-tot"])
+        inputWindow = QLineEdit()
+        inputWindow.setPlaceholderText("All, e.g. 1-100")
+        isotopesCheck = QCheckBox()
+
+        optionsWindow.inputForm.addRow(QLabel("Elements:"), inputCandidates)
+        optionsWindow.inputForm.addRow(QLabel("Mode:"), inputMode)
+        optionsWindow.inputForm.addRow(QLabel("Window (eV):"), inputWindow)
+        optionsWindow.inputForm.addRow(QLabel("Fit Isotopes:"), isotopesCheck)
+
+        applyBtn = optionsWindow.buttonBox.addButton(QDialogButtonBox.StandardButton.Apply)
+        cancelBtn = optionsWindow.buttonBox.addButton(QDialogButtonBox.StandardButton.Cancel)
+        applyBtn.setEnabled(False)
+
+        optionsWindow.setWindowTitle("Fit Composition")
+        optionsWindow.mainLayout.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
+        optionsWindow.mainLayout.insertItem(1, optionsWindow.inputForm)
+        optionsWindow.setLayout(optionsWindow.mainLayout)
+
+        def onElementChange():
+            mode = elements.currentText().rsplit('-', 1)[0].rpartition('_')[2]
+            if mode in ["n-g", "n-tot"]:
+                inputMode.setCurrentText(mode)
+        elements.currentIndexChanged.connect(onElementChange)
+        onElementChange()
+
+        inputCandidates.textChanged.connect(lambda: applyBtn.setEnabled(inputCandidates.text().strip() != ''))
+        cancelBtn.clicked.connect(optionsWindow.close)
+
+        def onAccept():
+            # Imported on first use, scipy.optimize being slow to import and only needed to fit a composition.
+            from element.CompositionFit import fitComposition, getCandidateSpectra
+
+            spectra = self.spectraData[elements.currentText()]
+            try:
+                window = parseEnergyQuery(inputWindow.text()) if inputWindow.text().strip() != '' else None
+                candidates = getCandidateSpectra([element for element in inputCandidates.text().split(',')
+                                                  if element.strip() != ''],
+                                                 inputMode.currentText(),
+                                                 isotopesCheck.isChecked())
+                graphArray = spectra.energyGraphArray
+                fit = fitComposition(graphArray.x, graphArray.y, candidates, window)
+            except (ValueError, pd.errors.EmptyDataError) as error:
+                QMessageBox.warning(self, "Error", str(error))
+                return
+            self.showResonances(fit.toDataFrame(), f"Composition fit, RMS residual: {fit.residual:.4g}")
+        applyBtn.clicked.connect(onAccept)
+
+        inputCandidates.setFocus()
+        optionsWindow.setModal(False)
+        optionsWindow.show()
+
+    def modelTransmission(self) -> None:
+        """
+        ``modelTransmission``
+        ---------------------
+        Opens a dialog overlaying the transmission or capture yield of a plotted spectra's isotope, element or compound
+        for one or more areal densities, e.g. to compare against imported measurements. The slider sweeps a single
+        areal density, redrawing as it moves.
+        """
+        if self.spectraData == {}:
+            QMessageBox.warning(self, "Error", "You have not plotted anything")
+            return
+
+        optionsWindow = InputElementsDialog(self, self.styleSheet())
+        elements = optionsWindow.elements
+        elements.addItems([title for title, spectra in self.spectraData.items() if not spectra.isImported])
+
+        inputQuantity = QComboBox()
+        inputQuantity.addItems(["Transmission", "Capture Yield"])
+        inputDensity = QLineEdit()
+        inputDensity.setPlaceholderText("atoms/b, e.g. 0.001, 0.01")
+        # Log10 of the areal density, in twentieths.
+        densitySlider = QSlider(Qt.Orientation.Horizontal)
+        densitySlider.setRange(-120, 0)
+        densitySlider.setValue(-60)
+
+        optionsWindow.inputForm.addRow(QLabel("Model:"), inputQuantity)
+        optionsWindow.inputForm.addRow(QLabel("Areal Density:"), inputDensity)
+        optionsWindow.inputForm.addRow(QLabel("Sweep:"), densitySlider)
+
+        applyBtn = optionsWindow.buttonBox.addButton(QDialogButtonBox.StandardButton.Apply)
+        resetBtn = optionsWindow.buttonBox.addButton(QDialogButtonBox.StandardButton.Reset)
+        cancelBtn = optionsWindow.buttonBox.addButton(QDialogButtonBox.StandardButton.Cancel)
+        applyBtn.setEnabled(False)
+
+        optionsWindow.setWindowTitle("Model Transmission")
+        optionsWindow.mainLayout.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
+        optionsWindow.mainLayout.insertItem(1, optionsWindow.inputForm)
+        optionsWindow.setLayout(optionsWindow.mainLayout)
+
+        def removeModel():
+            for line in self.modelLines:
+                if line.axes is not None and line in line.axes.lines:
+                    line.remove()
+            self.modelLines = []
+
+        def drawModel():
+            if elements.currentText() not in self.spectraData:
+                return
+            spectra = self.spectraData[elements.currentText()]
+            try:
+                densities = [float(density) for density in inputDensity.text().split(',') if density.strip() != '']
+                total = spectra.getCrossSection("n-tot")
+                if inputQuantity.currentText() == "Transmission":
+                    y = transmission(total, densities)
+                else:
+                    y = captureYield(total, spectra.getCrossSection("n-g"), densities)
+            except (ValueError, FileNotFoundError, pd.errors.EmptyDataError) as error:
+                QMessageBox.warning(self, "Error", str(error))
+                return
+            x = spectra.energyGraphArray.x
+            if spectra.isToF:
+                # The time of flight axis is the reversed energy axis.
+                x, y = spectra.graphArray.x, y[:, ::-1]
+
+            # The view is kept, the model reaching far smaller values than the cross-sections plotted.
+            xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
+            # Labels starting with an underscore are left out of the legend.
+            labels = [f"_{spectra.name} {inputQuantity.currentText()} {density:g}" for density in densities]
+            if len(self.modelLines) != len(densities) or any(line.axes is not self.ax for line in self.modelLines):
+                removeModel()
+                self.modelLines = [DecimatedLine.plot(self.ax, x, row,
+                                                      linestyle="--",
+                                                      color=spectra.graphColour,
+                                                      linewidth=0.8,
+                                                      label=label)
+                                   for row, label in zip(y, labels)]
+            else:
+                for line, row, label in zip(self.modelLines, y, labels):
+                    line.setSeries(x, row)
+                    line.set_color(spectra.graphColour)
+                    line.set_label(label)
+            self.ax.set_xlim(xlim)
+            self.ax.set_ylim(ylim)
+            self.canvas.draw_idle()
+
+        def onSweep(value):
+            inputDensity.setText(f"{10 ** (value / 20):.3g}")
+            drawModel()
+        densitySlider.valueChanged.connect(onSweep)
+
+        def onReset():
+            removeModel()
+            self.canvas.draw_idle()
+        resetBtn.clicked.connect(onReset)
+
+        inputDensity.textChanged.connect(lambda: applyBtn.setEnabled(inputDensity.text().strip() != ''))
+        applyBtn.clicked.connect(drawModel)
+        cancelBtn.clicked.connect(optionsWindow.close)
+
+        inputDensity.setFocus()
+        optionsWindow.setModal(False)
+        optionsWindow.show()
+
     def gridLineOptions(self):
         """
         ``gridLineOptions``
@@ -1510,17 +1898,14 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
             }
             name = f"""compound_{'-'.join([f'{name.split("-", 1)[1].split("_")[0]}[{str(dist)}]'
                                            for name, dist in compoundDist.items()])}_{compoundMode[0]}"""
-            weightedGraphData = {name: pd.read_csv(f"{self.graphDataDir}{name}.csv",
-                                                   names=['x', 'y'],
-                                                   header=None) * [1, dist]
-                                 for name, dist in compoundDist.items() if dist != 0}
+            weights = {name: dist for name, dist in compoundDist.items() if dist != 0}
             newElement = SpectraData(name, None, None, None, None, None, None, None, True)
-            newElement.setGraphDataFromDist(weightedGraphData.values())
-            newElement.graphData.to_csv(f"{self.graphDataDir}Compound Data\\{name}.csv",
+            newElement.graphData = getIsotopeBasis(list(weights.keys())).combine(weights)
+            newElement.graphData.to_csv(f"{self.graphDataDir}Compound Data/{name}.csv",
                                         index=False,
                                         header=False)
             pd.DataFrame(compoundDist.items()).to_csv(
-                f"{self.dir}data\\Distribution Information\\{name}.csv", index=False, header=False)
+                f"{self.dir}data/Distribution Information/{name}.csv", index=False, header=False)
 
             self.compoundNames.append(name)
             self.compoundCombobox.clear()
@@ -1820,11 +2205,90 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
                 self.table.setSortingEnabled(True)
 
             elif combobox.currentText() in substanceNames:
+                if combobox.currentText() != self.selectionName:
+                    # Spectra still loading for the previous selection are no longer wanted.
+                    self.removePlottedSpectra(self.spectraLoader.cancel())
                 self.selectionName = combobox.currentText()
                 self.displayData()
         except AttributeError:
             self.table.setModel(None)
 
+    def searchResonances(self) -> None:
+        """
+        ``searchResonances``
+        --------------------
+        Displays the peaks of every isotope within the energy range searched for in the table, nearest the centre of
+        the range first. Double clicking a result selects its spectrum.
+        """
+        text = self.resonanceSearch.text()
+        if text.strip() == "":
+            return
+        try:
+            low, high = parseEnergyQuery(text)
+        except ValueError as error:
+            QMessageBox.warning(self, "Error", str(error))
+            return
+        resonanceIndex = getResonanceIndex()
+        peaks = resonanceIndex.queryNearest(low, high)
+        self.showResonances(resonanceIndex.toDataFrame(peaks), f"Resonances found: {len(peaks)}")
+
+    def matchImportedPeaks(self, spectra: SpectraData) -> None:
+        """
+        ``matchImportedPeaks``
+        ----------------------
+        Displays the isotopes whose resonances best match the peaks of an imported spectra in the table, best first.
+        Double clicking a candidate selects its spectrum.
+
+        Args:
+            - ``spectra`` (SpectraData): The imported spectra.
+        """
+        if spectra.maxima is None or spectra.maxima[0].size == 0:
+            return
+        candidates = getResonanceIndex().match(spectra.maxima[0], tof=spectra.isToF)
+        self.showResonances(candidates, f"Candidate isotopes: {candidates.shape[0]}")
+
+    def showResonances(self, resonances: pd.DataFrame, label: str) -> None:
+        """
+        ``showResonances``
+        ------------------
+        Displays a table of isotopes in place of the peak information, see ``selectResonance``.
+
+        Args:
+            - ``resonances`` (DataFrame): Table with the isotope and mode of each row in its first two columns.
+
+            - ``label`` (str): Text of the label above the table.
+        """
+        try:
+            for row in self.table_model.titleRows:
+                self.table.setItemDelegateForRow(row, None)
+        except AttributeError:
+            pass
+        self.resonanceModel = ExtendedQTableModel(resonances)
+        self.table.setSortingEnabled(False)
+        self.table.clearSpans()
+        self.table.setModel(self.resonanceModel)
+        self.peaklabel.setText(label)
+
+    def selectResonance(self, index: QModelIndex) -> None:
+        """
+        ``selectResonance``
+        -------------------
+        Selects the spectrum of a resonance search result or candidate isotope.
+
+        Args:
+            - ``index`` (QModelIndex): Index of the selected cell of the results.
+        """
+        isotope, mode = (self.resonanceModel.data(self.resonanceModel.index(index.row(), column),
+                                                  Qt.ItemDataRole.DisplayRole) for column in [0, 1])
+        name = f"{isotope}_{mode}"
+        if name not in self.spectraNames:
+            return
+        comboboxIndex = self.spectraNames.index(name)
+        if self.combobox.currentIndex() == comboboxIndex:
+            self.plotSelectionProxy(index=comboboxIndex, comboboxName=self.combobox.objectName())
+        else:
+            self.combobox.setCurrentIndex(comboboxIndex)
+
     def displayData(self) -> None:
         """
         ``displayData``
@@ -1865,7 +2329,7 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
 
         else:
             labelInfo = (
-                "Threshold for peak detection (n-tot mode, n-g mode): " + f"({self.threshold[0]},{self.threshold[1]})"
+                f"Threshold for peak detection (n-tot mode, n-g mode): ({self.threshold[0]:g},{self.threshold[1]:g})"
             )
             if self.selectionName[-1] == 't':
                 self.threshold = self.thresholds[dataSymbol][0]
@@ -1886,10 +2350,11 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         peakInfoDir = self.dir + "data/Peak information/"
 
         filepath = None
-        for file in os.listdir(peakInfoDir):
-            if self.selectionName == file.split(".")[0]:
-                filepath = peakInfoDir + file
-                break
+        if self.store is None:
+            for file in os.listdir(peakInfoDir):
+                if self.selectionName == file.split(".")[0]:
+                    filepath = peakInfoDir + file
+                    break
         try:
             for row in self.table_model.titleRows:
                 self.table.setItemDelegateForRow(row, None)
@@ -1897,7 +2362,12 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
             pass
         try:
             self.table.blockSignals(True)
-            file = pd.read_csv(filepath, header=0)
+            if self.store is None:
+                file = pd.read_csv(filepath, header=0)
+            else:
+                file = self.store.getPeakInformation(self.selectionName)
+                if file is None:
+                    raise ValueError(f"No peak information for {self.selectionName}")
             # Reset any changes to spans before displaying selection data.
             self.table.clearSpans()
 
@@ -1969,7 +2439,7 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         self.table.blockSignals(False)
 
     def updateGuiData(self, tof: bool = False, filepath: str = None, imported: bool = False, name: str = None,
-                      distAltered: bool = False) -> None:
+                      distAltered: bool = False, background: bool = False) -> None:
         """
         ``updateGuiData``
         -----------------
@@ -1987,6 +2457,9 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
             - ``distAltered`` (bool, optional): Whether or not the function is plotted for altered isotope
             distributions. Defaults to False.
 
+            - ``background`` (bool, optional): Whether to load new spectra on the worker thread of
+            ``spectraLoader``, plotting them once loaded. Defaults to False.
+
         """
 
         # Enable Checkboxes on plotting graphs
@@ -2011,6 +2484,7 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         # # Finds the mode for L0 (length) parameter
 
         self.titleRows = [0]
+        newSpectra = None
         for (element, tof) in self.plottedSpectra:
             title = f"{element}-{'ToF' if tof else 'Energy'}"
             # ¦ -----------------------------------
@@ -2018,71 +2492,307 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
             if title in self.spectraData.keys():
                 if self.spectraData[title].isGraphDrawn:
                     continue
-            if self.isCompound:
-                self.plotFilepath = f"{self.graphDataDir}Compound Data\\{element}.csv"
-            else:
-                self.plotFilepath = f"{self.graphDataDir}{element}.csv" if filepath is None else filepath
-            peakInfoDir = f"{self.dir}data\\Peak information\\" if filepath is None else None
+            if self.spectraLoader.isLoading(title):
+                continue
 
+            if self.spectraData.get(title, False):
+                for point in self.spectraData[title].annotations:
+                    point.remove()
+
+            previousSpectra = self.spectraData.get(title, None)
+            isReweighted = distAltered and previousSpectra is not None and previousSpectra.isDistAltered
+            if isReweighted and previousSpectra.threshold == float(self.threshold or 100):
+                # Re-editing a distribution only updates the parts of the spectrum which changed.
+                previousSpectra.updateDistribution(self.elementDistributions[element])
+                previousSpectra.annotations = []
+                newSpectra = previousSpectra
+                continue
+
+            distributions = self.elementDistributions.get(element, None)
+            threshold = float(self.threshold or 100)
+            counterpart = self.spectraData.get(f"{element}-{'Energy' if tof else 'ToF'}", None)
+            if counterpart is not None and not imported and counterpart.distributions == distributions and \
+                    counterpart.threshold == threshold:
+                # The energy and ToF views of a spectrum share its graph data and analysis.
+                newSpectra = counterpart.asView(tof, getRandomColor(), self.peakLabelCheck.isChecked())
+                self.spectraData[title] = newSpectra
+                continue
+
+            compoundGraphData = None
+            if self.spectraData.get(element, False) and element in self.compoundData:
+                # A compound whose csv is missing is restored from memory, writing it here on the GUI thread.
+                compoundGraphData = self.compoundData[element].graphData.copy()
+                plotFilepath = self.getPlotFilepath(element, filepath, self.isCompound)
+                if not os.path.exists(plotFilepath):
+                    self.spectraData[element].graphData.to_csv(plotFilepath, index=False, header=False)
+
+            # Everything read from the GUI is captured here, the spectra itself may be loaded on the worker thread.
+            load = partial(self.loadSpectra,
+                           element=element,
+                           tof=tof,
+                           filepath=filepath,
+                           imported=imported,
+                           isCompound=self.isCompound,
+                           numPeaks=self.numRows,
+                           graphColour=getRandomColor(),
+                           distributions=deepcopy(distributions),
+                           defaultDist=self.defaultDistributions.get(element, None),
+                           isAnnotationsHidden=self.peakLabelCheck.isChecked(),
+                           threshold=threshold,
+                           compoundGraphData=compoundGraphData)
+            if imported:
+                load = partial(load, rebin=deepcopy(self.importRebin),
+                               progress=partial(self.spectraLoader.reportProgress, title) if background else None)
+            if background:
+                self.spectraLoader.submit(title, load)
+                newSpectra = None
+                continue
             try:
-                graphData = pd.read_csv(self.plotFilepath, header=None).iloc[:, :2]
-
-            except pd.errors.EmptyDataError:
-                QMessageBox.warning(self, "Warning", "Selection has Empty Graph Data")
-                self.plottedSpectra.remove((self.selectionName, tof))
-                if self.plotCount == -1:
-                    self.toggleCheckboxControls(enableAll=False)
-                    self.toggleBtnControls(plotEnergyBtn=True, plotToFBtn=True, clearBtn=True, pdBtn=False)
+                newSpectra = load()
+            except (pd.errors.EmptyDataError, FileNotFoundError, ValueError) as error:
+                self.onSpectraFailed(title, error)
                 return
-            except FileNotFoundError:
-                if self.spectraData.get(element, False):
-                    self.spectraData[element].graphData.to_csv(self.plotFilepath, index=False, header=False)
-                    graphData = self.compoundData[element].graphData
 
-            try:
-                elementTableData = pd.read_csv(f"{peakInfoDir}{element}.csv")
-            except FileNotFoundError:
-                elementTableData = pd.DataFrame(
-                    columns=[
-                        "Rank by Integral",
-                        "Energy (eV)",
-                        "Rank by Energy",
-                        "TOF (us)",
-                        "Integral",
-                        "Peak Width",
-                        "Rank by Peak Width",
-                        "Peak Height",
-                        "Rank by Peak Height",
-                        "Relevant Isotope"
-                    ])
-            # Title Rows
-            if elementTableData.empty:
-                elementTableData.loc[-1] = [f"No Peak Data for {element}", *[""] * 9]
+            self.spectraData[title] = newSpectra
+
+        if newSpectra is not None:
+            self.drawSpectra(newSpectra, distAltered, filepath, imported, name)
+
+    def getPlotFilepath(self, element: str, filepath: str, isCompound: bool) -> str:
+        """
+        ``getPlotFilepath``
+        -------------------
+
+        Args:
+            - ``element`` (str): Name of the selection.
+
+            - ``filepath`` (str): Filepath of imported spectra, None otherwise.
+
+            - ``isCompound`` (bool): Whether the selection is a compound.
+
+        Returns:
+            str: Filepath of the graph data of the selection.
+        """
+        if isCompound:
+            return f"{self.graphDataDir}Compound Data/{element}.csv"
+        return f"{self.graphDataDir}{element}.csv" if filepath is None else filepath
+
+    def loadSpectra(self, element: str, tof: bool, filepath: str, imported: bool, isCompound: bool, numPeaks: int,
+                    graphColour: tuple, distributions: dict, defaultDist: dict, isAnnotationsHidden: bool,
+                    threshold: float, rebin: dict = None, progress: Callable[[float], None] = None,
+                    compoundGraphData: pd.DataFrame = None) -> SpectraData:
+        """
+        ``loadSpectra``
+        ---------------
+        Reads the graph data and peak information of a selection and analyses it into a SpectraData. Only reads
+        the GUI's directories and spectra store, so it may be run on the worker thread of ``spectraLoader``.
+
+        Args:
+            - ``element`` (str): Name of the selection.
+
+            - ``tof`` (bool): Whether to graph for tof or not.
+
+            - ``filepath`` (str): Filepath of imported spectra, None otherwise.
+
+            - ``imported`` (bool): Whether the selection is imported.
 
+            - ``isCompound`` (bool): Whether the selection is a compound.
+
+            - ``numPeaks`` (int): Number of peaks to display.
+
+            - ``graphColour`` (tuple): Colour of the graph.
+
+            - ``distributions`` (dict): Isotopic distributions of the selection.
+
+            - ``defaultDist`` (dict): Natural abundances of the selection.
+
+            - ``isAnnotationsHidden`` (bool): Whether peak annotations are hidden.
+
+            - ``threshold`` (float): Threshold for peak detection.
+
+            - ``rebin`` (dict, optional): 'binWidth' and 'relative' of ``readMeasuredData`` to rebin an imported file
+            by, a width of 0 not rebinning it. Defaults to None.
+
+            - ``progress`` (Callable[[float], None], optional): Called with the fraction of an imported file read.
+            Defaults to None.
+
+            - ``compoundGraphData`` (pd.DataFrame, optional): Graph data of a compound held in memory, used if its
+            file cannot be read. Defaults to None.
+
+        Raises:
+            pd.errors.EmptyDataError: The selection has no graph data.
+            ValueError: An imported file is not numeric.
+
+        Returns:
+            SpectraData: The analysed spectra.
+        """
+        plotFilepath = self.getPlotFilepath(element, filepath, isCompound)
+        peakInfoDir = f"{self.dir}data/Peak information/" if filepath is None else None
+
+        try:
+            if filepath is None and not isCompound and self.store is not None and element in self.store:
+                graphData = self.store.getGraphData(element)
+                if graphData.empty:
+                    raise pd.errors.EmptyDataError(f"No graph data for {element}")
+            elif imported:
+                # Imported files may be far larger than the library, so are streamed and optionally rebinned.
+                rebin = rebin or {}
+                graphData = pd.DataFrame(readMeasuredData(plotFilepath,
+                                                          binWidth=rebin.get("binWidth", 0) or None,
+                                                          relative=rebin.get("relative", False),
+                                                          progress=progress).T, copy=False)
             else:
-                elementTableData.loc[-1] = [element, *[""] * 9]
-            elementTableData.index += 1
-            elementTableData.sort_index(inplace=True)
+                graphData = loadGraphData(plotFilepath)
+        except FileNotFoundError:
+            if compoundGraphData is None:
+                raise
+            graphData = compoundGraphData
 
-            if self.spectraData.get(title, False):
-                for point in self.spectraData[title].annotations:
-                    point.remove()
+        try:
+            if peakInfoDir is not None and self.store is not None:
+                elementTableData = self.store.getPeakInformation(element)
+                if elementTableData is None:
+                    raise FileNotFoundError(f"No peak information for {element}")
+            else:
+                elementTableData = pd.read_csv(f"{peakInfoDir}{element}.csv")
+        except FileNotFoundError:
+            elementTableData = pd.DataFrame(
+                columns=[
+                    "Rank by Integral",
+                    "Energy (eV)",
+                    "Rank by Energy",
+                    "TOF (us)",
+                    "Integral",
+                    "Peak Width",
+                    "Rank by Peak Width",
+                    "Peak Height",
+                    "Rank by Peak Height",
+                    "Relevant Isotope"
+                ])
+        # Title Rows
+        if elementTableData.empty:
+            elementTableData.loc[-1] = [f"No Peak Data for {element}", *[""] * 9]
 
-            newSpectra = SpectraData(name=element,
-                                     numPeaks=self.numRows,
-                                     tableData=elementTableData,
-                                     graphData=graphData,
-                                     graphColour=getRandomColor(),
-                                     isToF=tof,
-                                     distributions=self.elementDistributions.get(element, None),
-                                     defaultDist=self.defaultDistributions.get(element, None),
-                                     isCompound=self.isCompound,
-                                     isAnnotationsHidden=self.peakLabelCheck.isChecked(),
-                                     threshold=float(self.threshold or 100),
-                                     isImported=imported)
+        else:
+            elementTableData.loc[-1] = [element, *[""] * 9]
+        elementTableData.index += 1
+        elementTableData.sort_index(inplace=True)
+
+        return SpectraData(name=element,
+                           numPeaks=numPeaks,
+                           tableData=elementTableData,
+                           graphData=graphData,
+                           graphColour=graphColour,
+                           isToF=tof,
+                           distributions=distributions,
+                           defaultDist=defaultDist,
+                           isCompound=isCompound,
+                           isAnnotationsHidden=isAnnotationsHidden,
+                           threshold=threshold,
+                           isImported=imported)
+
+    def onSpectraLoaded(self, title: str, newSpectra: SpectraData) -> None:
+        """
+        ``onSpectraLoaded``
+        -------------------
+        Plots a spectra loaded by ``spectraLoader``.
 
-            self.spectraData[title] = newSpectra
+        Args:
+            - ``title`` (str): Title of the spectra, e.g. '29-Cu-63_n-g-Energy'.
+
+            - ``newSpectra`` (SpectraData): The loaded spectra.
+        """
+        self.spectraData[title] = newSpectra
+        self.drawSpectra(newSpectra, imported=newSpectra.isImported,
+                         name=newSpectra.name if newSpectra.isImported else None)
+
+    def onSpectraFailed(self, title: str, error: Exception) -> None:
+        """
+        ``onSpectraFailed``
+        -------------------
+        Removes a spectra which could not be loaded from those plotted, warning the user.
+
+        Args:
+            - ``title`` (str): Title of the spectra, e.g. '29-Cu-63_n-g-Energy'.
+
+            - ``error`` (Exception): The exception raised while loading.
+        """
+        self.removePlottedSpectra([title])
+        if isinstance(error, pd.errors.EmptyDataError):
+            QMessageBox.warning(self, "Warning", "Selection has Empty Graph Data")
+        else:
+            QMessageBox.warning(self, "Error", f"Could not load {title}: {error}")
+        if self.plotCount == -1:
+            self.toggleCheckboxControls(enableAll=False)
+            self.toggleBtnControls(plotEnergyBtn=True, plotToFBtn=True, clearBtn=True, pdBtn=False)
+
+    def onLoadingProgress(self, done: int, total: int) -> None:
+        """
+        ``onLoadingProgress``
+        ---------------------
+        Shows the progress of ``spectraLoader``, hiding the progress bar once every spectra has loaded.
 
+        Args:
+            - ``done`` (int): Number of spectra loaded.
+
+            - ``total`` (int): Number of spectra queued since the loader was last idle.
+        """
+        self.loadingBar.setFormat("Loading %v of %m")
+        self.loadingBar.setVisible(total > 0)
+        self.loadingBar.setRange(0, max(total, 1))
+        self.loadingBar.setValue(done)
+
+    def onImportProgress(self, title: str, fraction: float) -> None:
+        """
+        ``onImportProgress``
+        --------------------
+        Shows how much of an imported file ``spectraLoader`` has read, until it has loaded.
+
+        Args:
+            - ``title`` (str): Title of the spectra, e.g. 'sample-Energy'.
+
+            - ``fraction`` (float): Fraction of the file read.
+        """
+        if not self.spectraLoader.isLoading(title):
+            return
+        self.loadingBar.setFormat(f"Importing {title} %p%")
+        self.loadingBar.setVisible(True)
+        self.loadingBar.setRange(0, 100)
+        self.loadingBar.setValue(int(fraction * 100))
+
+    def removePlottedSpectra(self, titles: list[str]) -> None:
+        """
+        ``removePlottedSpectra``
+        ------------------------
+        Removes spectra which were not plotted, e.g. as loading failed or was cancelled, so they can be plotted again.
+
+        Args:
+            - ``titles`` (list[str]): Titles of the spectra, e.g. '29-Cu-63_n-g-Energy'.
+        """
+        for title in titles:
+            element, plotType = title.rsplit('-', 1)
+            if (element, plotType == 'ToF') in self.plottedSpectra:
+                self.plottedSpectra.remove((element, plotType == 'ToF'))
+
+    def drawSpectra(self, newSpectra: SpectraData, distAltered: bool = False, filepath: str = None,
+                    imported: bool = False, name: str = None) -> None:
+        """
+        ``drawSpectra``
+        ---------------
+        Plots a new or updated spectra, redrawing its peak detection plot and updating the table.
+
+        Args:
+            - ``newSpectra`` (SpectraData): The spectra to draw.
+
+            - ``distAltered`` (bool, optional): Whether the spectra replaces one drawn with another isotopic
+            distribution. Defaults to False.
+
+            - ``filepath`` (str, optional): Filepath of imported spectra. Defaults to None.
+
+            - ``imported`` (bool, optional): Whether the data has been imported. Defaults to False.
+
+            - ``name`` (str, optional): The name of the imported spectra. Defaults to None.
+        """
         redrawMax = False
         redrawMin = False
         if distAltered:
@@ -2101,14 +2811,14 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
             except AttributeError:
                 pass
 
-        distAltered = False
-
         self.plot(newSpectra, filepath, imported, name)
         if redrawMax:
             self.plottingPD(newSpectra, True)
         if redrawMin:
             self.plottingPD(newSpectra, False)
         self.addTableData()
+        if imported:
+            self.matchImportedPeaks(newSpectra)
 
         self.canvas.draw()
 
@@ -2140,7 +2850,6 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
             self.ax.set_yscale("log")
             self.ax.set_xscale("log")
             self.ax.minorticks_on()
-            plt.minorticks_on()
             self.ax.xaxis.set_minor_locator(LogLocator(10, 'all'))
             self.ax.xaxis.set_minor_formatter(LogFormatter(10, False, (np.inf, np.inf)))
             self.ax.xaxis.set_tick_params('minor',
@@ -2179,14 +2888,15 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
 
         label = f"{spectraData.name}-ToF" if spectraData.isToF else f"{spectraData.name}-Energy"
 
-        if not spectraData.graphData.empty:
+        if not spectraData.graphArray.empty:
             # if not spectraData.isGraphUpdating:
 
-            self.ax.plot(
-                spectraData.graphData.iloc[:, 0],
-                spectraData.graphData.iloc[:, 1],
-                "-",
-                c=spectraData.graphColour,
+            DecimatedLine.plot(
+                self.ax,
+                spectraData.graphArray.x,
+                self.getPlotY(spectraData),
+                linestyle="-",
+                color=spectraData.graphColour,
                 alpha=0.6,
                 linewidth=0.8,
                 label=label,
@@ -2249,7 +2959,7 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
 
                     self.legOrigLines[legLine] = origLine
 
-    def energyToTOF(self, xData: list[float], length: float) -> list[float]:
+    def energyToTOF(self, xData: list[float], length: float) -> np.ndarray:
         """
         ``energyToTOF``
         ---------------
@@ -2261,21 +2971,12 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
             - ``length`` (float): Constant value associated to whether the element data is with repsect to n-g or n-tot
 
         Returns:
-            ``list[float]``: Mapped x-coords
+            ``np.ndarray``: Mapped x-coords
         """
         # ! Add a way to change length at runtime per spectra
         if length is None:
             length = 22.804
-        neutronMass = float(1.68e-27)
-        electronCharge = float(1.60e-19)
-
-        tofX = list(
-            map(
-                lambda x: length * 1e6 * (0.5 * neutronMass / (x * electronCharge)) ** 0.5,
-                xData
-            )
-        )
-        return tofX
+        return energyToTOF(xData, length)
 
     def hideGraph(self, event) -> None:
         """
@@ -2329,6 +3030,7 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         Function will empty all data from the table, all graphs from the plots, along with resetting all data associated
         the table or plot and disables relevant controls.
         """
+        self.spectraLoader.cancel()
         try:
             self.figure.clear()
             self.ax.clear()
@@ -2543,6 +3245,9 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         Args:
             index (QModelIndex): Index object for the selected cell.
         """
+        if self.resonanceModel is not None and self.table.model() is self.resonanceModel:
+            self.selectResonance(index)
+            return
         peakWindow = QMainWindow(self)
         # Setting title and geometry
         peakWindow.setWindowTitle("Peak Plotting")
@@ -2550,7 +3255,7 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         peakWindow.setObjectName("mainWindow")
         peakWindow.setStyleSheet(self.styleSheet())
         # Creating a second canvas for singular peak plotting
-        peakFigure = plt.figure()
+        peakFigure = Figure()
         peakCanvas = FigureCanvas(peakFigure, contextConnect=False)
         toolbar = NavigationToolbar(peakCanvas, self)
         canvasLayout = QVBoxLayout()
@@ -2668,7 +3373,7 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         peakTable.verticalHeader().setVisible(False)
         peakTable.setMinimumHeight(200)
 
-        graphData = element.graphData[(element.graphData[0] >= leftLimit) & (element.graphData[0] <= rightLimit)]
+        graphData = element.graphArray.window(leftLimit, rightLimit)
 
         def togglePeakLimits() -> None:
             for line in self.peakAxis.get_lines():
@@ -2701,8 +3406,8 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
             xlabel="Energy (eV)", ylabel="Cross section (b)", title=elementTitle
         )
 
-        self.peakAxis.plot(graphData[0],
-                           graphData[1],
+        self.peakAxis.plot(graphData.x,
+                           graphData.y,
                            color=element.graphColour,
                            linewidth=0.8,
                            label=elementTitle,
@@ -2745,9 +3450,9 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         name = getName[-1].split('.')[0]
 
         if name[-1] == "f":
-            self.updateGuiData(True, filepath, True, name)
+            self.updateGuiData(True, filepath, True, name, background=True)
         else:
-            self.updateGuiData(False, filepath, True, name)
+            self.updateGuiData(False, filepath, True, name, background=True)
 
     def getPeaks(self) -> None:
         """
@@ -2882,10 +3587,11 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
 
         label = f"{spectraData.name}-ToF" if spectraData.isToF else f"{spectraData.name}-Energy"
         if not spectraData.isMaxDrawn and not spectraData.isMinDrawn and not spectraData.isGraphUpdating:
-            self.axPD.plot(
-                spectraData.graphData[0],
-                spectraData.graphData[1],
-                "-",
+            DecimatedLine.plot(
+                self.axPD,
+                spectraData.graphArray.x,
+                spectraData.graphArray.y,
+                linestyle="-",
                 color=spectraData.graphColour,
                 alpha=0.6,
                 linewidth=0.8,
@@ -2982,7 +3688,22 @@ class ExplorerGUI(QWidget):  # Acts just like QWidget class (like a template)
         self.canvas.draw()
 
 
+def printStartupReport(startupTimes: dict[str, float]) -> None:
+    """
+    ``printStartupReport``
+    ----------------------
+    Prints the seconds taken by each stage of startup and in total.
+
+    Args:
+        - ``startupTimes`` (dict[str, float]): Seconds taken by each stage, as recorded in ``ExplorerGUI.startupTimes``.
+    """
+    stages = ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in startupTimes.items())
+    print(f"Startup: {stages}, total {sum(startupTimes.values()):.3f}s", flush=True)
+
+
 def main() -> None:
+    # Measures startup, printing the time taken by each stage and exiting once the window is first painted.
+    startupReport = "--startup-report" in sys.argv[1:]
 
     app = QtWidgets.QApplication(sys.argv)
     app.setObjectName('MainWindow')
@@ -2997,7 +3718,9 @@ def main() -> None:
 
     app.setWindowIcon(QIcon("./src/img/final_logo.png"))
 
-    _ = ExplorerGUI()
+    window = ExplorerGUI()
+    if startupReport:
+        window.startupFinished.connect(lambda: (printStartupReport(window.startupTimes), app.quit()))
     app.setPalette(Colours)
     app.exec()
 
@@ -0,0 +1,207 @@
+from __future__ import annotations
+import re
+
+import numpy as np
+from numpy import ndarray
+from pandas import DataFrame
+from scipy.optimize import nnls
+
+from element.IsotopeBasis import IsotopeBasis, getIsotopeBasis
+from element.SpectraManifest import getSpectraManifest
+
+# Number of points of a measured spectrum interpolated at a time, bounding the memory of a fit to that of a block.
+fitBlockSize = 8192
+
+
+class CompositionFit:
+    """
+    Non-negative weights of the library spectra whose weighted sum, the model of ``SpectraData.onDistChange`` and
+    the compound creator, best fits a measured spectrum in the least-squares sense.
+    """
+
+    names: list[str]
+    weights: ndarray
+    residual: float
+    points: int
+    basis: IsotopeBasis
+
+    def __init__(self, names: list[str], weights: ndarray, residual: float, points: int, basis: IsotopeBasis) -> None:
+        """
+        Args:
+            - ``names`` (list[str]): Spectrum name of each candidate.
+
+            - ``weights`` (ndarray): Fitted weight of each candidate, in the order of ``names``.
+
+            - ``residual`` (float): Root mean square difference of the fit and the measured spectrum.
+
+            - ``points`` (int): Number of points of the measured spectrum fitted.
+
+            - ``basis`` (IsotopeBasis): Basis of the candidates.
+        """
+        self.names = names
+        self.weights = weights
+        self.residual = residual
+        self.points = points
+        self.basis = basis
+
+    @property
+    def proportions(self) -> ndarray:
+        """
+        Returns:
+            ndarray: Weight of each candidate as a fraction of the total, 0 if every weight is 0.
+        """
+        total = self.weights.sum()
+        return self.weights / total if total > 0 else np.zeros_like(self.weights)
+
+    def combine(self) -> DataFrame:
+        """
+        ``combine``
+        -----------
+
+        Returns:
+            DataFrame: Fitted spectrum on the grid of the basis, x-coords in column 0 and y-coords in column 1.
+        """
+        return self.basis.combine(self.weights)
+
+    def toDataFrame(self, byElement: bool = False) -> DataFrame:
+        """
+        ``toDataFrame``
+        ---------------
+
+        Args:
+            - ``byElement`` (bool, optional): Whether to sum the weights of the isotopes of each element, given by
+            its element spectrum name. Defaults to False.
+
+        Returns:
+            DataFrame: Name and mode of each candidate with its weight and proportion, largest first.
+        """
+        names = [name.rpartition("_") for name in self.names]
+        if byElement:
+            names = [(getElementName(base), separator, mode) for base, separator, mode in names]
+        table = DataFrame({"Name": [name[0] for name in names],
+                           "Mode": [name[2] for name in names],
+                           "Weight": self.weights,
+                           "Proportion": self.proportions})
+        if byElement:
+            table = table.groupby(["Name", "Mode"], as_index=False, sort=False).sum()
+        return table.sort_values("Weight", ascending=False, kind="stable", ignore_index=True)
+
+
+def getElementName(name: str) -> str:
+    """
+    ``getElementName``
+    ------------------
+
+    Args:
+        - ``name`` (str): Isotope or element name without its mode, e.g. '29-Cu-63' or 'element_29-Cu'.
+
+    Returns:
+        str: Name of the element, e.g. 'element_29-Cu'.
+    """
+    if name.startswith("element_"):
+        return name
+    return f"element_{'-'.join(name.split('-')[:2])}"
+
+
+def getCandidateSpectra(elements: list[str], mode: str, isotopes: bool = False,
+                        spectraNames: list[str] = None) -> list[str]:
+    """
+    ``getCandidateSpectra``
+    -----------------------
+
+    Finds the library spectra of candidate elements for ``fitComposition``.
+
+    Args:
+        - ``elements`` (list[str]): Element symbols, e.g. 'Cu', or element names, e.g. '29-Cu'.
+
+        - ``mode`` (str): Mode of the spectra, 'n-g' or 'n-tot'.
+
+        - ``isotopes`` (bool, optional): Whether to give the spectra of the isotopes of each element, so that their
+        proportions are fitted independently, rather than the element spectrum of natural abundance. Elements with
+        no element spectrum always give their isotopes. Defaults to False.
+
+        - ``spectraNames`` (list[str], optional): Names of the library spectra. Defaults to None, those of the
+        manifest.
+
+    Raises:
+        ValueError: An element has no spectra in ``mode``.
+
+    Returns:
+        list[str]: Spectrum names of the candidates.
+    """
+    if spectraNames is None:
+        spectraNames = getSpectraManifest().spectraNames
+    candidates = []
+    for element in elements:
+        symbol = element.strip().split("-")[-1]
+        elementPattern = re.compile(rf"element_[0-9]+-{re.escape(symbol)}_{re.escape(mode)}")
+        isotopePattern = re.compile(rf"[0-9]+-{re.escape(symbol)}-[0-9]+m?_{re.escape(mode)}")
+        found = [name for name in spectraNames if elementPattern.fullmatch(name)]
+        if isotopes or not found:
+            found = [name for name in spectraNames if isotopePattern.fullmatch(name)]
+        if not found:
+            raise ValueError(f"No {mode} spectra for {element}")
+        candidates += [name for name in found if name not in candidates]
+    return candidates
+
+
+def fitComposition(x: ndarray, y: ndarray, candidates: list[str], window: tuple[float, float] = None,
+                   blockSize: int = fitBlockSize) -> CompositionFit:
+    """
+    ``fitComposition``
+    ------------------
+
+    Fits a measured spectrum as a weighted sum of library spectra by non-negative least squares. The candidates are
+    taken from their shared basis, interpolated at the measured points and reduced block by block to the triangular
+    factor of a QR decomposition, so the fit is solved on a (k, k) system for k candidates however many points are
+    measured.
+
+    Args:
+        - ``x`` (ndarray): Energies (eV) of the measured spectrum.
+
+        - ``y`` (ndarray): y-coords of the measured spectrum.
+
+        - ``candidates`` (list[str]): Spectrum names of the candidates, all of one mode, see ``getCandidateSpectra``.
+
+        - ``window`` (tuple[float, float], optional): Energies between which to fit, inclusive. Defaults to None,
+        the whole range of the basis.
+
+        - ``blockSize`` (int, optional): Number of points interpolated at a time. Defaults to ``fitBlockSize``.
+
+    Raises:
+        ValueError: There are no candidates, or no measured points within the window and the range of the basis.
+        pandas.errors.EmptyDataError: A candidate has no graph data.
+
+    Returns:
+        CompositionFit: The fitted weights.
+    """
+    if not candidates:
+        raise ValueError("No candidate spectra to fit")
+    basis = getIsotopeBasis(candidates)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    keep = np.isfinite(x) & np.isfinite(y) & (x >= basis.x[0]) & (x <= basis.x[-1])
+    if window is not None:
+        keep &= (x >= window[0]) & (x <= window[1])
+    x, y = x[keep], y[keep]
+    if x.size == 0:
+        raise ValueError("No points of the spectrum to fit within the window")
+
+    # [A | y] is reduced to the triangular factor R of its QR decomposition, ||Aw - y|| being ||R[:, :k]w - R[:, k]||.
+    k = len(basis.names)
+    factor = np.zeros((0, k + 1))
+    for start in range(0, x.size, blockSize):
+        # Every candidate is interpolated linearly at once, as np.interp would each.
+        blockX = x[start:start + blockSize]
+        right = np.clip(np.searchsorted(basis.x, blockX, side="left"), 1, basis.x.size - 1)
+        left = right - 1
+        fraction = (blockX - basis.x[left]) / (basis.x[right] - basis.x[left])
+        block = np.empty((blockX.size, k + 1))
+        block[:, :k] = (basis.matrix[:, left] * (1 - fraction) + basis.matrix[:, right] * fraction).T
+        block[:, k] = y[start:start + blockSize]
+        factor = np.linalg.qr(np.vstack([factor, block]), mode="r")
+    factor = np.vstack([factor, np.zeros((max(k + 1 - factor.shape[0], 0), k + 1))])
+
+    weights, _ = nnls(factor[:k, :k], factor[:k, k])
+    residual = np.linalg.norm(factor[:, :k] @ weights - factor[:, k]) / np.sqrt(x.size)
+    return CompositionFit(list(basis.names), weights, float(residual), int(x.size), basis)
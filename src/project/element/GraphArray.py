@@ -0,0 +1,208 @@
+from __future__ import annotations
+import numpy as np
+from numpy import ndarray
+from pandas import DataFrame
+
+
+class GraphArray:
+    """
+    Graph data held as float64 x-coords and y-coords, normally the rows of a (2, n) array as packed in the spectra
+    store. The x-coords are kept in ascending order, so locating a point or a window of points is a binary search and
+    slicing a window gives a view rather than a copy. The time of flight view of a spectrum is the reversed energy
+    y-coords against the reversed time of flight axis, without copying either, see ``withX``.
+
+    A DataFrame view of the same memory, columns 0 and 1, is made on first request for csv output and the table
+    models.
+    """
+
+    __slots__ = ("x", "y", "_frame")
+
+    x: ndarray
+    y: ndarray
+
+    def __init__(self, data: ndarray, isSorted: bool = False) -> None:
+        """
+        Args:
+            - ``data`` (ndarray): (2, n) array of x-coords and y-coords, used without copying if already a float64
+            array in ascending order of x.
+
+            - ``isSorted`` (bool, optional): Whether the x-coords are known to be in ascending order, skipping the
+            check. Defaults to False.
+
+        Raises:
+            ValueError: ``data`` is not of shape (2, n).
+        """
+        data = np.asarray(data, dtype=np.float64)
+        if data.ndim != 2 or data.shape[0] != 2:
+            raise ValueError(f"Graph data must be of shape (2, n), not {data.shape}")
+        if not isSorted and (data[0, 1:] < data[0, :-1]).any():
+            if (data[0, 1:] <= data[0, :-1]).all():
+                # Descending x-coords, e.g. energies converted to times of flight, are reversed so the line through
+                # repeated x-coords is unchanged.
+                data = np.ascontiguousarray(data[:, ::-1])
+            else:
+                data = data[:, np.argsort(data[0], kind="stable")]
+        elif data.strides[1] != data.itemsize:
+            # x and y are each kept contiguous, e.g. when given the transposed values of a row-major DataFrame.
+            data = np.ascontiguousarray(data)
+        self.x = data[0]
+        self.y = data[1]
+        self._frame = None
+
+    @classmethod
+    def fromRows(cls, x: ndarray, y: ndarray) -> GraphArray:
+        """
+        ``fromRows``
+        ------------
+
+        Args:
+            - ``x`` (ndarray): float64 x-coords in ascending order, used without copying.
+
+            - ``y`` (ndarray): float64 y-coords, used without copying.
+
+        Returns:
+            GraphArray: Graph data of the points.
+        """
+        graphArray = cls.__new__(cls)
+        graphArray.x = x
+        graphArray.y = y
+        graphArray._frame = None
+        return graphArray
+
+    @classmethod
+    def fromXY(cls, x: ndarray, y: ndarray) -> GraphArray:
+        """
+        ``fromXY``
+        ----------
+
+        Args:
+            - ``x`` (ndarray): x-coords.
+
+            - ``y`` (ndarray): y-coords.
+
+        Returns:
+            GraphArray: Graph data of the points, sorted by x-coord.
+        """
+        return cls(np.stack([np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)]))
+
+    @classmethod
+    def fromGraphData(cls, graphData: GraphArray | DataFrame | None) -> GraphArray:
+        """
+        ``fromGraphData``
+        -----------------
+
+        Args:
+            - ``graphData`` (GraphArray | DataFrame | None): Graph data, a DataFrame having x-coords in its first
+            column and y-coords in its second. A DataFrame with a single float block, as read from csv or the spectra
+            store, is used without copying.
+
+        Returns:
+            GraphArray: ``graphData`` itself if already a GraphArray, empty if None or the DataFrame has no columns.
+        """
+        if isinstance(graphData, GraphArray):
+            return graphData
+        if graphData is None or graphData.shape[1] < 2:
+            return cls(np.empty((2, 0)), isSorted=True)
+        return cls(graphData.iloc[:, :2].to_numpy(dtype=np.float64).T)
+
+    def __len__(self) -> int:
+        return self.x.size
+
+    def __getitem__(self, index: slice) -> GraphArray:
+        """
+        Returns a view of the points in the ``index`` slice.
+        """
+        if not isinstance(index, slice) or (index.step or 1) < 0:
+            raise TypeError("Graph data can only be indexed by an ascending slice")
+        return GraphArray.fromRows(self.x[index], self.y[index])
+
+    @property
+    def data(self) -> ndarray:
+        """
+        Returns:
+            ndarray: (2, n) copy of the x-coords and y-coords.
+        """
+        return np.stack([self.x, self.y])
+
+    @property
+    def empty(self) -> bool:
+        return self.x.size == 0
+
+    @property
+    def frame(self) -> DataFrame:
+        """
+        Returns:
+            DataFrame: View of the graph data with x-coords in column 0 and y-coords in column 1, the same DataFrame
+            being returned on every call.
+        """
+        if self._frame is None:
+            self._frame = DataFrame({0: self.x, 1: self.y}, copy=False)
+        return self._frame
+
+    def windowIndexes(self, leftLimit: float | ndarray, rightLimit: float | ndarray) -> tuple[ndarray, ndarray]:
+        """
+        ``windowIndexes``
+        -----------------
+
+        Args:
+            - ``leftLimit`` (float | ndarray): x-coord of the left limit of each window.
+
+            - ``rightLimit`` (float | ndarray): x-coord of the right limit of each window.
+
+        Returns:
+            tuple[ndarray, ndarray]: Start and stop index of each window, the points with x-coords between the limits
+            inclusive.
+        """
+        return np.searchsorted(self.x, leftLimit, side="left"), np.searchsorted(self.x, rightLimit, side="right")
+
+    def window(self, leftLimit: float, rightLimit: float) -> GraphArray:
+        """
+        ``window``
+        ----------
+
+        Args:
+            - ``leftLimit`` (float): x-coord of the left limit.
+
+            - ``rightLimit`` (float): x-coord of the right limit.
+
+        Returns:
+            GraphArray: View of the points with x-coords between the limits inclusive.
+        """
+        start, stop = self.windowIndexes(leftLimit, rightLimit)
+        return self[int(start):int(stop)]
+
+    def nearestIndexes(self, targets: float | ndarray) -> ndarray:
+        """
+        ``nearestIndexes``
+        ------------------
+
+        Args:
+            - ``targets`` (float | ndarray): x-coords to locate.
+
+        Returns:
+            ndarray: Index of the first point at the x-coord nearest each target, the lower x-coord on ties as with
+            ``nearestnumber``.
+        """
+        targets = np.asarray(targets, dtype=np.float64)
+        right = np.clip(np.searchsorted(self.x, targets, side="left"), 0, self.x.size - 1)
+        left = np.clip(right - 1, 0, None)
+        useLeft = np.abs(self.x[left] - targets) <= np.abs(self.x[right] - targets)
+        # The left candidate is the last of any repeated x-coords.
+        return np.where(useLeft, np.searchsorted(self.x, self.x[left], side="left"), right)
+
+    def withX(self, x: ndarray) -> GraphArray:
+        """
+        ``withX``
+        ---------
+
+        Args:
+            - ``x`` (ndarray): New x-coord of each point, e.g. its time of flight.
+
+        Returns:
+            GraphArray: Graph data of the points at their new x-coords, sorted by x-coord. Descending x-coords, as
+            times of flight, give reversed views of ``x`` and the y-coords rather than copies.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        if x.size > 1 and (x[1:] <= x[:-1]).all() and x[0] > x[-1]:
+            return GraphArray.fromRows(x[::-1], self.y[::-1])
+        return GraphArray.fromXY(x, self.y)
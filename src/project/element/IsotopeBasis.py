@@ -0,0 +1,116 @@
+from __future__ import annotations
+from collections import OrderedDict
+from threading import RLock
+
+import numpy as np
+from numpy import ndarray
+from pandas import DataFrame
+
+from element.IsotopeCache import getIsotopeCache
+from element.PeakDetection import PeakDetector
+from helpers.getSpacedElements import getSpacedElements
+
+
+class IsotopeBasis:
+    """
+    Constituent spectra of an element or compound interpolated onto one common x-grid, so that the spectrum for any
+    distribution is a single matrix-vector product.
+
+    The grid is the union of half the points of each constituent along with the x-coords of its maxima and minima,
+    as built by ``SpectraData.setGraphDataFromDist``. Constituents are interpolated linearly between their points.
+    """
+
+    names: list[str]
+    x: ndarray
+    matrix: ndarray
+
+    def __init__(self, names: list[str], graphData: list[ndarray]) -> None:
+        """
+        Args:
+            - ``names`` (list[str]): Name of each constituent.
+
+            - ``graphData`` (list[ndarray]): (2, n) graph data of each constituent, in the order of ``names``.
+        """
+        self.names = list(names)
+        peakD = PeakDetector()
+        gridX = []
+        for array in graphData:
+            data = DataFrame(array.T, copy=False)
+            gridX.append(getSpacedElements(array[0], array.shape[1] // 2))
+            gridX.append(peakD.maxima(data, 0)[0])
+            gridX.append(peakD.minima(data)[0])
+        self.x = np.unique(np.concatenate(gridX)) if gridX else np.empty(0)
+        self.matrix = np.empty((len(graphData), self.x.size))
+        for i, array in enumerate(graphData):
+            self.matrix[i] = np.interp(self.x, array[0], array[1])
+        self.x.flags.writeable = False
+        self.matrix.flags.writeable = False
+
+    @property
+    def nbytes(self) -> int:
+        return self.x.nbytes + self.matrix.nbytes
+
+    def weights(self, distributions: dict[str, float]) -> ndarray:
+        """
+        ``weights``
+        -----------
+
+        Args:
+            - ``distributions`` (dict[str, float]): Weight of each constituent by name, those missing are 0.
+
+        Returns:
+            ndarray: Weight vector in the order of ``names``.
+        """
+        return np.array([distributions.get(name, 0) for name in self.names], dtype=np.float64)
+
+    def combine(self, weights: ndarray | dict[str, float]) -> DataFrame:
+        """
+        ``combine``
+        -----------
+
+        Args:
+            - ``weights`` (ndarray | dict[str, float]): Weight vector in the order of ``names``, or weights by name.
+
+        Returns:
+            DataFrame: Weighted sum of the constituents, x-coords in column 0 and y-coords in column 1.
+        """
+        if isinstance(weights, dict):
+            weights = self.weights(weights)
+        return DataFrame({0: self.x, 1: weights @ self.matrix})
+
+
+# Bases keyed by their constituent names, least recently used first.
+_bases: OrderedDict[tuple[str, ...], IsotopeBasis] = OrderedDict()
+basesMaxBytes: int = 256 * 1024 ** 2
+_basesLock = RLock()
+
+
+def getIsotopeBasis(names: list[str]) -> IsotopeBasis:
+    """
+    ``getIsotopeBasis``
+    -------------------
+
+    Returns the basis of the given library spectra, built on first request from the shared isotope cache and kept
+    until the bases exceed ``basesMaxBytes`` in total.
+
+    Args:
+        - ``names`` (list[str]): Spectrum name of each constituent, e.g. ['29-Cu-63_n-g', '29-Cu-65_n-g'].
+
+    Raises:
+        pandas.errors.EmptyDataError: A constituent has no graph data.
+
+    Returns:
+        IsotopeBasis: Basis of the constituents.
+    """
+    key = tuple(names)
+    with _basesLock:
+        basis = _bases.get(key, None)
+        if basis is not None:
+            _bases.move_to_end(key)
+            return basis
+        isotopeCache = getIsotopeCache()
+        basis = IsotopeBasis(key, [isotopeCache.getArray(name) for name in key])
+        _bases[key] = basis
+        while len(_bases) > 1 and sum(basis.nbytes for basis in _bases.values()) > basesMaxBytes:
+            _bases.popitem(last=False)
+        return basis
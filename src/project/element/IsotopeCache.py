@@ -0,0 +1,185 @@
+from __future__ import annotations
+from collections import OrderedDict
+from threading import RLock
+
+import numpy as np
+from numpy import ndarray
+import pandas
+from pandas import DataFrame
+
+from element.IntegralIndex import IntegralIndex
+from element.SpectraStore import getSpectraStore
+from helpers.graphDataCache import graphDataDir, loadGraphData
+
+
+class IsotopeCache:
+    """
+    Size-bounded, least recently used cache of library spectra, shared by everything that combines isotopes into
+    elements and compounds. Each entry holds the read-only (2, n) graph data of a spectrum and, once requested, its
+    integral index. Entries are evicted least recently used first once their total size exceeds ``maxBytes``.
+
+    ``hits`` and ``misses`` count lookups answered from the cache and those which had to load the spectrum. Lookups
+    are serialised by a lock, as spectra may be loaded on a background thread.
+    """
+
+    maxBytes: int
+    hits: int = 0
+    misses: int = 0
+
+    def __init__(self, maxBytes: int = 256 * 1024 ** 2) -> None:
+        self.maxBytes = maxBytes
+        self._entries: OrderedDict[str, list[ndarray, IntegralIndex | None]] = OrderedDict()
+        self._nbytes = 0
+        self._lock = RLock()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: Total size of the cached arrays.
+        """
+        return self._nbytes
+
+    @property
+    def info(self) -> dict[str, int]:
+        """
+        Returns:
+            dict[str, int]: Hits, misses, number of entries, current and maximum size in bytes.
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "nbytes": self._nbytes,
+                "maxBytes": self.maxBytes}
+
+    @staticmethod
+    def _entryBytes(entry: list[ndarray, IntegralIndex | None]) -> int:
+        array, index = entry
+        # The index shares the x and y arrays, adding three cumulative arrays.
+        return array.nbytes + (0 if index is None else 3 * array.nbytes // 2)
+
+    @staticmethod
+    def _load(name: str) -> ndarray:
+        """
+        Loads the graph data of a library spectrum, from the spectra store if available otherwise from its csv.
+        """
+        store = getSpectraStore()
+        if store is not None and name in store:
+            array = store.getGraphArray(name)
+            if array.shape[1] == 0:
+                raise pandas.errors.EmptyDataError(f"No graph data for {name}")
+        else:
+            array = np.ascontiguousarray(loadGraphData(f"{graphDataDir}{name}.csv").to_numpy(dtype=np.float64).T)
+        array = array.view()
+        array.flags.writeable = False
+        return array
+
+    def _getEntry(self, name: str) -> list[ndarray, IntegralIndex | None]:
+        with self._lock:
+            entry = self._entries.get(name, None)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(name)
+                return entry
+            self.misses += 1
+            entry = [self._load(name), None]
+            self._entries[name] = entry
+            self._nbytes += self._entryBytes(entry)
+            self._evict()
+            return entry
+
+    def _evict(self) -> None:
+        # The most recent entry is kept even if it alone exceeds the limit.
+        while self._nbytes > self.maxBytes and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            self._nbytes -= self._entryBytes(entry)
+
+    def getArray(self, name: str) -> ndarray:
+        """
+        ``getArray``
+        ------------
+
+        Args:
+            - ``name`` (str): Spectrum name, e.g. '29-Cu-63_n-g'.
+
+        Raises:
+            pandas.errors.EmptyDataError: The spectrum has no graph data.
+
+        Returns:
+            ndarray: Read-only (2, n) graph data.
+        """
+        return self._getEntry(name)[0]
+
+    def getGraphData(self, name: str, names: list[str] = None) -> DataFrame:
+        """
+        ``getGraphData``
+        ----------------
+
+        Args:
+            - ``name`` (str): Spectrum name, e.g. '29-Cu-63_n-g'.
+
+            - ``names`` (list[str], optional): Column names. Defaults to None, giving columns 0 and 1.
+
+        Raises:
+            pandas.errors.EmptyDataError: The spectrum has no graph data.
+
+        Returns:
+            DataFrame: Graph data backed by the cached array, which must not be modified in place.
+        """
+        return DataFrame(self.getArray(name).T, columns=names, copy=False)
+
+    def getIntegralIndex(self, name: str) -> IntegralIndex:
+        """
+        ``getIntegralIndex``
+        --------------------
+
+        Args:
+            - ``name`` (str): Spectrum name, e.g. '29-Cu-63_n-g'.
+
+        Raises:
+            pandas.errors.EmptyDataError: The spectrum has no graph data.
+            ValueError: The x-coords are not in ascending order.
+
+        Returns:
+            IntegralIndex: Integral index of the spectrum, built on first request.
+        """
+        with self._lock:
+            entry = self._getEntry(name)
+            if entry[1] is None:
+                self._nbytes -= self._entryBytes(entry)
+                entry[1] = IntegralIndex(entry[0][0], entry[0][1])
+                self._nbytes += self._entryBytes(entry)
+                self._evict()
+            return entry[1]
+
+    def clear(self) -> None:
+        """
+        ``clear``
+        ---------
+
+        Empties the cache and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+_isotopeCache: list[IsotopeCache] = []
+
+
+def getIsotopeCache() -> IsotopeCache:
+    """
+    ``getIsotopeCache``
+    -------------------
+
+    Returns:
+        IsotopeCache: The cache shared across the process.
+    """
+    if not _isotopeCache:
+        _isotopeCache.append(IsotopeCache())
+    return _isotopeCache[0]
@@ -2,6 +2,20 @@ from __future__ import annotations
 from pandas import DataFrame
 import scipy as sp
 import numpy as np
+from numpy import ndarray
+
+from element.GraphArray import GraphArray
+
+# Structured result returned when ``structured=True``, one record per peak.
+peakDtype = np.dtype([
+    ("index", np.int64),
+    ("x", np.float64),
+    ("y", np.float64),
+    ("leftX", np.float64),
+    ("leftY", np.float64),
+    ("rightX", np.float64),
+    ("rightY", np.float64),
+])
 
 
 class PeakDetector:
@@ -16,7 +30,74 @@ class PeakDetector:
         self.minPeakLimitsX: dict = None
         self.minPeakLimitsY: dict = None
 
-    def maxima(self, data: DataFrame, threshold: float = 100) -> tuple[list[float]]:
+    @staticmethod
+    def _getXY(data: DataFrame | GraphArray) -> tuple[ndarray, ndarray]:
+        """
+        Returns the x-coords and y-coords of ``data`` as float64 arrays, without copying a GraphArray.
+        """
+        if isinstance(data, GraphArray):
+            return data.x, data.y
+        return data.iloc[:, 0].to_numpy(dtype=np.float64), data.iloc[:, 1].to_numpy(dtype=np.float64)
+
+    @staticmethod
+    def _limitIndexes(x: ndarray, limits: ndarray) -> ndarray:
+        """
+        ``_limitIndexes``
+        -----------------
+
+        Rounds the interpolated limit positions from ``peak_widths`` onto the data, returning the index of the first
+        point sharing the x-coordinate of each rounded limit.
+
+        Args:
+            - ``x`` (ndarray): x-coords of the sample.
+
+            - ``limits`` (ndarray): Interpolated limit positions.
+
+        Returns:
+            ndarray: Integer indexes into ``x``.
+        """
+        indexes = np.round(limits).astype(np.int64)
+        if x.size > 1 and (x[1:] >= x[:-1]).all():
+            # Repeated x-coords resolve to their first occurrence.
+            indexes = np.searchsorted(x, x[indexes], side="left")
+        return indexes
+
+    def _findPeaks(self, x: ndarray, y: ndarray, wlen: int, **kwargs) -> ndarray:
+        """
+        ``_findPeaks``
+        --------------
+
+        Finds the peaks of ``y`` and their width limits in a single vectorised pass.
+
+        Args:
+            - ``x`` (ndarray): x-coords of the sample.
+
+            - ``y`` (ndarray): y-coords of the sample.
+
+            - ``wlen`` (int): Window length passed to ``scipy.signal.peak_widths``.
+
+            - ``**kwargs``: Passed to ``scipy.signal.find_peaks``.
+
+        Returns:
+            ndarray: Structured array of ``peakDtype``.
+        """
+        peaks, _ = sp.signal.find_peaks(y, **kwargs)
+        width = sp.signal.peak_widths(y, peaks, rel_height=1, wlen=wlen)
+        first = self._limitIndexes(x, width[2])
+        second = self._limitIndexes(x, width[3])
+
+        result = np.empty(peaks.size, dtype=peakDtype)
+        result["index"] = peaks
+        result["x"] = x[peaks]
+        result["y"] = y[peaks]
+        result["leftX"] = x[first]
+        result["leftY"] = y[first]
+        result["rightX"] = x[second]
+        result["rightY"] = y[second]
+        return result
+
+    def maxima(self, data: DataFrame | GraphArray, threshold: float = 100,
+               structured: bool = False) -> tuple[ndarray, ndarray] | ndarray:
         """
         ``maxima``
         ----------
@@ -25,52 +106,30 @@ class PeakDetector:
         peak widths.
         Args:
 
-            - ``data`` (DataFrame): Pandas Dataframe with the graph data for the sample.
+            - ``data`` (DataFrame | GraphArray): Graph data for the sample.
 
             - ``threshold`` (float): Threshold for what level peaks should be found from.
 
+            - ``structured`` (bool, optional): Return the structured array of peaks and limits instead. Defaults to
+            False.
+
         Returns:
-            (maxima_list_x, maxima_list_y): Tuple of lists, list of x-coords, list of y-coords.
+            (maxima_x, maxima_y): Tuple of arrays, array of x-coords, array of y-coords.
         """
-        x, y = data.iloc[:, 0], data.iloc[:, 1]
-        maxima, _ = sp.signal.find_peaks(y, height=threshold)
-
-        width = sp.signal.peak_widths(y, maxima, rel_height=1, wlen=110)
-        # Extracting maxima coordinates
-        maxima_list_x: list[float] = []
-        maxima_list_y = []
-        maxima = maxima.tolist()
-        for i in maxima:
-            maxima_list_x.append(x[i])  # Get list of maxima # !
-            maxima_list_y.append(y[i])
+        x, y = self._getXY(data)
+        peaks = self._findPeaks(x, y, 110, height=threshold)
+
         # Extracting peak width coordinates
-        self.maxPeakLimitsX = {}  # Re-setting if used before
-        self.maxPeakLimitsY = {}
-        first_limits = width[2].tolist()
-        second_limits = width[3].tolist()
-        # Refining peak limits
-        # first_limits, second_limits = self.PeakLimitsCheck(first_limits, second_limits, maxima)
-        for i in first_limits:
-            index = first_limits.index(i)
-            peak = maxima_list_x[index]
-            # ! Loss of Accuracy? check how indexing is done
-            coordinate = x[round(i)]
-            # Finding the y- value for corresponding limits
-            coordinate_index = x.loc[x == coordinate].index[0]
-            self.maxPeakLimitsX[f"{peak}_first"] = coordinate
-            self.maxPeakLimitsY[f"{peak}_first"] = y[coordinate_index]
-        for i in second_limits:
-            index = second_limits.index(i)
-            peak = maxima_list_x[index]
-            coordinate = x[round(i)]
-            # Finding the y- value for corresponding limits
-            coordinate_index = x.loc[x == coordinate].index[0]
-            self.maxPeakLimitsX[f"{peak}_second"] = coordinate
-            self.maxPeakLimitsY[f"{peak}_second"] = y[coordinate_index]
-        #
-        return (maxima_list_x, maxima_list_y)
-
-    def minima(self, data: DataFrame) -> tuple[list[float]]:
+        keys = peaks["x"].astype(str)
+        self.maxPeakLimitsX = {**dict(zip(np.char.add(keys, "_first"), peaks["leftX"])),
+                               **dict(zip(np.char.add(keys, "_second"), peaks["rightX"]))}
+        self.maxPeakLimitsY = {**dict(zip(np.char.add(keys, "_first"), peaks["leftY"])),
+                               **dict(zip(np.char.add(keys, "_second"), peaks["rightY"]))}
+        if structured:
+            return peaks
+        return peaks["x"], peaks["y"]
+
+    def minima(self, data: DataFrame | GraphArray, structured: bool = False) -> tuple[ndarray, ndarray] | ndarray:
         """
         ``minima``
         ----------
@@ -78,44 +137,27 @@ class PeakDetector:
         Finds the coordinates of the minimas within the selected sample.
 
         Args:
-            ``data`` (DataFrame): Pandas Dataframe with the graph data for the sample.
+            - ``data`` (DataFrame | GraphArray): Graph data for the sample.
+
+            - ``structured`` (bool, optional): Return the structured array of peaks and limits instead. Defaults to
+            False.
 
         Returns:
-            (minima_list_x, minima_list_y): Tuple of lists, list of x-coords, list of y-coords.
+            (minima_x, minima_y): Tuple of arrays, array of x-coords, array of y-coords.
         """
-        x = data.iloc[:, 0]
-        y = (lambda data: -1 * data.iloc[:, 1])(data)
-        minima, _ = sp.signal.find_peaks(y, height=-0.90, prominence=0.0035)
-        width = sp.signal.peak_widths(y, minima, rel_height=1, wlen=300)
-        # Extracting peak center coordinates
-        minima_list_x = []
-        minima_list_y = []
-        minima = minima.tolist()
-        for i in minima:
-            minima_list_x.append(x[i])
-            minima_list_y.append(y[i])
-        # Extracting peak width coordinates
-        self.minPeakLimitsX = dict()  # Resetting if used before
-        self.minPeakLimitsY = dict()
-        first_limits = width[2].tolist()
-        second_limits = width[3].tolist()
-        for i in first_limits:
-            index = first_limits.index(i)
-            peak = minima_list_x[index]
-            coordinate = x[round(i)]
-            # Finding the y- value for corresponding limits
-            coordinate_index = x.loc[x == coordinate].index[0]
-
-            self.minPeakLimitsX[f"{peak}_first"] = coordinate
-            self.minPeakLimitsY[f"{peak}_first"] = y[coordinate_index]
-        for i in second_limits:
-            index = second_limits.index(i)
-            peak = minima_list_x[index]
-            coordinate = x[round(i)]
-            # Finding the y- value for corresponding limits
-            coordinate_index = x.loc[x == coordinate].index[0]
-            self.minPeakLimitsX[f"{peak}_second"] = coordinate
-            self.minPeakLimitsY[f"{peak}_second"] = y[coordinate_index]
-
-        minima_list_y = list(map(lambda val: -1 * val, minima_list_y))
-        return minima_list_x, minima_list_y
+        x, y = self._getXY(data)
+        y = -y
+        peaks = self._findPeaks(x, y, 300, height=-0.90, prominence=0.0035)
+
+        # Limits y-coords are kept on the inverted data.
+        keys = peaks["x"].astype(str)
+        self.minPeakLimitsX = {**dict(zip(np.char.add(keys, "_first"), peaks["leftX"])),
+                               **dict(zip(np.char.add(keys, "_second"), peaks["rightX"]))}
+        self.minPeakLimitsY = {**dict(zip(np.char.add(keys, "_first"), peaks["leftY"])),
+                               **dict(zip(np.char.add(keys, "_second"), peaks["rightY"]))}
+
+        for field in ["y", "leftY", "rightY"]:
+            peaks[field] = -peaks[field]
+        if structured:
+            return peaks
+        return peaks["x"], peaks["y"]
@@ -0,0 +1,245 @@
+from __future__ import annotations
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from os import path
+
+import numpy as np
+from pandas import DataFrame
+
+from element.SpectraDataStructure import SpectraData
+from element.SpectraManifest import getSpectraManifest
+from element.SpectraStore import SpectraStore, dataDir, loadSpectrumGraphData, storeFilepath
+
+# Columns of the peak information table written as floats, the ranks of peak width and height being text.
+floatColumns = ["Energy (eV)", "TOF (us)", "Integral", "Peak Width", "Peak Height"]
+
+
+def getThreshold(name: str, thresholds: dict[str, tuple[float, float]]) -> float:
+    """
+    ``getThreshold``
+    ----------------
+
+    Returns the peak detection threshold of a spectrum, as selected by ``ExplorerGUI.displayData``.
+
+    Args:
+        - ``name`` (str): Spectrum name, e.g. '29-Cu-63_n-g' or 'element_29-Cu_n-tot'.
+
+        - ``thresholds`` (dict[str, tuple[float, float]]): Thresholds given by ``readThresholds``.
+
+    Returns:
+        float: Threshold of the spectrum.
+    """
+    split = name.split('-')
+    symbol = split[1][:-2] if name.startswith('e') else split[1]
+    if symbol not in thresholds:
+        return 100
+    return thresholds[symbol][0] if name[-1] == 't' else thresholds[symbol][1]
+
+
+def calculatePeakTables(name: str, threshold: float) -> tuple[DataFrame, DataFrame | None]:
+    """
+    ``calculatePeakTables``
+    -----------------------
+
+    Detects the peaks of a library spectrum and calculates their limits and integrals, ignoring any limits already
+    stored for it.
+
+    Args:
+        - ``name`` (str): Spectrum name, e.g. '29-Cu-63_n-g'.
+
+        - ``threshold`` (float): Threshold for peak detection.
+
+    Raises:
+        pandas.errors.EmptyDataError: The spectrum has no graph data.
+
+    Returns:
+        tuple[DataFrame, DataFrame | None]: Peak information table ordered by integral and the limits of each of its
+        peaks, None for elements whose limits are calculated when plotted.
+    """
+    graphData = loadSpectrumGraphData(name)
+    distributions = None
+    if "element" in name:
+        distributions = getDistributions(name)
+    spectra = SpectraData(name=name, numPeaks=None, tableData=None, graphData=graphData, graphColour=None,
+                          isToF=False, distributions=distributions, defaultDist=distributions, threshold=threshold)
+    spectra.maxPeakLimitsX = {}
+    spectra.maxPeakLimitsY = {}
+    spectra.updatePeaks()
+    return formatPeakTables(spectra)
+
+
+def formatPeakTables(spectra: SpectraData) -> tuple[DataFrame, DataFrame | None]:
+    """
+    ``formatPeakTables``
+    --------------------
+
+    Formats the peaks of a spectra as the tables of the data folder.
+
+    Args:
+        - ``spectra`` (SpectraData): Spectra whose peak data has been calculated.
+
+    Returns:
+        tuple[DataFrame, DataFrame | None]: Peak information table ordered by integral and the limits of each of its
+        peaks, None for elements whose limits are calculated when plotted.
+    """
+    columns = spectra.tableData.columns
+    if spectra.maxima.size == 0:
+        return DataFrame(columns=columns), None
+    # The first row of the table data is its title.
+    tableData = spectra.tableData.iloc[1:].reset_index(drop=True)
+    tableData["Rank by Integral"] = tableData["Rank by Integral"].astype(int)
+    tableData[floatColumns] = tableData[floatColumns].astype(float)
+    tableData["Relevant Isotope"] = "[]" if "element" in spectra.name else "none"
+    if "element" in spectra.name:
+        return tableData, None
+    order = tableData["Rank by Energy"].str.strip("()").astype(int).to_numpy()
+    # The maxima of a ToF view are in descending order of energy.
+    maxima = spectra.maxima[0][::-1] if spectra.isToF else spectra.maxima[0]
+    limits = DataFrame([spectra.maxPeakLimitsX[max] for max in maxima[order]])
+    return tableData, limits
+
+
+def getDistributions(name: str) -> dict[str, float]:
+    """
+    ``getDistributions``
+    --------------------
+
+    Args:
+        - ``name`` (str): Element spectrum name, e.g. 'element_29-Cu_n-g'.
+
+    Raises:
+        FileNotFoundError: The data folder has no distribution information for ``name``.
+
+    Returns:
+        dict[str, float]: Natural abundance of each isotope of the element.
+    """
+    distributions = getSpectraManifest().distributions
+    if name not in distributions:
+        raise FileNotFoundError(f"No distribution information for {name}")
+    return dict(distributions[name])
+
+
+def _writeCsv(data: DataFrame, filepath: str, **kwargs) -> None:
+    """
+    Writes ``data`` to a temporary file beside ``filepath`` and then replaces it, so readers never see a partial table.
+    """
+    os.makedirs(path.dirname(filepath), exist_ok=True)
+    try:
+        data.to_csv(f"{filepath}.tmp", index=False, **kwargs)
+        os.replace(f"{filepath}.tmp", filepath)
+    finally:
+        if path.exists(f"{filepath}.tmp"):
+            os.remove(f"{filepath}.tmp")
+
+
+def regeneratePeakTables(name: str, threshold: float, outputDir: str) -> tuple[str, int, float, str]:
+    """
+    ``regeneratePeakTables``
+    ------------------------
+
+    Recalculates and writes the peak information and peak limit tables of a spectrum. A spectrum without peaks has
+    its peak limits removed.
+
+    The limits are those ``SpectraData.definePeaks`` finds for the peaks detected at ``threshold``, as the GUI
+    calculates for a spectrum without stored limits. The shipped tables were made by the original NRCA analysis code
+    from its own set of peaks, the limits of a peak depending on its neighbours, so regenerated limits, widths and
+    their ranks differ from the shipped ones where the peaks found differ, e.g. 29-Cu-63_n-g and 92-U-238_n-g.
+
+    Args:
+        - ``name`` (str): Spectrum name, e.g. '29-Cu-63_n-g'.
+
+        - ``threshold`` (float): Threshold for peak detection.
+
+        - ``outputDir`` (str): Data folder to write to.
+
+    Returns:
+        tuple[str, int, float, str]: Name, number of peaks, time taken in seconds and the error raised, None if the
+        tables were written.
+    """
+    start = time.perf_counter()
+    try:
+        with np.errstate(all="ignore"):
+            tableData, limits = calculatePeakTables(name, threshold)
+        _writeCsv(tableData, f"{outputDir}Peak information/{name}.csv", float_format="%.3e")
+        limitsFilepath = f"{outputDir}Peak Limit Information/{name}.csv"
+        if limits is not None:
+            _writeCsv(limits, limitsFilepath, header=False)
+        elif "element" not in name and path.exists(limitsFilepath):
+            os.remove(limitsFilepath)
+    except Exception as error:
+        return name, 0, time.perf_counter() - start, f"{type(error).__name__}: {error}"
+    return name, len(tableData), time.perf_counter() - start, None
+
+
+def regenerateAll(outputDir: str, names: list[str] = None, processes: int = None,
+                  thresholds: dict[str, tuple[float, float]] = None) -> list[tuple[str, int, float, str]]:
+    """
+    ``regenerateAll``
+    -----------------
+
+    Regenerates the peak tables of many spectra in parallel across processes, printing the result of each as it
+    completes.
+
+    Args:
+        - ``outputDir`` (str): Data folder to write to.
+
+        - ``names`` (list[str], optional): Spectrum names. Defaults to None, every spectrum in the graph data library.
+
+        - ``processes`` (int, optional): Number of worker processes. Defaults to None, one per core.
+
+        - ``thresholds`` (dict[str, tuple[float, float]], optional): Thresholds given by ``readThresholds``. Defaults
+        to None, those of the manifest.
+
+    Returns:
+        list[tuple[str, int, float, str]]: Result of each spectrum as given by ``regeneratePeakTables``, in the order
+        of ``names``.
+    """
+    if names is None:
+        names = getSpectraManifest().spectraNames
+    thresholds = getSpectraManifest().thresholds if thresholds is None else thresholds
+    results = {}
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = {executor.submit(regeneratePeakTables, name, getThreshold(name, thresholds), outputDir): name
+                   for name in names}
+        for i, future in enumerate(as_completed(futures)):
+            try:
+                name, numPeaks, seconds, error = future.result()
+            except Exception as workerError:
+                # The worker itself failed, e.g. it was killed.
+                name, numPeaks, seconds, error = futures[future], 0, 0.0, f"{type(workerError).__name__}: {workerError}"
+            results[name] = (name, numPeaks, seconds, error)
+            status = f"{numPeaks} peaks" if error is None else f"failed, {error}"
+            print(f"[{i + 1}/{len(names)}] {name}: {status} in {seconds:.2f}s", flush=True)
+    return [results[name] for name in names]
+
+
+def main(args: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Regenerates the Peak information and Peak Limit Information tables "
+                                                 "of the library spectra.")
+    parser.add_argument("names", nargs="*", help="Spectrum names, all spectra if omitted.")
+    parser.add_argument("-p", "--processes", type=int, default=None, help="Worker processes, one per core if omitted.")
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("-o", "--output", help="Data folder to write the tables to.")
+    output.add_argument("--in-place", action="store_true",
+                        help="Overwrite the tables of the data folder, repacking the spectra store.")
+    args = parser.parse_args(args)
+    outputDir = dataDir if args.in_place else path.join(args.output, "")
+
+    start = time.perf_counter()
+    results = regenerateAll(outputDir, args.names or None, args.processes)
+    failed = [name for name, _, _, error in results if error is not None]
+    seconds = np.array([result[2] for result in results])
+    print(f"Regenerated {len(results) - len(failed)} of {len(results)} spectra in {time.perf_counter() - start:.1f}s "
+          f"({seconds.sum():.1f}s across workers, slowest {seconds.max(initial=0):.2f}s)")
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+    if path.abspath(outputDir) == path.abspath(dataDir) and path.exists(storeFilepath):
+        store = SpectraStore.build()
+        print(f"Repacked {len(store.graphNames)} spectra into {store.filepath}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
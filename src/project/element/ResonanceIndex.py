@@ -0,0 +1,320 @@
+from __future__ import annotations
+import io
+import re
+
+import numpy as np
+from numpy import ndarray
+import pandas
+from pandas import DataFrame
+
+from element.SpectraStore import _listCsv, dataDir, getSpectraStore
+
+# One record per peak of the library, ``spectrum`` indexing ``ResonanceIndex.spectra``.
+resonanceDtype = np.dtype([
+    ("energy", np.float64),
+    ("tof", np.float64),
+    ("integral", np.float64),
+    ("width", np.float64),
+    ("height", np.float64),
+    ("spectrum", np.int32),
+])
+
+# Columns of the peak information tables read into each record.
+resonanceColumns = {"Energy (eV)": "energy", "TOF (us)": "tof", "Integral": "integral", "Peak Width": "width",
+                    "Peak Height": "height"}
+
+# Default tolerances of ``ResonanceIndex.match``, relative for energies and the maximum in us for times of flight, as
+# the 'max_match' of definePeaks.
+maxMatch = 3.5
+energyMatch = 0.01
+
+_number = r"[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?"
+_queryPattern = re.compile(rf"\s*({_number})\s*(?:(?:-|:|to)\s*({_number})|(?:\+-|\+/-|±)\s*({_number}))?\s*")
+
+
+class ResonanceIndex:
+    """
+    Memory-resident index of every peak in the peak information tables of the library, answering which spectra have
+    a resonance at or near a given energy or time of flight. The peaks are held in a structured array sorted by
+    energy, alongside contiguous copies of the sorted energies and times of flight, so each range query is a pair of
+    binary searches.
+    """
+
+    peaks: ndarray
+    spectra: list[str]
+
+    def __init__(self, peaks: ndarray, spectra: list[str]) -> None:
+        """
+        Args:
+            - ``peaks`` (ndarray): Records of ``resonanceDtype``, in any order.
+
+            - ``spectra`` (list[str]): Spectrum name of each index in the ``spectrum`` field.
+        """
+        self.peaks = peaks[np.argsort(peaks["energy"], kind="stable")]
+        self.spectra = spectra
+        self._energy = np.ascontiguousarray(self.peaks["energy"])
+        self._tofOrder = np.argsort(self.peaks["tof"], kind="stable")
+        self._tof = np.ascontiguousarray(self.peaks["tof"][self._tofOrder])
+        self._modes = np.array([name.rpartition("_")[2] for name in spectra] or [""])
+
+    @classmethod
+    def build(cls, includeElements: bool = False, dataDir: str = dataDir) -> ResonanceIndex:
+        """
+        ``build``
+        ---------
+
+        Reads the peak information tables of the library spectra from the spectra store, or the data folder if it has
+        not been built, into a new index. The tables are joined and parsed as a single csv, each row prefixed with the
+        index of its spectrum.
+
+        Args:
+            - ``includeElements`` (bool, optional): Whether to index the peaks of the element spectra, which repeat
+            those of their isotopes. Defaults to False.
+
+            - ``dataDir`` (str, optional): Data folder read when the store is unavailable. Defaults to ``dataDir``.
+
+        Returns:
+            ResonanceIndex: The index.
+        """
+        store = getSpectraStore()
+        if store is not None:
+            names, library = list(store.index["peakInformation"].keys()), set(store.graphNames)
+        else:
+            names, library = _listCsv(f"{dataDir}Peak information/"), set(_listCsv(f"{dataDir}Graph Data/"))
+        spectra, header, rows = [], None, []
+        for name in names:
+            # Tables left from spectra no longer in the library are skipped.
+            if name not in library or (not includeElements and name.startswith("element")):
+                continue
+            if store is not None:
+                csv = store.getPeakInformationCsv(name)
+            else:
+                with open(f"{dataDir}Peak information/{name}.csv", "rb") as file:
+                    csv = file.read()
+            lines = [line for line in csv.splitlines() if line.strip()]
+            if len(lines) < 2:
+                continue
+            header = header or lines[0]
+            prefix = b"%d," % len(spectra)
+            rows += [prefix + line for line in lines[1:]]
+            spectra.append(name)
+
+        peaks = np.empty(len(rows), dtype=resonanceDtype)
+        if rows:
+            columns = ["spectrum", *header.decode("utf-8").split(",")]
+            table = pandas.read_csv(io.BytesIO(b"\n".join(rows)), header=None, names=columns,
+                                    usecols=["spectrum", *resonanceColumns])
+            for column, field in [("spectrum", "spectrum"), *resonanceColumns.items()]:
+                peaks[field] = pandas.to_numeric(table[column], errors="coerce").to_numpy()
+            peaks = peaks[~np.isnan(peaks["energy"])]
+        return cls(peaks, spectra)
+
+    def __len__(self) -> int:
+        return self.peaks.size
+
+    def _filter(self, peaks: ndarray, mode: str | None) -> ndarray:
+        return peaks if mode is None else peaks[self._modes[peaks["spectrum"]] == mode]
+
+    def query(self, low: float, high: float, tof: bool = False, mode: str = None) -> ndarray:
+        """
+        ``query``
+        ---------
+
+        Args:
+            - ``low`` (float): Lower bound of the range, inclusive.
+
+            - ``high`` (float): Upper bound of the range, inclusive.
+
+            - ``tof`` (bool, optional): Whether the range is of time of flight (us) rather than energy (eV).
+            Defaults to False.
+
+            - ``mode`` (str, optional): Only peaks of spectra in this mode, 'n-g' or 'n-tot'. Defaults to None.
+
+        Returns:
+            ndarray: Records of the peaks in the range, in ascending order of energy or time of flight.
+        """
+        keys = self._tof if tof else self._energy
+        start, stop = np.searchsorted(keys, low, side="left"), np.searchsorted(keys, high, side="right")
+        peaks = self.peaks[self._tofOrder[start:stop]] if tof else self.peaks[start:stop]
+        return self._filter(peaks, mode)
+
+    def queryNearest(self, low: float, high: float, tof: bool = False, mode: str = None) -> ndarray:
+        """
+        ``queryNearest``
+        ----------------
+
+        As ``query``, ordering the peaks by their distance from the centre of the range.
+
+        Returns:
+            ndarray: Records of the peaks in the range, nearest the centre first.
+        """
+        peaks = self.query(low, high, tof, mode)
+        return peaks[np.argsort(np.abs(peaks["tof" if tof else "energy"] - (low + high) / 2), kind="stable")]
+
+    def near(self, x: float, tolerance: float = 0.01, tof: bool = False, mode: str = None) -> ndarray:
+        """
+        ``near``
+        --------
+
+        Args:
+            - ``x`` (float): Energy (eV) or time of flight (us) of the resonance.
+
+            - ``tolerance`` (float, optional): Relative distance from ``x`` to search. Defaults to 0.01.
+
+            - ``tof`` (bool, optional): Whether ``x`` is a time of flight. Defaults to False.
+
+            - ``mode`` (str, optional): Only peaks of spectra in this mode, 'n-g' or 'n-tot'. Defaults to None.
+
+        Returns:
+            ndarray: Records of the peaks within the tolerance of ``x``, nearest first.
+        """
+        return self.queryNearest(x * (1 - tolerance), x * (1 + tolerance), tof, mode)
+
+    def match(self, x: ndarray, tolerance: float = None, tof: bool = False, mode: str = None) -> DataFrame:
+        """
+        ``match``
+        ---------
+
+        Matches the peaks of a measured spectrum against those of every isotope in a single pass, ranking the
+        isotopes which best explain them. The window of each measured peak is located in the sorted library by binary
+        search and each pair of measured and library peak weighted from 1 at the measured peak to 0 at the edge of its
+        window. Every peak, measured or library, counts once per isotope with its best weight.
+
+        An isotope scores the product of the weighted fraction of the measured peaks it matches and the weighted
+        fraction of its own peaks within the measured range which are matched, so an isotope with many resonances
+        matching by chance ranks below one with few resonances all of which are found.
+
+        Args:
+            - ``x`` (ndarray): Energies (eV) or times of flight (us) of the measured peaks, e.g. the maxima of an
+            imported spectra.
+
+            - ``tolerance`` (float, optional): Distance from each measured peak to search, relative for energies and
+            the maximum in us for times of flight, the distance otherwise being the equivalent of ``energyMatch``.
+            Defaults to None, ``energyMatch`` or ``maxMatch`` respectively.
+
+            - ``tof`` (bool, optional): Whether ``x`` are times of flight. Defaults to False.
+
+            - ``mode`` (str, optional): Only isotopes in this mode, 'n-g' or 'n-tot'. Defaults to None.
+
+        Returns:
+            DataFrame: Isotope, Mode, number of its peaks matched, number of its peaks within the measured range and
+            score of each isotope matching a peak, best first.
+        """
+        columns = ["Isotope", "Mode", "Matched Peaks", "Library Peaks", "Score"]
+        x = np.unique(np.asarray(x, dtype=np.float64))
+        x = x[np.isfinite(x)]
+        if x.size == 0 or len(self) == 0:
+            return DataFrame(columns=columns)
+        if tolerance is None:
+            tolerance = maxMatch if tof else energyMatch
+        if tof:
+            # Time of flight goes as the inverse square root of energy, so half the relative energy tolerance.
+            halfWidth = np.minimum(tolerance, x * energyMatch / 2)
+        else:
+            halfWidth = x * tolerance
+        low, high = x - halfWidth, x + halfWidth
+        keys = self._tof if tof else self._energy
+        start, stop = np.searchsorted(keys, low, side="left"), np.searchsorted(keys, high, side="right")
+
+        # Every (measured peak, library peak) pair within the windows.
+        counts = stop - start
+        measured = np.repeat(np.arange(x.size), counts)
+        positions = np.arange(counts.sum()) + np.repeat(start - (np.cumsum(counts) - counts), counts)
+        peaks = self.peaks[self._tofOrder[positions]] if tof else self.peaks[positions]
+        spectrum = peaks["spectrum"]
+        weight = 1 - np.abs(keys[positions] - x[measured]) / halfWidth[measured]
+        if mode is not None:
+            inMode = self._modes[spectrum] == mode
+            measured, positions = measured[inMode], positions[inMode]
+            spectrum, weight = spectrum[inMode], weight[inMode]
+
+        def bestWeights(key: ndarray) -> tuple[ndarray, ndarray]:
+            # Number of distinct keys of each isotope and the sum of their best weights.
+            order = np.lexsort((-weight, key))
+            best = order[np.r_[True, key[order][1:] != key[order][:-1]]] if order.size else order
+            return np.bincount(spectrum[best], minlength=len(self.spectra)), \
+                np.bincount(spectrum[best], weights=weight[best], minlength=len(self.spectra))
+
+        # Each measured peak and each library peak counts once per isotope, with its best weight.
+        _, measuredWeight = bestWeights(measured.astype(np.int64) * len(self.spectra) + spectrum)
+        matched, libraryWeight = bestWeights(positions)
+
+        # Library peaks of each isotope within the measured range.
+        inRange = self.query(low[0], high[-1], tof, mode)
+        libraryPeaks = np.bincount(inRange["spectrum"], minlength=len(self.spectra))
+
+        candidates = np.flatnonzero(matched)
+        score = measuredWeight[candidates] / x.size * libraryWeight[candidates] / libraryPeaks[candidates]
+        order = np.argsort(-score, kind="stable")
+        candidates, score = candidates[order], score[order]
+        names = [self.spectra[i].rpartition("_") for i in candidates]
+        return DataFrame({"Isotope": [name[0] for name in names],
+                          "Mode": [name[2] for name in names],
+                          "Matched Peaks": matched[candidates],
+                          "Library Peaks": libraryPeaks[candidates],
+                          "Score": score}, columns=columns)
+
+    def toDataFrame(self, peaks: ndarray) -> DataFrame:
+        """
+        ``toDataFrame``
+        ---------------
+
+        Args:
+            - ``peaks`` (ndarray): Records returned by a query.
+
+        Returns:
+            DataFrame: Table of the peaks, with the isotope and mode of each split from its spectrum name.
+        """
+        names = [self.spectra[i].rpartition("_") for i in peaks["spectrum"]]
+        return DataFrame({"Isotope": [name[0] for name in names],
+                          "Mode": [name[2] for name in names],
+                          **{column: peaks[field] for column, field in resonanceColumns.items()}})
+
+
+def parseEnergyQuery(text: str, tolerance: float = 0.01) -> tuple[float, float]:
+    """
+    ``parseEnergyQuery``
+    --------------------
+
+    Parses a search for resonances, either a single value searched within a relative ``tolerance`` ('6.67'), a range
+    ('6.6-6.8', '6.6:6.8' or '6.6 to 6.8') or a value and absolute tolerance ('6.67+-0.05' or '6.67±0.05').
+
+    Args:
+        - ``text`` (str): The search.
+
+        - ``tolerance`` (float, optional): Relative tolerance of a single value. Defaults to 0.01.
+
+    Raises:
+        ValueError: ``text`` is not a search.
+
+    Returns:
+        tuple[float, float]: Lower and upper bounds of the range searched.
+    """
+    match = _queryPattern.fullmatch(text)
+    if match is None:
+        raise ValueError(f"'{text}' is not a value, range or value+-tolerance")
+    value, high, absolute = match.groups()
+    value = float(value)
+    if high is not None:
+        return min(value, float(high)), max(value, float(high))
+    if absolute is not None:
+        return value - float(absolute), value + float(absolute)
+    return value * (1 - tolerance), value * (1 + tolerance)
+
+
+_resonanceIndex: list[ResonanceIndex] = []
+
+
+def getResonanceIndex() -> ResonanceIndex:
+    """
+    ``getResonanceIndex``
+    ---------------------
+
+    Builds the shared index of the library's isotope peaks once per process, see ``ResonanceIndex.build``.
+
+    Returns:
+        ResonanceIndex: The index.
+    """
+    if not _resonanceIndex:
+        _resonanceIndex.append(ResonanceIndex.build())
+    return _resonanceIndex[0]
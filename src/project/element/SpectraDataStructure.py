@@ -1,20 +1,27 @@
 from __future__ import annotations
+from copy import copy
 import numpy as np
 from numpy import ndarray
 from os import path
 import pandas
 from pandas import DataFrame
+import scipy as sp
 
+from element.GraphArray import GraphArray
+from element.IntegralIndex import IntegralIndex
+from element.IsotopeBasis import IsotopeBasis, getIsotopeBasis
+from element.IsotopeCache import getIsotopeCache
 from element.PeakDetection import PeakDetector
+from element.SpectraStore import getSpectraStore
+from helpers.broadening import getBroadened, getMassNumber
+from helpers.conversion import energyToTOF, getTOFAxis
 from helpers.getSpacedElements import getSpacedElements
 from helpers.fitBoxes import fitBoxes
-from helpers.getIndex import getIndex
 from helpers.integration import integrate_simps
-from helpers.nearestNumber import nearestnumber
+from helpers.nearestNumber import nearestnumbers
 from helpers.smooth import smooth
 
-dataFilepath = f"{path.dirname(path.dirname(__file__))}\\data\\Graph Data\\"
-peakLimitFilepath = f"{path.dirname(path.dirname(__file__))}\\data\\Peak Limit Information\\"
+peakLimitFilepath = f"{path.dirname(path.dirname(__file__))}/data/Peak Limit Information/"
 
 
 class SpectraData:
@@ -27,7 +34,8 @@ class SpectraData:
     numPeaks: int
     maxPeaks: int = 50
     tableData: DataFrame
-    graphData: DataFrame
+    # Graph data of the spectra, see ``graphData`` for its DataFrame view.
+    graphArray: GraphArray = None
     distributions: dict
     defaultDist: dict
     graphColour: tuple
@@ -58,6 +66,16 @@ class SpectraData:
     isMinDrawn: bool = False
     isToF: bool = False
 
+    _integralIndex: tuple[GraphArray, IntegralIndex | None] = (None, None)
+    # Basis and weight vector of the isotopes combined into the graph data by ``onDistChange``.
+    _isotopeBasis: IsotopeBasis = None
+    _basisWeights: ndarray = None
+    _indexPosDer: int = None
+    # Peaks and minima at any threshold, limits and integrals found for the graph data, see ``_getPeakCache``.
+    _peakCache: dict = None
+    # Energy view whose analysis a time of flight view presents, see ``asView``.
+    _energySpectra: SpectraData = None
+
     def __init__(self,
                  name: str,
                  numPeaks: int,
@@ -74,7 +92,8 @@ class SpectraData:
                  isImported: bool = False) -> None:
 
         self.name = name
-        self.plotType = 'n-tot' if 't' in self.name else 'n-g'
+        mode = self.name.rpartition('_')[2]
+        self.plotType = mode if mode in ['n-g', 'n-tot'] else 'n-g'
         self.numPeaks = numPeaks
         self.isToF = isToF
         self.distributions = distributions
@@ -89,6 +108,17 @@ class SpectraData:
         self.threshold = threshold
         self.length = length
         self.isImported = isImported
+        if self.isToF:
+            # The spectrum is analysed on the energy axis and presented on the time of flight axis, so that an energy
+            # view of the same spectrum can share the analysis.
+            self.graphColour = graphColour
+            if self.length is None:
+                self.length = {"n-g": 22.804, "n-tot": 23.404}
+            self._energySpectra = SpectraData(name, numPeaks, tableData, graphData, graphColour, False, distributions,
+                                              defaultDist, isCompound, isAnnotationsHidden, threshold, length,
+                                              isImported)
+            self._updateFromEnergy()
+            return
         pd = PeakDetector()
 
         self.tableData = tableData
@@ -102,42 +132,38 @@ class SpectraData:
             self.onDistChange()
             self.updatePeaks()
 
-        if self.graphData is None:
-            self.graphData = DataFrame()
-
         self.graphColour = graphColour
 
         if self.length is None:
             self.length = {"n-g": 22.804, "n-tot": 23.404}
 
-        if self.isToF and not self.graphData.empty:
-            graphData[0] = self.energyToTOF(graphData[0], length=self.length)
-            graphData.sort_values(0, ignore_index=True, inplace=True)
         try:
-            if not self.graphData.empty and not self.isDistAltered:
-                self.maxima = np.array(pd.maxima(graphData, threshold))
+            if not self.graphArray.empty and not self.isDistAltered:
+                self.maxima = np.array(pd.maxima(self.graphArray, threshold))
 
-                self.minima = np.array(pd.minima(graphData))
+                self.minima = np.array(pd.minima(self.graphArray))
         except AttributeError:
             # Case when creating compounds, -> requires use of setGraphDataFromDist before plotting.
             pass
         try:
             name = self.name[8:] if 'element' in self.name else self.name
-            limits = pandas.read_csv(f"{peakLimitFilepath}{name}.csv", names=['left', 'right'])
-            if self.isToF:
-                limits['left'] = self.energyToTOF(limits['left'], self.length)
-                limits['right'] = self.energyToTOF(limits['right'], self.length)
-                limits['left'], limits['right'] = limits['right'], limits['left']
-
-            for max in self.maxima[0]:
-                lim = limits[(limits['left'] < max) & (limits['right'] > max)]
-                if lim.empty:
-                    continue
-                self.maxPeakLimitsX[max] = (lim['left'].iloc[0], lim['right'].iloc[0])
-                leftLimit = nearestnumber(graphData[0], lim['left'].iloc[0])
-                rightLimit = nearestnumber(graphData[0], lim['right'].iloc[0])
-                self.maxPeakLimitsY[max] = (graphData[graphData[0] == leftLimit].iloc[0, 1],
-                                            graphData[graphData[0] == rightLimit].iloc[0, 1])
+            store = getSpectraStore()
+            if store is not None and store.hasPeakLimits(name):
+                limits = store.getPeakLimits(name)
+            else:
+                limits = pandas.read_csv(f"{peakLimitFilepath}{name}.csv", names=['left', 'right'])
+
+            # Each maximum takes the first stored limits enclosing it, their y-coords being those of the nearest points.
+            left, right = limits['left'].to_numpy(), limits['right'].to_numpy()
+            for start in range(0, self.maxima[0].size, 1024):
+                maxima = self.maxima[0][start:start + 1024]
+                enclosing = (left < maxima[:, None]) & (right > maxima[:, None])
+                found = enclosing.any(axis=1)
+                rows = np.argmax(enclosing, axis=1)[found]
+                leftY = self.graphArray.y[self.graphArray.nearestIndexes(left[rows])]
+                rightY = self.graphArray.y[self.graphArray.nearestIndexes(right[rows])]
+                self.maxPeakLimitsX.update(zip(maxima[found], zip(left[rows], right[rows])))
+                self.maxPeakLimitsY.update(zip(maxima[found], zip(leftY, rightY)))
 
         except ValueError:
             # Catches invalid maximas produced by scipy.signal.find_peaks
@@ -151,6 +177,29 @@ class SpectraData:
         if self.numPeaks is None:
             self.numPeaks = None if self.maxima is None else len(self.maxima[0])
 
+    @property
+    def graphData(self) -> DataFrame:
+        """
+        DataFrame view of ``graphArray``, x-coords in column 0 and y-coords in column 1, for csv output and plotting.
+        Assigning a DataFrame or GraphArray replaces the graph data, the view itself should not be edited in place.
+
+        Returns:
+            DataFrame: Graph data of the spectra.
+        """
+        return self.graphArray.frame
+
+    @graphData.setter
+    def graphData(self, graphData: DataFrame | GraphArray | None) -> None:
+        self.graphArray = GraphArray.fromGraphData(graphData)
+
+    @property
+    def energyGraphArray(self) -> GraphArray:
+        """
+        Returns:
+            GraphArray: Graph data on the energy axis, that of the analysed energy spectrum for time of flight views.
+        """
+        return self.graphArray if self._energySpectra is None else self._energySpectra.graphArray
+
     def __eq__(self, other) -> bool:
         """
         Returns whether or not a SpectraData instance is equal to another, based on its name TOF state and graph data. 
@@ -163,7 +212,9 @@ class SpectraData:
             bool: Whether or not the two SpectraData Objects are equal.
         """
         if isinstance(other, SpectraData):
-            ck = self.name == other.name and self.isToF == other.isToF and self.graphData == other.graphData
+            ck = self.name == other.name and self.isToF == other.isToF and \
+                np.array_equal(self.graphArray.x, other.graphArray.x) and \
+                np.array_equal(self.graphArray.y, other.graphArray.y)
             return ck
         return False
 
@@ -178,12 +229,83 @@ class SpectraData:
             bool: Whether or not two instances are not equal to one another.
         """
         if isinstance(other, SpectraData):
-            return self.name != other.name or self.isToF != other.isToF or self.graphData != other.graphData
+            return not self == other
         return True
 
+    def asView(self, isToF: bool, graphColour: tuple = None, isAnnotationsHidden: bool = False) -> SpectraData:
+        """
+        ``asView``
+        ----------
+
+        Returns an undrawn view of the spectrum on the energy or time of flight axis sharing the analysis of this
+        instance, its graph data, peaks, limits and table data of integrals, instead of reading and analysing the
+        spectrum again. Later changes to the threshold or distribution of either view apply only to that view.
+
+        Args:
+            - ``isToF`` (bool): Whether the view is on the time of flight axis.
+
+            - ``graphColour`` (tuple, optional): Colour of the view's graph. Defaults to None.
+
+            - ``isAnnotationsHidden`` (bool, optional): Whether the view's peak annotations are hidden. Defaults to
+            False.
+
+        Returns:
+            SpectraData: The view.
+        """
+        view = copy(self._energySpectra if self.isToF else self)
+        view.graphColour = graphColour
+        view.isAnnotationsHidden = isAnnotationsHidden
+        view.annotationsOrder = {}
+        view.maxPeakLimitsX = dict(view.maxPeakLimitsX)
+        view.maxPeakLimitsY = dict(view.maxPeakLimitsY)
+        for flag in ["isAnnotationsDrawn", "isGraphDrawn", "isGraphHidden", "isGraphUpdating", "isMaxDrawn",
+                     "isMinDrawn"]:
+            setattr(view, flag, False)
+        if isToF:
+            view._energySpectra = copy(view)
+            view.isToF = True
+            view._updateFromEnergy()
+        view.annotations = []
+        return view
+
+    def _updateFromEnergy(self) -> None:
+        """
+        ``_updateFromEnergy``
+        ---------------------
+
+        Presents the analysis of ``_energySpectra`` on the time of flight axis. The graph data is the reversed energy
+        y-coords against the reversed, cached time of flight axis, the x-coords of the peaks and limits are converted,
+        and the table data is shared.
+        """
+        energySpectra = self._energySpectra
+        self.graphArray = energySpectra.graphArray
+        if not self.graphArray.empty:
+            self.graphArray = self.graphArray.withX(
+                getTOFAxis(self.name, self.graphArray.x, self.length[self.plotType]))
+
+        def toTOF(points: ndarray | None) -> ndarray | None:
+            # Points in ascending order of energy are in descending order of time of flight.
+            return None if points is None else np.array([self.energyToTOF(points[0][::-1]), points[1][::-1]])
+
+        self.maxima = toTOF(energySpectra.maxima)
+        self.minima = toTOF(energySpectra.minima)
+        # The left limit of a peak in energy is its right limit in time of flight.
+        maxima = self.energyToTOF(np.array(list(energySpectra.maxPeakLimitsX.keys()), dtype=np.float64))
+        limits = self.energyToTOF(np.array(list(energySpectra.maxPeakLimitsX.values()), dtype=np.float64))
+        self.maxPeakLimitsX = {max: (right, left) for max, (left, right) in zip(maxima, limits.reshape(-1, 2))}
+        maxima = self.energyToTOF(np.array(list(energySpectra.maxPeakLimitsY.keys()), dtype=np.float64))
+        limits = energySpectra.maxPeakLimitsY.values()
+        self.maxPeakLimitsY = {max: (right, left) for max, (left, right) in zip(maxima, limits)}
+
+        self.tableData = energySpectra.tableData
+        self.numPeaks = energySpectra.numPeaks
+        self.threshold = energySpectra.threshold
+        self.distributions = energySpectra.distributions
+        self.isDistAltered = energySpectra.isDistAltered
+
     def energyToTOF(self,
                     xData: float | list[float],
-                    length: dict[float] = {"n-g": 22.804, "n-tot": 23.404}) -> list[float]:
+                    length: dict[float] = {"n-g": 22.804, "n-tot": 23.404}) -> ndarray:
         """
         Maps all X Values from energy to TOF
 
@@ -191,20 +313,11 @@ class SpectraData:
             - ``xData`` (list[float]): List of the substances x-coords of its graph data
 
         Returns:
-            list[float]: Mapped x-coords
+            ndarray: Mapped x-coords
         """
         if self.length is not None:
             length = self.length
-        neutronMass = float(1.68e-27)
-        electronCharge = float(1.60e-19)
-
-        tofX = list(
-            map(
-                lambda x: length[self.plotType] * 1e6 * (0.5 * neutronMass / (x * electronCharge)) ** 0.5,
-                xData
-            )
-        )
-        return tofX
+        return energyToTOF(xData, length[self.plotType])
 
     def e2TOF(self, xData: float, length: dict[float] = {"n-g": 22.804, "n-tot": 23.404}) -> float:
         """
@@ -221,10 +334,71 @@ class SpectraData:
         """
         if self.length is not None:
             length = self.length
-        neutronMass = float(1.68e-27)
-        electronCharge = float(1.60e-19)
+        return energyToTOF(xData, length[self.plotType])
+
+    def getCrossSection(self, mode: str) -> ndarray:
+        """
+        ``getCrossSection``
+        -------------------
+
+        Cross-section of the isotope, element or compound of the spectra in either mode at the energies of its graph
+        data, the other mode being combined from the library spectra with the same distribution.
+
+        Args:
+            mode (str): 'n-tot' for the total or 'n-g' for the capture cross-section.
+
+        Raises:
+            ValueError: The spectra is imported, so has no counterpart in the other mode.
+            FileNotFoundError: The library has no spectrum of the isotope or element in ``mode``.
+
+        Returns:
+            ndarray: Cross-section (b) at each x-coord of ``energyGraphArray``.
+        """
+        graphArray = self.energyGraphArray
+        base, _, ownMode = self.name.rpartition('_')
+        if mode == ownMode:
+            return graphArray.y
+        if self.isImported:
+            raise ValueError(f"{self.name} is imported, its {mode} cross-section is unknown")
+        if self.isCompound or (self.isDistAltered and self.distributions):
+            # Compounds are weighted by element spectrum name, elements by isotope name.
+            weights = {f"{name.rpartition('_')[0] if self.isCompound else name}_{mode}": dist
+                       for name, dist in self.distributions.items() if dist != 0}
+            basis = getIsotopeBasis(list(weights.keys()))
+            return np.interp(graphArray.x, basis.x, basis.weights(weights) @ basis.matrix)
+        array = getIsotopeCache().getArray(f"{base}_{mode}")
+        return np.interp(graphArray.x, array[0], array[1])
+
+    def getBroadened(self, timeResolution: float = 0, lengthResolution: float = 0,
+                     temperature: float = 0) -> ndarray:
+        """
+        ``getBroadened``
+        ----------------
 
-        return length[self.plotType] * 1e6 * (0.5 * neutronMass / (xData * electronCharge)) ** 0.5
+        Broadened y-coords of the spectra, see ``helpers.broadening.broaden``, cached per spectrum, flight length and
+        resolution. Doppler broadening takes the mass of the isotope, or the weighted mass of the isotopes of an
+        element, so is not applied to compounds or imported spectra.
+
+        Args:
+            - ``timeResolution`` (float, optional): Standard deviation of the time of flight (us). Defaults to 0.
+
+            - ``lengthResolution`` (float, optional): Standard deviation of the flight path length (m). Defaults to 0.
+
+            - ``temperature`` (float, optional): Temperature of the sample (K). Defaults to 0, no Doppler broadening.
+
+        Returns:
+            ndarray: Broadened y-coord at each x-coord of ``graphArray``, read-only.
+        """
+        graphArray = self.energyGraphArray
+        if graphArray.empty:
+            return self.graphArray.y
+        mass = None
+        if temperature > 0 and not self.isCompound and not self.isImported:
+            mass = getMassNumber(self.name, self.distributions)
+        broadened = getBroadened(self.name, graphArray.x, graphArray.y, self.length[self.plotType],
+                                 timeResolution, lengthResolution, temperature, mass)
+        # Times of flight are the energies reversed.
+        return broadened[::-1] if self.isToF else broadened
 
     def onDistChange(self) -> None:
         """
@@ -232,17 +406,90 @@ class SpectraData:
         ----------------
 
         Will retrieve an elements corresponding isotope graphData appling the weights specified in
-        the menu.
+        the menu. The isotopes are combined through their shared basis, so only the first distribution with a given
+        set of isotopes interpolates them.
         """
         if not self.isDistAltered and not ('element' in self.name or 'compound' in self.name):
             return
-        plotType = "n-tot" if 't' in self.name else "n-g"
-        self.weightedIsoGraphData = {name: pandas.read_csv(
-            f"""{dataFilepath}{name}_{plotType}.csv""",
-            names=['x', 'y'],
-            header=None) * [1, dist]
-            for name, dist in self.distributions.items() if dist != 0}
-        self.setGraphDataFromDist(self.weightedIsoGraphData.values())
+        plotType = self.name.split('_')[-1]
+        distributions = {f"{name}_{plotType}": dist for name, dist in self.distributions.items() if dist != 0}
+        basis = getIsotopeBasis(list(distributions.keys()))
+        self.graphDataX = basis.x
+        self._isotopeBasis = basis
+        self._basisWeights = basis.weights(distributions)
+        self.graphData = basis.combine(self._basisWeights)
+
+    def updateDistribution(self, distributions: dict, tolerance: float = 1e-3) -> bool:
+        """
+        ``updateDistribution``
+        ----------------------
+
+        Applies a new distribution, as setting ``distributions`` then calling ``onDistChange`` and ``updatePeaks``
+        would. When the graph data was combined by ``onDistChange`` from the same isotopes, the change in weight of
+        each isotope is added to the existing y-coords instead, and only the peaks and limits near points whose
+        y-coords changed by more than ``tolerance`` times their new value are detected again.
+
+        Args:
+            distributions (dict): New weight of each isotope.
+            tolerance (float, optional): Relative change below which a point is considered unchanged. Defaults to 1e-3.
+
+        Returns:
+            bool: True if the graph data was updated incrementally, False if it was recalculated.
+        """
+        if self._energySpectra is not None:
+            isIncremental = self._energySpectra.updateDistribution(distributions, tolerance)
+            self._updateFromEnergy()
+            return isIncremental
+        plotType = self.name.split('_')[-1]
+        weights = {f"{name}_{plotType}": dist for name, dist in distributions.items() if dist != 0}
+        basis = self._isotopeBasis
+        isIncremental = basis is not None and self.maxima is not None and set(weights).issubset(basis.names)
+        if not isIncremental or len(self.graphArray) != basis.x.size:
+            self.distributions = distributions
+            self.isDistAltered = True
+            self.onDistChange()
+            self.updatePeaks()
+            return False
+
+        self.distributions = distributions
+        newWeights = basis.weights(weights)
+        deltaWeights = newWeights - self._basisWeights
+        self._basisWeights = newWeights
+        isotopes = np.flatnonzero(deltaWeights)
+        if isotopes.size == 0:
+            return True
+        delta = deltaWeights[isotopes] @ basis.matrix[isotopes]
+        if self.isToF:
+            # The basis is in ascending order of energy, the time of flight axis in descending order.
+            delta = delta[::-1]
+        self.graphArray = GraphArray(np.stack([self.graphArray.x, self.graphArray.y + delta]), isSorted=True)
+        x, y = self.graphArray.x, self.graphArray.y
+        changed = np.abs(delta) > tolerance * np.abs(y)
+
+        # Maxima are found from their neighbours, and their widths from 110 points around them.
+        margin = 110
+        near = sp.ndimage.maximum_filter1d(changed.astype(np.uint8), 2 * margin + 1) > 0
+        maxIndexes = np.searchsorted(x, self.maxima[0])
+        keep = ~near[maxIndexes]
+        maximaX, maximaY = [self.maxima[0][keep]], [y[maxIndexes[keep]]]
+        edges = np.diff(np.concatenate([[0], near.astype(np.int8), [0]]))
+        peakD = PeakDetector()
+        for start, end in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)):
+            low, high = max(0, start - margin), min(x.size, end + margin)
+            peaks = peakD.maxima(self.graphArray[low:high], self.threshold, structured=True)
+            peaks = peaks[(peaks["index"] + low >= start) & (peaks["index"] + low < end)]
+            maximaX.append(peaks["x"])
+            maximaY.append(peaks["y"])
+        maximaX, maximaY = np.concatenate(maximaX), np.concatenate(maximaY)
+        order = np.argsort(maximaX, kind='stable')
+        self.maxima = np.array([maximaX[order], maximaY[order]])
+        self.numPeaks = len(self.maxima[0])
+        self.definePeaks(changed)
+        self.recalculatePeakData()
+
+        # Minima prominences depend on the whole spectrum.
+        self.minima = np.array(peakD.minima(self.graphArray))
+        return True
 
     def setGraphDataFromDist(self, weightedGraphData: list[DataFrame]) -> None:
         """
@@ -261,8 +508,8 @@ class SpectraData:
         peakD = PeakDetector()
         for graphData in weightedGraphData:
 
-            graphDataX += peakD.maxima(graphData, 0)[0] if self.maxima is None else list(self.maxima[0])
-            graphDataX += peakD.minima(graphData)[0] if self.minima is None else list(self.minima[0])
+            graphDataX += list(peakD.maxima(graphData, 0)[0]) if self.maxima is None else list(self.maxima[0])
+            graphDataX += list(peakD.minima(graphData)[0]) if self.minima is None else list(self.minima[0])
             graphDataX = list(getSpacedElements(np.array(graphData.iloc[:, 0]),
                                                 graphData.shape[0] // 2)) + graphDataX
         self.graphDataX = np.unique(graphDataX)
@@ -276,7 +523,7 @@ class SpectraData:
         # isoY = np.array(p.map(self._getGraphDataFromDist, list(weightedGraphData.values()), coreCount))
         # p.close()
         # p.join()
-        self.graphData = pandas.DataFrame(sorted(zip(self.graphDataX, np.sum(isoY, axis=0))))
+        self.graphArray = GraphArray.fromXY(self.graphDataX, np.sum(isoY, axis=0))
 
     def updatePeaks(self) -> None:
         """
@@ -284,15 +531,47 @@ class SpectraData:
         ---------------
 
         Recalculates maxima coordinates and updates associated variables.
-        Used when threshold values have been altered.
+        Used when threshold values have been altered, the peaks found at every height are filtered by the threshold
+        and the limits and integrals already calculated for the same graph data are reused.
         """
-        peakD = PeakDetector()
-        self.maxima = np.array(peakD.maxima(self.graphData, self.threshold))
+        if self._energySpectra is not None:
+            self._energySpectra.threshold = self.threshold
+            self._energySpectra.updatePeaks()
+            self._updateFromEnergy()
+            return
+        peakCache = self._getPeakCache()
+        candidates = peakCache["candidates"]
+        if self.threshold is not None:
+            candidates = candidates[candidates["y"] >= self.threshold]
+        self.maxima = np.array([candidates["x"], candidates["y"]])
         self.numPeaks = len(self.maxima[0])
         self.definePeaks()
         self.recalculatePeakData()
 
-        self.minima = np.array(peakD.minima(self.graphData))
+        self.minima = peakCache["minima"].copy()
+
+    def _getPeakCache(self) -> dict:
+        """
+        ``_getPeakCache``
+        -----------------
+
+        Returns the peak cache of the instance's graph data, emptied when the graph data is replaced. Holds the
+        structured maxima found without a threshold under "candidates", the minima under "minima", the limit indexes
+        found for each (maximum index, prange) under "limits" and the integral of each limit window under "integrals".
+
+        Returns:
+            dict: Peak cache of ``self.graphArray``.
+        """
+        if self._peakCache is None or self._peakCache["graphArray"] is not self.graphArray:
+            peakD = PeakDetector()
+            self._peakCache = {
+                "graphArray": self.graphArray,
+                "candidates": peakD.maxima(self.graphArray, None, structured=True),
+                "minima": np.array(peakD.minima(self.graphArray)),
+                "limits": {},
+                "integrals": {}
+            }
+        return self._peakCache
 
     def hideAnnotations(self, globalHide: bool = False) -> None:
         """
@@ -336,22 +615,17 @@ class SpectraData:
         rankCol = "Rank by Integral" if byIntegral else "Rank by Peak Width"
         xCol = "TOF (us)" if self.isToF else "Energy (eV)"
         yCol = "Peak Height"
-        for i in range(self.numPeaks):
-            if byIntegral:
-                row = self.tableData[1:].loc[
-                    (self.tableData[rankCol][1:] == i)
-                ]
-            else:
-                row = self.tableData[1:].loc[
-                    (self.tableData[rankCol][1:] == f'({i})')
-                ]
-
-            if row.empty:
-                continue
-            else:
-                max_x = nearestnumber(self.maxima[0], row[xCol].iloc[0])
-                max_y = nearestnumber(self.maxima[1], row[yCol].iloc[0])
-            self.annotationsOrder[i] = (max_x, max_y)
+        # Row of the first peak with each rank, the first row of the table being its title.
+        firstRows = {}
+        for row, rank in enumerate(self.tableData[rankCol].to_numpy()[1:]):
+            firstRows.setdefault(rank, row)
+        ranks = [i for i in range(self.numPeaks) if (i if byIntegral else f'({i})') in firstRows]
+        if not ranks:
+            return
+        rows = [firstRows[i if byIntegral else f'({i})'] for i in ranks]
+        maxX = nearestnumbers(self.maxima[0], self.tableData[xCol].to_numpy()[1:][rows].astype(np.float64))
+        maxY = nearestnumbers(self.maxima[1], self.tableData[yCol].to_numpy()[1:][rows].astype(np.float64))
+        self.annotationsOrder.update(zip(ranks, zip(maxX, maxY)))
 
     def peakIntegral(self, leftLimit: float, rightLimit: float) -> float:
         """
@@ -368,29 +642,82 @@ class SpectraData:
         Returns:
             float: Integral Value
         """
+        return float(self.peakIntegrals(np.array([leftLimit]), np.array([rightLimit]))[0])
+
+    def peakIntegrals(self, leftLimits: ndarray, rightLimits: ndarray) -> ndarray:
+        """
+        ``peakIntegrals``
+        -----------------
+
+        Calculates the integral of every peak window in one vectorised call, as ``peakIntegral`` does for a single
+        window. For elements each isotope is fetched from the shared isotope cache once for all windows.
+
+        Args:
+            leftLimits (ndarray): X-Coords of the left limits of integration
+            rightLimits (ndarray): X-Coords of the right limits of integration
+
+        Returns:
+            ndarray: Integral of each window
+        """
+        leftLimits = np.asarray(leftLimits, dtype=np.float64)
+        rightLimits = np.asarray(rightLimits, dtype=np.float64)
         if "element" in self.name:
-            isoGraphData = {name: pandas.read_csv(f"{dataFilepath}{name}_{self.name.split('_')[-1]}.csv",
-                                                  names=['x', 'y'],
-                                                  header=None)
-                            for name, dist in self.distributions.items() if dist != 0}
+            isotopeCache = getIsotopeCache()
+            integrals = np.zeros(leftLimits.shape)
+            for name, dist in self.distributions.items():
+                if dist == 0:
+                    continue
+                spectrum = f"{name}_{self.name.split('_')[-1]}"
+                integrals += self._integrate(lambda: isotopeCache.getIntegralIndex(spectrum),
+                                             lambda: isotopeCache.getGraphData(spectrum, names=['x', 'y']),
+                                             leftLimits, rightLimits) * dist
+            return integrals
+        return self._integrate(self.getIntegralIndex, lambda: self.graphData, leftLimits, rightLimits)
+
+    @staticmethod
+    def _integrate(getIndex, getGraphData, leftLimits: ndarray, rightLimits: ndarray) -> ndarray:
+        """
+        Integrates each window using the integral index given by ``getIndex``, falling back to ``integrate_simps`` on
+        the graph data given by ``getGraphData`` when the x-coords are not in ascending order.
+        """
+        try:
+            index = getIndex()
+        except ValueError:
+            graphData = getGraphData()
+            return np.array([integrate_simps(graphData, left, right) for left, right in zip(leftLimits, rightLimits)])
+        return index.integrate(leftLimits, rightLimits)
 
-            integrals = []
-            for name, graphData in isoGraphData.items():
-                # regionGraphData = graphData[(graphData['x'] >= leftLimit) & (graphData['x'] <= rightLimit)]
-                integrals.append(integrate_simps(graphData, leftLimit, rightLimit) * self.distributions[name])
+    def getIntegralIndex(self) -> IntegralIndex:
+        """
+        ``getIntegralIndex``
+        --------------------
 
-            return sum(integrals)
-        else:
-            # regionGraphData = self.graphData[(graphData['x'] >= leftLimit) & (graphData['x'] <= rightLimit)]
-            return integrate_simps(self.graphData, leftLimit, rightLimit)
+        Returns the integral index of the instance's graph data, rebuilt only when the graph data is replaced.
+
+        Raises:
+            ValueError: The x-coords are not in ascending order.
 
-    def definePeaks(self) -> None:
+        Returns:
+            IntegralIndex: Index of ``self.graphArray``.
+        """
+        graphArray, index = self._integralIndex
+        if graphArray is not self.graphArray or index is None:
+            index = IntegralIndex(self.graphArray.x, self.graphArray.y)
+            self._integralIndex = (self.graphArray, index)
+        return index
+
+    def definePeaks(self, changed: ndarray = None) -> None:
         """
         ``definePeaks``
         ---------------
 
         Calculates the limits of integration for peaks.
 
+        Args:
+            changed (ndarray, optional): Boolean mask of the points whose y-coords changed since the limits were last
+            calculated, only the limits of peaks which can be affected are recalculated. Defaults to None, calculating
+            all limits.
+
         Credits go to Ivan Alsina Ferrer - https://github.com/ialsina/NRCA-Spectra/tree/main
 
         Peak Limit Algorithm used with all pre-existing datasets, now reimplemented for use in the GUI.
@@ -418,82 +745,128 @@ class SpectraData:
             # Default tolerance value (us) for finding nearby peaks in pmatch function.
             'max_match': 3.5,
         }
-        self.maxPeakLimitsX = {}
-        self.maxPeakLimistY = {}
-        derivative = np.array(
-            [(self.graphData.iloc[i + 1, 1] - self.graphData.iloc[i, 1]
-              ) / (self.graphData.iloc[i + 1, 0] - self.graphData.iloc[i, 0])
-             for i in range(self.graphData.shape[0] - 1)])
-
-        indexPosDer = getIndex(np.int32(derivative < 0), 0)
-        target = np.hstack((np.ones((indexPosDer)), np.zeros((np.size(derivative) - indexPosDer))))
-        derivative = derivative * (np.int64(np.abs(derivative) < params['maxleftslope']) * target + (1 - target))
-        smoothDer = smooth(derivative, params['itersmooth'])
-
-        maxIndexes = [self.graphData[self.graphData[0] == max].index[0] for max in self.maxima[0]]
-        for i, max in enumerate(self.maxima[0]):
-            # Number of points at the left of the current peak
-            nleft = maxIndexes[i]
-            # Number of points at the right of the current peak
-            nright = np.shape(self.graphData)[0] - nleft - 1
-            if np.size(self.maxima > 1):
-                if i == 0 or i == np.size(self.maxima[0]) - 1:
-                    prange = min(params['prangemax'], nleft, nright)
-                else:
-                    indexPrev = maxIndexes[i - 1]
-                    indexNext = maxIndexes[i + 1]
-                    prange = min(params['prangemax'], indexNext - indexPrev, nleft, nright)
-            elif np.size(self.maxima) == 1:
-                prange = min(params['prangemax'], nleft, nright)
-            else:
-                prange = 0
+        if changed is None:
+            self.maxPeakLimitsX = {}
+            self.maxPeakLimitsY = {}
+        else:
+            # Peaks no longer present lose their limits.
+            maxima = set(self.maxima[0])
+            self.maxPeakLimitsX = {max: lim for max, lim in self.maxPeakLimitsX.items() if max in maxima}
+            self.maxPeakLimitsY = {max: lim for max, lim in self.maxPeakLimitsY.items() if max in maxima}
+        if self.maxima[0].size == 0:
+            return
+        x, y = self.graphArray.x, self.graphArray.y
+        derivative = np.diff(y) / np.diff(x)
 
-            maxIndex = maxIndexes[i]
+        # Everything left of the first non-negative slope steeper than maxleftslope is flattened.
+        nonNegative = np.flatnonzero(derivative >= 0)
+        indexPosDer = nonNegative[0] if nonNegative.size else derivative.size
+        derivative[:indexPosDer][np.abs(derivative[:indexPosDer]) >= params['maxleftslope']] = 0
+        smoothDer = smooth(derivative, params['itersmooth'])
+        if indexPosDer != self._indexPosDer:
+            # Moving the flattened region alters the derivative far from the changes.
+            changed = None
+        self._indexPosDer = indexPosDer
+
+        # Index of the first point at each maximum.
+        maxIndexes = np.searchsorted(x, np.asarray(self.maxima[0], dtype=np.float64), side='left')
+
+        # Number of points either side of each peak to search for its limits.
+        pranges = np.minimum.reduce([np.full(maxIndexes.size, params['prangemax']),
+                                     maxIndexes, x.size - maxIndexes - 1])
+        if maxIndexes.size > 2:
+            pranges[1:-1] = np.minimum(pranges[1:-1], maxIndexes[2:] - maxIndexes[:-2])
+
+        if changed is None:
+            selected = np.arange(maxIndexes.size)
+        else:
+            # A peak reads the smoothed derivative up to prangemax + 2 points away, its prange also depends on the
+            # position of its neighbours.
+            reach = params['prangemax'] + params['itersmooth'] + 2
+            affected = sp.ndimage.maximum_filter1d(np.asarray(changed, dtype=np.uint8), 2 * reach + 1) > 0
+            selected = np.flatnonzero(affected[maxIndexes])
+            selected = np.unique(np.clip(np.concatenate([selected - 1, selected, selected + 1]), 0,
+                                         maxIndexes.size - 1))
+            if selected.size == 0:
+                return
+
+        # The limits of a peak depend only on its position and prange, those already found for the same graph data
+        # are reused, e.g. when the threshold changes.
+        limitCache = self._getPeakCache()["limits"]
+        keys = list(zip(maxIndexes[selected].tolist(), pranges[selected].tolist()))
+        missing = selected[np.array([key not in limitCache for key in keys], dtype=bool)]
+
+        outerslopes = np.zeros(maxIndexes.size)
+        for i, maxIndex, prange in zip(missing, maxIndexes[missing], pranges[missing]):
             derRegion = smoothDer[maxIndex - prange: maxIndex + prange + 1]
-            for i in range(1, 10):
-                fit, boxwidth = fitBoxes(derRegion, params['dboxes'] * i)
+            for k in range(1, 10):
+                fit, _ = fitBoxes(derRegion, params['dboxes'] * k)
                 temp1, temp2 = np.unique(fit, return_counts=True)
                 if not (temp2 == 1).all():
                     break
-            outerslope = temp1[np.argmax(temp2)]
-            if abs(outerslope) > params['maxouterslope']:
-                outerslope = 0
-            limsX = []
-            limsY = []
-            for sign in [-1, 1]:
-                decreasing, increasing, lock = False, False, False
-                derMax = None
-                for i in range(maxIndex, maxIndex + sign * (prange + 1), sign):
-                    decreasing = smoothDer[i + sign] < smoothDer[i]
-                    increasing = smoothDer[i + sign] > smoothDer[i]
-                    if not lock:
-                        if (decreasing if sign == -1 else increasing):
-                            lock = True
-                            derMax = smoothDer[i]
-                            if derMax == outerslope:
-                                raise Exception('Non-standing slope', prange)
-                    if lock:
-                        if abs((derivative[i] - outerslope) / (derMax - outerslope)) <= params['slopedrop']:
-                            limsX.append(self.graphData.iloc[i, 0])
-                            limsY.append(self.graphData.iloc[i, 1])
-                            break
-                        if smoothDer[i + sign] * smoothDer[i] <= 0:
-                            if i == maxIndex:
-                                limsX.append(self.graphData.iloc[i + sign, 0])
-                                limsY.append(self.graphData.iloc[i + sign, 1])
-                            else:
-                                limsX.append(self.graphData.iloc[i, 0])
-                                limsY.append(self.graphData.iloc[i, 1])
-                            break
-                        if i == maxIndex + sign * (prange):
-                            limsX.append(self.graphData.iloc[maxIndex + sign, 0])
-                            limsY.append(self.graphData.iloc[maxIndex + sign, 1])
-                            break
-            try:
-                self.maxPeakLimitsX[max] = (limsX[0], limsX[1])
-                self.maxPeakLimitsY[max] = (limsY[0], limsY[1])
-            except IndexError:
-                pass
+            outerslopes[i] = temp1[np.argmax(temp2)]
+        outerslopes[np.abs(outerslopes) > params['maxouterslope']] = 0
+
+        # Reads beyond the data are NaN, failing every comparison. Index -1 wraps as in the point-by-point algorithm.
+        paddedSmoothDer = np.append(smoothDer, np.nan)
+        paddedDer = np.append(derivative, np.nan)
+
+        def lookup(array: ndarray, indexes: ndarray) -> ndarray:
+            return array[np.where(indexes < 0, indexes + array.size - 1, np.minimum(indexes, array.size - 1))]
+
+        def walk(peaks: ndarray, sign: int) -> tuple[ndarray, ndarray, ndarray]:
+            # Walks away from every peak at once, one row per peak and one column per step.
+            indexes, peakRanges, outerslope = maxIndexes[peaks], pranges[peaks], outerslopes[peaks]
+            steps = np.arange(peakRanges.max() + 1)
+            rows = np.arange(indexes.size)
+            inRange = steps <= peakRanges[:, None]
+            J = indexes[:, None] + sign * steps
+            current = lookup(paddedSmoothDer, J)
+            following = lookup(paddedSmoothDer, J + sign)
+
+            # Limits are searched for once the slope starts falling away from the summit.
+            lockCondition = inRange & (following < current if sign == -1 else following > current)
+            locked = lockCondition.any(axis=1)
+            lockStep = np.argmax(lockCondition, axis=1)
+            derMax = current[rows, lockStep]
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                slopeDrop = np.abs((lookup(paddedDer, J) - outerslope[:, None]) / (derMax - outerslope)[:, None])
+            dropped = slopeDrop <= params['slopedrop']
+            signChange = following * current <= 0
+            stop = inRange & (steps >= lockStep[:, None]) & (dropped | signChange | (steps == peakRanges[:, None]))
+            stopStep = np.argmax(stop, axis=1)
+
+            stopIndexes = J[rows, stopStep]
+            lims = np.where(dropped[rows, stopStep], stopIndexes,
+                            np.where(signChange[rows, stopStep],
+                                     np.where(stopStep == 0, stopIndexes + sign, stopIndexes),
+                                     indexes + sign))
+            return locked, locked & (derMax == outerslope), lims
+
+        # Peaks are walked in chunks to bound the (peaks, steps) arrays.
+        if missing.size:
+            chunks = [missing[start:start + 1024] for start in range(0, missing.size, 1024)]
+            leftLocked, leftNonStanding, left = map(np.concatenate, zip(*[walk(chunk, -1) for chunk in chunks]))
+            rightLocked, rightNonStanding, right = map(np.concatenate, zip(*[walk(chunk, 1) for chunk in chunks]))
+            nonStanding = np.flatnonzero(leftNonStanding | rightNonStanding)
+            if nonStanding.size:
+                raise Exception('Non-standing slope', pranges[missing[nonStanding[0]]])
+            limitCache.update(zip(zip(maxIndexes[missing].tolist(), pranges[missing].tolist()),
+                                  zip((leftLocked & rightLocked).tolist(), left.tolist(), right.tolist())))
+        found, left, right = (np.array(limits, dtype=dtype) for limits, dtype in
+                              zip(zip(*[limitCache[key] for key in keys]), [bool, np.int64, np.int64]))
+
+        for max in self.maxima[0][selected]:
+            self.maxPeakLimitsX.pop(max, None)
+            self.maxPeakLimitsY.pop(max, None)
+        peaks = self.maxima[0][selected[found]]
+        self.maxPeakLimitsX.update(zip(peaks, zip(x[left[found]], x[right[found]])))
+        self.maxPeakLimitsY.update(zip(peaks, zip(y[left[found]], y[right[found]])))
+        if selected.size < maxIndexes.size:
+            # Limits kept from before still take the current y-coords.
+            for max, (leftX, rightX) in self.maxPeakLimitsX.items():
+                self.maxPeakLimitsY[max] = tuple(y[np.searchsorted(x, [leftX, rightX])])
 
     def recalculatePeakData(self) -> None:
         """
@@ -518,8 +891,14 @@ class SpectraData:
                                               "Relevant Isotope"
                                               ])
             return
-        integrals = {max: self.peakIntegral(self.maxPeakLimitsX[max][0], self.maxPeakLimitsX[max][1])
-                     for max in self.maxPeakLimitsX.keys()}
+        integralCache = self._getPeakCache()["integrals"]
+        windows = [tuple(limits) for limits in self.maxPeakLimitsX.values()]
+        missing = np.array([window for window in set(windows) if window not in integralCache],
+                           dtype=np.float64).reshape(-1, 2)
+        if missing.size:
+            integralCache.update(zip(map(tuple, missing.tolist()),
+                                     self.peakIntegrals(missing[:, 0], missing[:, 1]).tolist()))
+        integrals = {max: integralCache[window] for max, window in zip(self.maxPeakLimitsX.keys(), windows)}
         integralRanks = {max: i for i, max in enumerate(dict(
             sorted(integrals.items(), key=lambda item: item[1], reverse=True)).keys())}
 
@@ -532,12 +911,13 @@ class SpectraData:
         peakWidthRank = {max: i for i, max in enumerate(dict(
             sorted(peakWidth.items(), key=lambda item: item[1], reverse=True)).keys())}
 
+        tofX = self.energyToTOF(self.maxima[0])
         tableDataTemp = [
             [
                 integralRanks[maxCoords[0]],
                 float(f"{maxCoords[0]:.5g}"),
-                f"({np.where(self.maxima[0] == maxCoords[0])[0][0]})",
-                float(f"{self.e2TOF(maxCoords[0]):.5g}"),
+                f"({i})",
+                float(f"{tofX[i]:.5g}"),
                 float(f"{integrals[maxCoords[0]]:.5g}"),
                 float(f"{peakWidth[maxCoords[0]]:.5g}"),
                 f"({peakWidthRank[maxCoords[0]]})",
@@ -545,7 +925,7 @@ class SpectraData:
                 f"({peakHeightRank[maxCoords[1]]:.5g})",
                 None
             ]
-            for maxCoords in self.maxima.T]
+            for i, maxCoords in enumerate(self.maxima.T)]
         tableDataTemp = sorted(tableDataTemp, key=lambda item: item[0])
 
         self.tableData = pandas.DataFrame(tableDataTemp,
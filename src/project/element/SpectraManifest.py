@@ -0,0 +1,324 @@
+from __future__ import annotations
+import json
+import os
+import zlib
+from os import path
+
+import numpy as np
+import pandas
+
+from element.SpectraStore import _listCsv, dataDir, getSourceSignature
+
+manifestFilepath = f"{dataDir}Cache/manifest.json"
+thresholdFilepath = f"{dataDir}threshold_exceptions.txt"
+
+# Sub-directories of the data folder indexed by the manifest, any change to their contents invalidates it.
+manifestDirs = ["Graph Data", "Graph Data/Compound Data", "Distribution Information"]
+
+
+def readThresholds(filepath: str = thresholdFilepath) -> dict[str, tuple[float, float]]:
+    """
+    ``readThresholds``
+    ------------------
+
+    Reads the peak detection thresholds of the elements which do not use the default of 100, each line being of the
+    form 'Cu (20, 4.3)'.
+
+    Args:
+        - ``filepath`` (str, optional): Filepath of the threshold exceptions. Defaults to ``thresholdFilepath``.
+
+    Returns:
+        dict[str, tuple[float, float]]: n-tot and n-g thresholds keyed by element symbol.
+    """
+    thresholds = {}
+    for line in pandas.read_csv(filepath, header=None).values:
+        symbol, ntot = line[0].split(' ')
+        thresholds[symbol] = (float(ntot.replace('(', '')), float(line[1].replace(')', '')))
+    return thresholds
+
+
+class SpectraManifest:
+    """
+    Index of the data folder read in a single json load at startup, replacing the directory scans and per-file reads
+    otherwise needed to list the spectra, their isotopic distributions and peak detection thresholds.
+
+    Index layout:
+        - ``sources``: Signature of the indexed directories and the threshold exceptions it was built from.
+        - ``spectra``: Each graph data csv by name, as [size, modification time, number of points, crc32 checksum].
+        - ``compounds``: As ``spectra`` for the csv files of the compound data.
+        - ``modes``: Modes, 'n-g' and/or 'n-tot', available for each isotope or element.
+        - ``distributions``: Natural abundance of each isotope keyed by element name.
+        - ``thresholds``: n-tot and n-g thresholds keyed by element symbol.
+
+    The size and modification time of each csv allow its points and checksum to be reused when the manifest is
+    rebuilt, so only added or replaced files are read.
+    """
+
+    version: int = 1
+
+    index: dict
+    filepath: str
+
+    def __init__(self, index: dict, filepath: str = manifestFilepath) -> None:
+        self.index = index
+        self.filepath = filepath
+
+    @classmethod
+    def load(cls, filepath: str = manifestFilepath) -> SpectraManifest:
+        """
+        ``load``
+        --------
+
+        Args:
+            - ``filepath`` (str, optional): Filepath of the manifest. Defaults to ``manifestFilepath``.
+
+        Raises:
+            OSError: The manifest could not be read.
+            ValueError: The file is not a manifest of this version.
+
+        Returns:
+            SpectraManifest: The loaded manifest.
+        """
+        with open(filepath, "r", encoding="utf-8") as file:
+            index = json.load(file)
+        if not isinstance(index, dict) or index.get("version", None) != cls.version:
+            raise ValueError(f"{filepath} is not a version {cls.version} spectra manifest")
+        return cls(index, filepath)
+
+    @property
+    def spectraNames(self) -> list[str]:
+        """
+        Returns:
+            list[str]: Sorted names of the graph data library spectra.
+        """
+        return list(self.index["spectra"].keys())
+
+    @property
+    def compoundNames(self) -> list[str]:
+        """
+        Returns:
+            list[str]: Sorted names of the saved compounds.
+        """
+        return list(self.index["compounds"].keys())
+
+    @property
+    def modes(self) -> dict[str, list[str]]:
+        """
+        Returns:
+            dict[str, list[str]]: Modes available for each isotope or element, e.g. {'29-Cu-63': ['n-g', 'n-tot']}.
+        """
+        return self.index["modes"]
+
+    @property
+    def distributions(self) -> dict[str, dict[str, float]]:
+        """
+        Returns:
+            dict[str, dict[str, float]]: Natural abundance of each isotope keyed by element name.
+        """
+        return self.index["distributions"]
+
+    @property
+    def thresholds(self) -> dict[str, tuple[float, float]]:
+        """
+        Returns:
+            dict[str, tuple[float, float]]: n-tot and n-g thresholds keyed by element symbol, as ``readThresholds``.
+        """
+        return {symbol: tuple(threshold) for symbol, threshold in self.index["thresholds"].items()}
+
+    def _getEntry(self, name: str) -> list[int]:
+        entry = self.index["spectra"].get(name, None) or self.index["compounds"].get(name, None)
+        if entry is None:
+            raise KeyError(name)
+        return entry
+
+    def getPoints(self, name: str) -> int:
+        """
+        ``getPoints``
+        -------------
+
+        Args:
+            - ``name`` (str): Spectrum or compound name, e.g. '29-Cu-63_n-g'.
+
+        Raises:
+            KeyError: ``name`` is not in the manifest.
+
+        Returns:
+            int: Number of points in its graph data.
+        """
+        return self._getEntry(name)[2]
+
+    def getChecksum(self, name: str) -> int:
+        """
+        ``getChecksum``
+        ---------------
+
+        Args:
+            - ``name`` (str): Spectrum or compound name, e.g. '29-Cu-63_n-g'.
+
+        Raises:
+            KeyError: ``name`` is not in the manifest.
+
+        Returns:
+            int: crc32 checksum of its graph data csv.
+        """
+        return self._getEntry(name)[3]
+
+    def isStale(self, dataDir: str = dataDir) -> bool:
+        """
+        ``isStale``
+        -----------
+
+        Checks whether the data folder has changed since the manifest was built.
+
+        Args:
+            - ``dataDir`` (str): Data folder the manifest was built from.
+
+        Returns:
+            bool: True if the manifest needs rebuilding.
+        """
+        return self.index["sources"] != getManifestSignature(dataDir)
+
+    @classmethod
+    def build(cls, dataDir: str = dataDir, filepath: str = manifestFilepath,
+              previous: SpectraManifest = None) -> SpectraManifest:
+        """
+        ``build``
+        ---------
+
+        Indexes ``dataDir`` and writes the manifest to ``filepath``, by way of a temporary file moved into place once
+        complete. A manifest that cannot be written, e.g. in a read-only data folder, is still returned.
+
+        Args:
+            - ``dataDir`` (str, optional): Data folder to index. Defaults to ``dataDir``.
+
+            - ``filepath`` (str, optional): Filepath of the manifest to write. Defaults to ``manifestFilepath``.
+
+            - ``previous`` (SpectraManifest, optional): Earlier manifest of ``dataDir`` whose points and checksums are
+            reused for unchanged files. Defaults to None, reading every file.
+
+        Returns:
+            SpectraManifest: The built manifest.
+        """
+        index = {"version": cls.version,
+                 "sources": getManifestSignature(dataDir),
+                 "spectra": {},
+                 "compounds": {},
+                 "modes": {},
+                 "distributions": {},
+                 "thresholds": {}}
+        for key, directory in [("spectra", "Graph Data"), ("compounds", "Graph Data/Compound Data")]:
+            previousEntries = previous.index[key] if previous is not None else {}
+            for name in _listCsv(f"{dataDir}{directory}/"):
+                index[key][name] = _indexCsv(f"{dataDir}{directory}/{name}.csv", previousEntries.get(name, None))
+
+        for name in index["spectra"]:
+            base, _, mode = name.rpartition("_")
+            index["modes"].setdefault(base, []).append(mode)
+
+        for name in _listCsv(f"{dataDir}Distribution Information/"):
+            dist = pandas.read_csv(f"{dataDir}Distribution Information/{name}.csv", header=None)
+            index["distributions"][name] = {d[0]: d[1] for d in dist.values}
+
+        if path.exists(f"{dataDir}threshold_exceptions.txt"):
+            thresholds = readThresholds(f"{dataDir}threshold_exceptions.txt")
+            index["thresholds"] = {symbol: list(threshold) for symbol, threshold in thresholds.items()}
+
+        manifest = cls(index, filepath)
+        try:
+            os.makedirs(path.dirname(filepath), exist_ok=True)
+            with open(f"{filepath}.tmp", "w", encoding="utf-8") as file:
+                json.dump(index, file)
+            os.replace(f"{filepath}.tmp", filepath)
+        except OSError:
+            pass
+        return manifest
+
+
+def _indexCsv(filepath: str, previous: list[int] = None) -> list[int]:
+    """
+    Returns the [size, modification time, number of points, crc32 checksum] entry of a graph data csv, reusing
+    ``previous`` if the file has not changed since it was made.
+    """
+    stat = os.stat(filepath)
+    if previous is not None and previous[:2] == [stat.st_size, stat.st_mtime_ns]:
+        return previous
+    with open(filepath, "rb") as file:
+        data = file.read()
+    # Points are counted as the lines starting with a non-whitespace character, blank lines being skipped when read.
+    chars = np.frombuffer(data, dtype=np.uint8)
+    whitespace = chars <= ord(" ")
+    points = int(chars.size > 0 and not whitespace[0]) + np.count_nonzero(~whitespace[1:] & (chars[:-1] == ord("\n")))
+    return [stat.st_size, stat.st_mtime_ns, int(points), zlib.crc32(data)]
+
+
+def getManifestSignature(dataDir: str = dataDir) -> dict[str, dict[str, list[int]] | list[int] | None]:
+    """
+    ``getManifestSignature``
+    ------------------------
+
+    Signature of the ``manifestDirs``, the size and modification time of each of their files as given by
+    ``getSourceSignature``, together with the modification time and size of the threshold exceptions. Files
+    overwritten in place change it, while none are read.
+
+    Args:
+        - ``dataDir`` (str): Data folder.
+
+    Returns:
+        dict[str, dict[str, list[int]] | list[int] | None]: Signature keyed by directory or file.
+    """
+    signature = getSourceSignature(dataDir, manifestDirs)
+    try:
+        stat = os.stat(f"{dataDir}threshold_exceptions.txt")
+        signature["threshold_exceptions.txt"] = [stat.st_mtime_ns, stat.st_size]
+    except FileNotFoundError:
+        signature["threshold_exceptions.txt"] = None
+    return signature
+
+
+def loadSpectraManifest(dataDir: str = dataDir, filepath: str = manifestFilepath) -> SpectraManifest:
+    """
+    ``loadSpectraManifest``
+    -----------------------
+
+    Loads the manifest of ``dataDir``, rebuilding it first if it is missing or the data folder has changed since it
+    was built.
+
+    Args:
+        - ``dataDir`` (str, optional): Data folder. Defaults to ``dataDir``.
+
+        - ``filepath`` (str, optional): Filepath of the manifest. Defaults to ``manifestFilepath``.
+
+    Returns:
+        SpectraManifest: The up to date manifest.
+    """
+    try:
+        manifest = SpectraManifest.load(filepath)
+    except (OSError, ValueError):
+        return SpectraManifest.build(dataDir, filepath)
+    if manifest.isStale(dataDir):
+        return SpectraManifest.build(dataDir, filepath, previous=manifest)
+    return manifest
+
+
+_manifest: list[SpectraManifest] = []
+
+
+def getSpectraManifest() -> SpectraManifest:
+    """
+    ``getSpectraManifest``
+    ----------------------
+
+    Loads the shared manifest of the data folder once per process, see ``loadSpectraManifest``.
+
+    Returns:
+        SpectraManifest: The manifest.
+    """
+    if not _manifest:
+        _manifest.append(loadSpectraManifest())
+    return _manifest[0]
+
+
+if __name__ == "__main__":
+    manifest = SpectraManifest.build()
+    print(f"Indexed {len(manifest.spectraNames)} spectra and {len(manifest.compoundNames)} compounds into "
+          f"{manifest.filepath}")
@@ -0,0 +1,335 @@
+from __future__ import annotations
+import io
+import json
+import os
+import struct
+from os import path
+
+import numpy as np
+from numpy import ndarray
+import pandas
+from pandas import DataFrame
+
+from helpers.graphDataCache import graphDataDir, loadGraphData
+
+dataDir = f"{path.dirname(path.dirname(__file__))}/data/"
+storeFilepath = f"{dataDir}Cache/spectra.store"
+
+# Sub-directories of the data folder packed into the store, any change to their contents invalidates it.
+sourceDirs = ["Graph Data", "Peak information", "Peak Limit Information", "Distribution Information"]
+
+
+class SpectraStore:
+    """
+    Single-file, offset-indexed store holding the graph data, peak information table, peak limits and natural
+    abundance of every spectrum in the data folder.
+
+    File layout:
+        - 8 byte magic ``NRCASTR1``, followed by the offset and length (uint64) of the JSON index.
+        - Data blobs, each aligned to 8 bytes. Graph data is a float64 (2, n) array, peak limits a float64 (n, 2) array
+          and peak information the raw csv text.
+        - The JSON index mapping each name to its blob offset and size, the distributions and source directory
+          signatures.
+
+    The file is memory-mapped once on opening, fetching any entry by name is a dictionary lookup followed by a view of
+    the mapped buffer.
+    """
+
+    magic: bytes = b"NRCASTR1"
+    headerFormat: str = "<8sQQ"
+
+    filepath: str
+    index: dict
+
+    def __init__(self, filepath: str = storeFilepath) -> None:
+        self.filepath = filepath
+        with open(filepath, "rb") as file:
+            magic, indexOffset, indexLength = struct.unpack(self.headerFormat,
+                                                            file.read(struct.calcsize(self.headerFormat)))
+            if magic != self.magic:
+                raise ValueError(f"{filepath} is not a spectra store")
+            file.seek(indexOffset)
+            self.index = json.loads(file.read(indexLength).decode("utf-8"))
+        self._buffer = np.memmap(filepath, dtype=np.uint8, mode="c")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index["graphData"]
+
+    @property
+    def graphNames(self) -> list[str]:
+        """
+        Returns:
+            list[str]: Sorted names of every spectrum with graph data.
+        """
+        return list(self.index["graphData"].keys())
+
+    def hasPeakLimits(self, name: str) -> bool:
+        return name in self.index["peakLimits"]
+
+    @property
+    def distributions(self) -> dict[str, dict[str, float]]:
+        """
+        Returns:
+            dict[str, dict[str, float]]: Natural abundance of each isotope keyed by element name.
+        """
+        return self.index["distributions"]
+
+    def _view(self, offset: int, nbytes: int) -> ndarray:
+        return self._buffer[offset:offset + nbytes]
+
+    def getGraphArray(self, name: str) -> ndarray:
+        """
+        ``getGraphArray``
+        -----------------
+
+        Args:
+            - ``name`` (str): Spectrum name, e.g. '29-Cu-63_n-g'.
+
+        Raises:
+            KeyError: No graph data stored for ``name``.
+
+        Returns:
+            ndarray: Copy-on-write view of the (2, n) graph data.
+        """
+        offset, points = self.index["graphData"][name]
+        return self._view(offset, 16 * points).view(np.float64).reshape(2, points)
+
+    def getGraphData(self, name: str, names: list[str] = None) -> DataFrame:
+        """
+        ``getGraphData``
+        ----------------
+
+        Args:
+            - ``name`` (str): Spectrum name.
+
+            - ``names`` (list[str], optional): Column names. Defaults to None, giving columns 0 and 1.
+
+        Raises:
+            KeyError: No graph data stored for ``name``.
+
+        Returns:
+            DataFrame: Graph data of the spectrum.
+        """
+        return DataFrame(self.getGraphArray(name).T, columns=names, copy=False)
+
+    def getPeakLimits(self, name: str) -> DataFrame:
+        """
+        ``getPeakLimits``
+        -----------------
+
+        Args:
+            - ``name`` (str): Spectrum name.
+
+        Raises:
+            KeyError: No peak limits stored for ``name``.
+
+        Returns:
+            DataFrame: Peak limits with columns 'left' and 'right'.
+        """
+        offset, rows = self.index["peakLimits"][name]
+        limits = self._view(offset, 16 * rows).view(np.float64).reshape(rows, 2)
+        return DataFrame(limits, columns=["left", "right"])
+
+    def getPeakInformation(self, name: str) -> DataFrame | None:
+        """
+        ``getPeakInformation``
+        ----------------------
+
+        Args:
+            - ``name`` (str): Spectrum name.
+
+        Returns:
+            DataFrame | None: The peak information table, None if there is none for ``name``.
+        """
+        csv = self.getPeakInformationCsv(name)
+        if csv is None:
+            return None
+        return pandas.read_csv(io.BytesIO(csv), header=0)
+
+    def getPeakInformationCsv(self, name: str) -> bytes | None:
+        """
+        ``getPeakInformationCsv``
+        -------------------------
+
+        Args:
+            - ``name`` (str): Spectrum name.
+
+        Returns:
+            bytes | None: Raw csv text of the peak information table, None if there is none for ``name``.
+        """
+        entry = self.index["peakInformation"].get(name, None)
+        if entry is None:
+            return None
+        offset, nbytes = entry
+        return self._view(offset, nbytes).tobytes()
+
+    def isStale(self, dataDir: str = dataDir) -> bool:
+        """
+        ``isStale``
+        -----------
+
+        Checks whether the data folder has changed since the store was built.
+
+        Args:
+            - ``dataDir`` (str): Data folder the store was built from.
+
+        Returns:
+            bool: True if the store needs rebuilding.
+        """
+        return self.index["sources"] != getSourceSignature(dataDir)
+
+    @classmethod
+    def build(cls, dataDir: str = dataDir, filepath: str = storeFilepath) -> SpectraStore:
+        """
+        ``build``
+        ---------
+
+        Packs the csv files of ``dataDir`` into a new store at ``filepath``. The store is written to a temporary file
+        and moved into place once complete.
+
+        Args:
+            - ``dataDir`` (str): Data folder to pack.
+
+            - ``filepath`` (str): Filepath of the store to create.
+
+        Returns:
+            SpectraStore: The opened store.
+        """
+        index = {"sources": getSourceSignature(dataDir),
+                 "graphData": {},
+                 "peakInformation": {},
+                 "peakLimits": {},
+                 "distributions": {}}
+        os.makedirs(path.dirname(filepath), exist_ok=True)
+        with open(f"{filepath}.tmp", "wb") as file:
+            file.write(struct.pack(cls.headerFormat, cls.magic, 0, 0))
+
+            def writeBlob(data: bytes) -> int:
+                offset = file.tell()
+                file.write(data)
+                file.write(b"\0" * (-len(data) % 8))
+                return offset
+
+            for name in _listCsv(f"{dataDir}Graph Data/"):
+                try:
+                    array = np.ascontiguousarray(
+                        loadGraphData(f"{dataDir}Graph Data/{name}.csv").to_numpy(dtype=np.float64).T)
+                except pandas.errors.EmptyDataError:
+                    array = np.empty((2, 0))
+                index["graphData"][name] = [writeBlob(array.tobytes()), array.shape[1]]
+
+            for name in _listCsv(f"{dataDir}Peak information/"):
+                with open(f"{dataDir}Peak information/{name}.csv", "rb") as csv:
+                    data = csv.read()
+                index["peakInformation"][name] = [writeBlob(data), len(data)]
+
+            for name in _listCsv(f"{dataDir}Peak Limit Information/"):
+                limits = pandas.read_csv(f"{dataDir}Peak Limit Information/{name}.csv", names=["left", "right"])
+                array = np.ascontiguousarray(limits.to_numpy(dtype=np.float64))
+                index["peakLimits"][name] = [writeBlob(array.tobytes()), array.shape[0]]
+
+            for name in _listCsv(f"{dataDir}Distribution Information/"):
+                dist = pandas.read_csv(f"{dataDir}Distribution Information/{name}.csv", header=None)
+                index["distributions"][name] = {d[0]: d[1] for d in dist.values}
+
+            indexData = json.dumps(index).encode("utf-8")
+            indexOffset = file.tell()
+            file.write(indexData)
+            file.seek(0)
+            file.write(struct.pack(cls.headerFormat, cls.magic, indexOffset, len(indexData)))
+        os.replace(f"{filepath}.tmp", filepath)
+        return cls(filepath)
+
+
+def _listCsv(directory: str) -> list[str]:
+    """
+    Returns the sorted names (without extension) of the csv files directly within ``directory``.
+    """
+    try:
+        return sorted(file[:-4] for file in os.listdir(directory) if file.endswith(".csv"))
+    except FileNotFoundError:
+        return []
+
+
+def getSourceSignature(dataDir: str = dataDir,
+                       directories: list[str] = sourceDirs) -> dict[str, dict[str, list[int]] | None]:
+    """
+    ``getSourceSignature``
+    ----------------------
+
+    Cheap signature of the data folder, the size and modification time of each entry of each packed directory. Adding,
+    removing, replacing or overwriting a file in place changes the signature, without any file being read.
+
+    Args:
+        - ``dataDir`` (str): Data folder.
+
+        - ``directories`` (list[str], optional): Sub-directories to sign. Defaults to ``sourceDirs``.
+
+    Returns:
+        dict[str, dict[str, list[int]] | None]: [size, mtime_ns] of each entry keyed by directory and entry name,
+        None for missing directories.
+    """
+    signature = {}
+    for directory in directories:
+        try:
+            with os.scandir(f"{dataDir}{directory}") as entries:
+                signature[directory] = {entry.name: [entry.stat().st_size, entry.stat().st_mtime_ns]
+                                        for entry in entries}
+        except FileNotFoundError:
+            signature[directory] = None
+    return signature
+
+
+_store: list[SpectraStore | None] = []
+
+
+def getSpectraStore() -> SpectraStore | None:
+    """
+    ``getSpectraStore``
+    -------------------
+
+    Opens the shared store once per process.
+
+    Returns:
+        SpectraStore | None: The store, None if it has not been built or is out of date with the data folder, in which
+        case callers fall back to reading the csv files.
+    """
+    if not _store:
+        try:
+            store = SpectraStore()
+            _store.append(None if store.isStale() else store)
+        except (OSError, ValueError):
+            _store.append(None)
+    return _store[0]
+
+
+def loadSpectrumGraphData(name: str, names: list[str] = None) -> DataFrame:
+    """
+    ``loadSpectrumGraphData``
+    -------------------------
+
+    Returns the graph data of a library spectrum, from the store if available otherwise from its csv.
+
+    Args:
+        - ``name`` (str): Spectrum name, e.g. '29-Cu-63_n-g'.
+
+        - ``names`` (list[str], optional): Column names. Defaults to None, giving columns 0 and 1.
+
+    Raises:
+        pandas.errors.EmptyDataError: The spectrum has no graph data.
+
+    Returns:
+        DataFrame: Graph data of the spectrum.
+    """
+    store = getSpectraStore()
+    if store is not None and name in store:
+        graphData = store.getGraphData(name, names)
+        if graphData.empty:
+            raise pandas.errors.EmptyDataError(f"No graph data for {name}")
+        return graphData
+    return loadGraphData(f"{graphDataDir}{name}.csv", names)
+
+
+if __name__ == "__main__":
+    store = SpectraStore.build()
+    print(f"Packed {len(store.graphNames)} spectra into {store.filepath}")
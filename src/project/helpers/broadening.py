@@ -0,0 +1,175 @@
+from __future__ import annotations
+from collections import OrderedDict
+from threading import RLock
+
+import numpy as np
+from numpy import ndarray
+
+from helpers.conversion import energyToTOF
+
+boltzmann = 8.617333262e-5
+
+# Broadened y-coords keyed by (spectrum name, flight length, time resolution, length resolution, temperature, mass),
+# least recently used first.
+_broadeningCache: OrderedDict[tuple, tuple[int, ndarray]] = OrderedDict()
+broadeningCacheSize: int = 32
+_broadeningLock = RLock()
+
+# Points of the uniform grid per standard deviation of the kernel, and the most points a grid may have.
+pointsPerSigma = 4
+maxGridPoints = 2 ** 21
+
+
+def getMassNumber(name: str, distributions: dict[str, float] = None) -> float | None:
+    """
+    ``getMassNumber``
+    -----------------
+
+    Args:
+        - ``name`` (str): Spectrum name, e.g. '29-Cu-63_n-g' or 'element_29-Cu_n-g'.
+
+        - ``distributions`` (dict[str, float], optional): Abundance of each isotope of an element. Defaults to None.
+
+    Returns:
+        float | None: Mass number of an isotope, or the abundance weighted mass number of an element, None if
+        unknown.
+    """
+    def massNumber(isotope: str) -> float | None:
+        parts = isotope.split('_')[0].split('-')
+        return float(parts[2].rstrip('m')) if len(parts) > 2 and parts[2].rstrip('m').isdigit() else None
+
+    if not name.startswith('element_'):
+        return massNumber(name)
+    if not distributions:
+        return None
+    masses = {isotope: massNumber(isotope) for isotope, dist in distributions.items() if dist}
+    if not masses or None in masses.values():
+        return None
+    total = sum(distributions[isotope] for isotope in masses)
+    return sum(distributions[isotope] * mass for isotope, mass in masses.items()) / total
+
+
+def _convolveUniform(u: ndarray, y: ndarray, points: int = None) -> ndarray:
+    """
+    Convolves y-coords at ascending positions ``u`` with a Gaussian of unit standard deviation in ``u``. The series
+    is averaged over the cells of a uniform grid, preserving its area, convolved by FFT with the edges extended and
+    interpolated back to ``u``.
+    """
+    # Imported on first use, scipy.signal being slow to import and only needed once broadening is enabled.
+    from scipy.signal import fftconvolve
+
+    span = u[-1] - u[0]
+    if span <= 0:
+        return y.copy()
+    points = points or int(min(max(span * pointsPerSigma, 2), maxGridPoints))
+    edges = np.linspace(u[0], u[-1], points + 1)
+    step = edges[1] - edges[0]
+    # Cell averages from the cumulative trapezoidal integral.
+    cumulative = np.concatenate([[0], np.cumsum(np.diff(u) * (y[1:] + y[:-1]) / 2)])
+    averages = np.diff(np.interp(edges, u, cumulative)) / step
+
+    kernelX = np.arange(-np.ceil(5 / step), np.ceil(5 / step) + 1) * step
+    kernel = np.exp(-0.5 * kernelX ** 2)
+    kernel /= kernel.sum()
+    pad = kernel.size // 2
+    broadened = fftconvolve(np.pad(averages, pad, mode='edge'), kernel, mode='same')[pad:pad + points]
+    return np.interp(u, (edges[1:] + edges[:-1]) / 2, broadened)
+
+
+def broaden(x: ndarray, y: ndarray, length: float, timeResolution: float = 0, lengthResolution: float = 0,
+            temperature: float = 0, mass: float = None) -> ndarray:
+    """
+    ``broaden``
+    -----------
+
+    Broadens a cross-section by free gas Doppler broadening and then a Gaussian time of flight resolution function.
+
+    Each stage resamples the series onto the axis along which its Gaussian has a constant width, convolving it there
+    by FFT. Doppler broadening has a constant width in the square root of energy. The resolution, of standard
+    deviation sqrt(``timeResolution``^2 + (t * ``lengthResolution`` / ``length``)^2) at time of flight t, has a
+    constant width along asinh(t * r / ``timeResolution``) / r, for r = ``lengthResolution`` / ``length``.
+
+    Args:
+        - ``x`` (ndarray): Ascending energies (eV).
+
+        - ``y`` (ndarray): Cross-section at each energy.
+
+        - ``length`` (float): Flight path length in metres.
+
+        - ``timeResolution`` (float, optional): Standard deviation of the time of flight (us), e.g. of the
+        moderator pulse. Defaults to 0.
+
+        - ``lengthResolution`` (float, optional): Standard deviation of the flight path length (m). Defaults to 0.
+
+        - ``temperature`` (float, optional): Temperature of the sample (K) for Doppler broadening. Defaults to 0,
+        none.
+
+        - ``mass`` (float, optional): Mass of the target nucleus in neutron masses, e.g. its mass number,
+        required for Doppler broadening. Defaults to None.
+
+    Returns:
+        ndarray: Broadened cross-section at each energy.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    positive = x > 0
+    if not positive.any():
+        return y.copy()
+    broadened = y.copy()
+    energy, crossSection = x[positive], y[positive]
+
+    if temperature > 0 and mass:
+        # The free gas kernel has a standard deviation of sqrt(kT / 2A) in the square root of energy.
+        crossSection = _convolveUniform(np.sqrt(energy) / np.sqrt(boltzmann * temperature / (2 * mass)),
+                                        crossSection)
+
+    if timeResolution > 0 or lengthResolution > 0:
+        # Times of flight descend as energies ascend.
+        tof = energyToTOF(energy, length)[::-1]
+        ratio = lengthResolution / length
+        if ratio == 0:
+            u = tof / timeResolution
+        elif timeResolution == 0:
+            u = np.log(tof) / ratio
+        else:
+            u = np.arcsinh(tof * ratio / timeResolution) / ratio
+        crossSection = _convolveUniform(u, crossSection[::-1])[::-1]
+
+    broadened[positive] = crossSection
+    return broadened
+
+
+def getBroadened(name: str, x: ndarray, y: ndarray, length: float, timeResolution: float = 0,
+                 lengthResolution: float = 0, temperature: float = 0, mass: float = None) -> ndarray:
+    """
+    ``getBroadened``
+    ----------------
+
+    Returns the ``broaden``-ed cross-section of a spectrum, reusing the result of a previous call with the same
+    spectrum name, flight length, resolution parameters and graph data.
+
+    Args:
+        - ``name`` (str): Spectrum name.
+
+        - ``x``, ``y``, ``length``, ``timeResolution``, ``lengthResolution``, ``temperature``, ``mass``: As
+        ``broaden``.
+
+    Returns:
+        ndarray: Broadened cross-section at each energy, read-only as it may be shared.
+    """
+    key = (name, float(length), float(timeResolution), float(lengthResolution), float(temperature), mass)
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    fingerprint = hash((x.tobytes(), y.tobytes()))
+    with _broadeningLock:
+        cached = _broadeningCache.get(key, None)
+        if cached is not None and cached[0] == fingerprint:
+            _broadeningCache.move_to_end(key)
+            return cached[1]
+    broadened = broaden(x, y, length, timeResolution, lengthResolution, temperature, mass)
+    broadened.flags.writeable = False
+    with _broadeningLock:
+        _broadeningCache[key] = (fingerprint, broadened)
+        while len(_broadeningCache) > broadeningCacheSize:
+            _broadeningCache.popitem(last=False)
+    return broadened
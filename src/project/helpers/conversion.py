@@ -0,0 +1,87 @@
+from __future__ import annotations
+from collections import OrderedDict
+from threading import RLock
+
+import numpy as np
+from numpy import ndarray
+
+neutronMass = float(1.68e-27)
+electronCharge = float(1.60e-19)
+
+# Converted axes keyed by (spectrum name, flight length), least recently used first.
+_tofAxisCache: OrderedDict[tuple[str, float], tuple[int, ndarray]] = OrderedDict()
+tofAxisCacheSize: int = 32
+# Spectra are converted on the worker thread of the spectra loader as well as the GUI thread.
+_tofAxisLock = RLock()
+
+
+def energyToTOF(xData: float | ndarray, length: float) -> float | ndarray:
+    """
+    ``energyToTOF``
+    ---------------
+
+    Converts energy (eV) to time of flight (us) for a given flight path length, element-wise for arrays.
+
+    Args:
+        - ``xData`` (float | ndarray): Energy value(s) in eV.
+
+        - ``length`` (float): Flight path length in metres.
+
+    Returns:
+        float | ndarray: Time of flight value(s) in us.
+    """
+    return length * 1e6 * np.sqrt(0.5 * neutronMass / (np.asarray(xData, dtype=np.float64) * electronCharge))
+
+
+def tofToEnergy(xData: float | ndarray, length: float) -> float | ndarray:
+    """
+    ``tofToEnergy``
+    ---------------
+
+    Converts time of flight (us) to energy (eV) for a given flight path length, the inverse of ``energyToTOF``.
+
+    Args:
+        - ``xData`` (float | ndarray): Time of flight value(s) in us.
+
+        - ``length`` (float): Flight path length in metres.
+
+    Returns:
+        float | ndarray: Energy value(s) in eV.
+    """
+    return 0.5 * neutronMass * (length * 1e6 / np.asarray(xData, dtype=np.float64)) ** 2 / electronCharge
+
+
+def getTOFAxis(name: str, xData: ndarray, length: float) -> ndarray:
+    """
+    ``getTOFAxis``
+    --------------
+
+    Returns the time of flight axis of a spectrum, reusing the conversion from a previous call with the same spectrum
+    name, flight length and energy axis.
+
+    Args:
+        - ``name`` (str): Spectrum name.
+
+        - ``xData`` (ndarray): Energy axis of the spectrum.
+
+        - ``length`` (float): Flight path length in metres.
+
+    Returns:
+        ndarray: Time of flight axis, read-only as it may be shared.
+    """
+    xData = np.ascontiguousarray(xData, dtype=np.float64)
+    key = (name, float(length))
+    # Hashing the raw bytes is several times cheaper than the conversion and catches altered distributions.
+    fingerprint = hash(xData.tobytes())
+    with _tofAxisLock:
+        cached = _tofAxisCache.get(key, None)
+        if cached is not None and cached[0] == fingerprint:
+            _tofAxisCache.move_to_end(key)
+            return cached[1]
+    tofX = energyToTOF(xData, length)
+    tofX.flags.writeable = False
+    with _tofAxisLock:
+        _tofAxisCache[key] = (fingerprint, tofX)
+        while len(_tofAxisCache) > tofAxisCacheSize:
+            _tofAxisCache.popitem(last=False)
+    return tofX
@@ -1,23 +1,30 @@
 import numpy as np
 
 
-def fitBoxes(array, dboxes):
+def fitBoxes(array, dboxes, axis=None):
     """Forces all the y values of an array to be fit within a made-up mesh of a certain amount of points.
     This amount of points is actually given by as a density, so that num_points = (y_max - y_min)*density
     inputs:
         -array: (np.ndarray):
             numpy array to fit
         - dboxes:
-            density of points/boxes
+            density of points/boxes, a scalar or one per row when batched
+        - axis: (int, optional)
+            None: the whole array shares one mesh.
+            int: every slice along this axis is fitted to its own mesh, i.e. many regions at once.
     outputs:
-        -fitted data as an array of the same shape, box width"""
+        -fitted data as an array of the same shape, box width (one per slice when batched)"""
     try:
-        b0 = np.min(array)
-        b1 = np.max(array)
+        array = np.asarray(array)
+        b0 = np.min(array, axis=axis, keepdims=axis is not None)
+        b1 = np.max(array, axis=axis, keepdims=axis is not None)
+        if axis is not None:
+            dboxes = np.expand_dims(dboxes, axis) if np.ndim(dboxes) else dboxes
         nboxes = dboxes * (b1 - b0)
         norm = (array - b0) / (b1 - b0)
         fitn = np.around(norm * (nboxes - 1)) / (nboxes - 1)
         fit = (b1 - b0) * fitn + b0
-        return fit, (b1 - b0) / (2 * nboxes)
+        boxwidth = (b1 - b0) / (2 * nboxes)
+        return fit, boxwidth if axis is None else np.squeeze(boxwidth, axis)
     except Exception:
         return None, None
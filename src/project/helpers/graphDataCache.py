@@ -0,0 +1,202 @@
+from __future__ import annotations
+import json
+import os
+from os import path
+
+import numpy as np
+from numpy import ndarray
+import pandas
+from pandas import DataFrame
+
+graphDataDir = f"{path.dirname(path.dirname(__file__))}/data/Graph Data/"
+graphCacheDir = f"{path.dirname(path.dirname(__file__))}/data/Cache/Graph Data/"
+
+
+def _getCachePaths(filepath: str, dataDir: str = graphDataDir, cacheDir: str = graphCacheDir) -> tuple[str] | None:
+    """
+    ``_getCachePaths``
+    ------------------
+
+    Returns the binary array and metadata filepaths used to cache ``filepath``, or None if the file is not part of the
+    graph data library, in which case it is never cached.
+
+    Args:
+        - ``filepath`` (str): Filepath of the source csv.
+
+        - ``dataDir`` (str): Root directory of the graph data library.
+
+        - ``cacheDir`` (str): Root directory of the binary cache.
+
+    Returns:
+        tuple[str] | None: (arrayPath, metaPath) or None.
+    """
+    source = path.normcase(path.abspath(filepath))
+    root = path.normcase(path.abspath(dataDir))
+    try:
+        if path.commonpath([source, root]) != root:
+            return None
+    except ValueError:
+        # Paths on different drives.
+        return None
+    relative = path.splitext(path.relpath(source, root))[0]
+    return f"{path.join(cacheDir, relative)}.npy", f"{path.join(cacheDir, relative)}.json"
+
+
+def _readCsvArray(filepath: str) -> ndarray:
+    """
+    ``_readCsvArray``
+    -----------------
+
+    Parses a graph data csv into a contiguous float64 array of shape (2, n), row 0 being x and row 1 being y.
+
+    Args:
+        - ``filepath`` (str): Filepath of the csv.
+
+    Returns:
+        ndarray: (x, y) array.
+    """
+    graphData = pandas.read_csv(filepath, header=None, usecols=[0, 1], dtype=np.float64, engine="c")
+    return np.ascontiguousarray(graphData.to_numpy().T)
+
+
+def cacheGraphArray(filepath: str, dataDir: str = graphDataDir, cacheDir: str = graphCacheDir) -> ndarray:
+    """
+    ``cacheGraphArray``
+    -------------------
+
+    Converts a single graph data csv into its binary form, tagged with the source files modification time and size.
+    The array is written to a temporary file first and then moved into place so a partially written cache is never
+    read.
+
+    Args:
+        - ``filepath`` (str): Filepath of the source csv.
+
+        - ``dataDir`` (str): Root directory of the graph data library.
+
+        - ``cacheDir`` (str): Root directory of the binary cache.
+
+    Returns:
+        ndarray: The parsed (x, y) array.
+    """
+    array = _readCsvArray(filepath)
+    cachePaths = _getCachePaths(filepath, dataDir, cacheDir)
+    if cachePaths is None:
+        return array
+    arrayPath, metaPath = cachePaths
+    stat = os.stat(filepath)
+    try:
+        os.makedirs(path.dirname(arrayPath), exist_ok=True)
+        with open(f"{arrayPath}.tmp", "wb") as file:
+            np.save(file, array)
+        os.replace(f"{arrayPath}.tmp", arrayPath)
+        with open(metaPath, "w") as file:
+            json.dump({"mtime": stat.st_mtime_ns, "size": stat.st_size, "points": array.shape[1]}, file)
+    except OSError:
+        # Read-only installs still work, they just parse the csv every time.
+        pass
+    return array
+
+
+def loadGraphArray(filepath: str, dataDir: str = graphDataDir, cacheDir: str = graphCacheDir) -> ndarray:
+    """
+    ``loadGraphArray``
+    ------------------
+
+    Returns the (x, y) array of a graph data csv. Files within the graph data library are memory-mapped from the binary
+    cache, which is rebuilt whenever the source modification time or size no longer matches. Files outside the library
+    are parsed directly.
+
+    The returned array is mapped copy-on-write, any in-place changes stay private to the caller.
+
+    Args:
+        - ``filepath`` (str): Filepath of the source csv.
+
+        - ``dataDir`` (str): Root directory of the graph data library.
+
+        - ``cacheDir`` (str): Root directory of the binary cache.
+
+    Returns:
+        ndarray: Array of shape (2, n).
+    """
+    cachePaths = _getCachePaths(filepath, dataDir, cacheDir)
+    if cachePaths is None:
+        return _readCsvArray(filepath)
+    arrayPath, metaPath = cachePaths
+    stat = os.stat(filepath)
+    try:
+        with open(metaPath, "r") as file:
+            meta = json.load(file)
+        if meta["mtime"] == stat.st_mtime_ns and meta["size"] == stat.st_size:
+            return np.load(arrayPath, mmap_mode="c")
+    except (OSError, ValueError, KeyError):
+        pass
+    cacheGraphArray(filepath, dataDir, cacheDir)
+    try:
+        return np.load(arrayPath, mmap_mode="c")
+    except (OSError, ValueError):
+        return _readCsvArray(filepath)
+
+
+def loadGraphData(filepath: str, names: list[str] = None) -> DataFrame:
+    """
+    ``loadGraphData``
+    -----------------
+
+    Drop-in replacement for ``pandas.read_csv(filepath, header=None)`` on graph data files, returning a two column
+    DataFrame backed by the cached array where possible.
+
+    Args:
+        - ``filepath`` (str): Filepath of the source csv.
+
+        - ``names`` (list[str], optional): Column names. Defaults to None, giving columns 0 and 1.
+
+    Returns:
+        DataFrame: Graph data.
+    """
+    if _getCachePaths(filepath) is None:
+        return pandas.read_csv(filepath, header=None, names=names).iloc[:, :2]
+    array = loadGraphArray(filepath)
+    return DataFrame(array.T, columns=names, copy=False)
+
+
+def convertGraphData(dataDir: str = graphDataDir, cacheDir: str = graphCacheDir) -> list[str]:
+    """
+    ``convertGraphData``
+    --------------------
+
+    One-time conversion of every csv in the graph data library (including compounds) into the binary cache. Files
+    whose cache is already up to date are skipped.
+
+    Args:
+        - ``dataDir`` (str): Root directory of the graph data library.
+
+        - ``cacheDir`` (str): Root directory of the binary cache.
+
+    Returns:
+        list[str]: Filepaths which were (re)converted.
+    """
+    converted = []
+    for root, _, files in os.walk(dataDir):
+        for file in sorted(files):
+            if not file.endswith(".csv"):
+                continue
+            filepath = path.join(root, file)
+            arrayPath, metaPath = _getCachePaths(filepath, dataDir, cacheDir)
+            stat = os.stat(filepath)
+            try:
+                with open(metaPath, "r") as metaFile:
+                    meta = json.load(metaFile)
+                if meta["mtime"] == stat.st_mtime_ns and meta["size"] == stat.st_size and path.exists(arrayPath):
+                    continue
+            except (OSError, ValueError, KeyError):
+                pass
+            try:
+                cacheGraphArray(filepath, dataDir, cacheDir)
+            except (pandas.errors.EmptyDataError, ValueError):
+                continue
+            converted.append(filepath)
+    return converted
+
+
+if __name__ == "__main__":
+    print(f"Converted {len(convertGraphData())} files.")
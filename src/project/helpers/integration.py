@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from pandas import DataFrame
-from scipy.integrate import trapezoid, simpson
 
 from helpers.nearestNumber import nearestnumber
 
@@ -29,13 +28,17 @@ def integrate_trapz(graphData: DataFrame, leftLimit: float, rightLimit: float) -
     peakR = (graphData.iloc[-1, 0], graphData.iloc[-1, 1])
 
     x, y = graphData.iloc[:, 0], graphData.iloc[:, 1]
+    # Imported on first use, scipy.integrate being slow to import and only needed when no integral index is available.
+    from scipy.integrate import trapezoid
 
     return trapezoid(y, x) - (peakR[0] - peakL[0]) * (peakL[1] + peakR[1]) / 2
 
 
 def integrate_simps(graphData: DataFrame, leftLimit: tuple[float], rightLimit: tuple[float]) -> float:
     """
-    integrate_simps Integrates the graphdata about the given limits, using the simpsons rule.
+    integrate_simps Integrates the graphdata about the given limits, using the simpsons rule of the installed scipy.
+    Before scipy 1.11 windows with an odd number of intervals are integrated with ``even='avg'``, so they differ
+    slightly from ``IntegralIndex``, which follows scipy 1.11.
 
     Args:
         graphData (DataFrame): graphs xy data.
@@ -57,4 +60,6 @@ def integrate_simps(graphData: DataFrame, leftLimit: tuple[float], rightLimit: t
 
     x, y = graphData.iloc[:, 0], graphData.iloc[:, 1]
 
+    from scipy.integrate import simpson
+
     return simpson(y, x) - (peakR[0] - peakL[0]) * (peakL[1] + peakR[1]) / 2
@@ -0,0 +1,169 @@
+from __future__ import annotations
+import os
+import re
+from typing import Callable
+
+import numpy as np
+from numpy import ndarray
+import pandas
+
+# Bytes read to sniff the format of a file, and rows parsed at a time.
+sniffSize = 65536
+chunkRows = 1_000_000
+# Files larger than this are parsed as float32 unless a dtype is given, halving the memory of the points read.
+float32Size = 256 * 1024 ** 2
+# Relative resolution, dx/x, at which event data is histogrammed when no resolution is given.
+eventResolution = 1e-3
+
+_numberPattern = re.compile(r"[+-]?(\d+([.,]\d*)?|[.,]\d+)([eE][+-]?\d+)?|[+-]?(inf|nan)", re.IGNORECASE)
+
+
+def sniffFormat(filepath: str, size: int = sniffSize) -> dict:
+    """
+    ``sniffFormat``
+    ---------------
+
+    Detects the layout of a measured data file from its first ``size`` bytes. Leading lines which are not numeric,
+    such as comments or column names, are skipped. Fields are delimited by the first of a tab, ';' or ',' found in
+    the first numeric line, otherwise by whitespace, and a tab or ';' delimited file whose fields contain ',' is taken
+    to use decimal commas.
+
+    Args:
+        - ``filepath`` (str): Filepath of the csv, txt or dat file.
+
+        - ``size`` (int, optional): Number of bytes to sniff. Defaults to ``sniffSize``.
+
+    Raises:
+        pandas.errors.EmptyDataError: The first block of the file has no numeric lines.
+
+    Returns:
+        dict: ``pandas.read_csv`` keyword arguments 'sep', 'decimal', 'skiprows' and 'usecols', the latter being [0]
+        for event data, a single column of x-coords, and [0, 1] otherwise.
+    """
+    with open(filepath, "r", errors="replace") as file:
+        block = file.read(size)
+    lines = block.splitlines()
+    # The last line of a full block may be cut short.
+    if len(block) == size and len(lines) > 1:
+        lines = lines[:-1]
+
+    for skiprows, line in enumerate(lines):
+        line = line.strip()
+        for sep in ["\t", ";", ",", r"\s+"]:
+            if sep == r"\s+" or sep in line:
+                break
+        fields = [field.strip() for field in re.split(sep, line) if field.strip() != ""]
+        if fields and all(_numberPattern.fullmatch(field) for field in fields[:2]):
+            break
+    else:
+        raise pandas.errors.EmptyDataError(f"No numeric data in {os.path.basename(filepath)}")
+
+    decimal = "," if sep in ["\t", ";"] and any("," in field for field in fields) else "."
+    return {"sep": sep, "decimal": decimal, "skiprows": skiprows, "usecols": [0] if len(fields) == 1 else [0, 1]}
+
+
+def _getBinIndexes(x: ndarray, binWidth: float, relative: bool) -> ndarray:
+    """
+    Index of the bin of each x-coord, of width ``binWidth``, or of width ``binWidth`` times its lower edge if
+    ``relative``.
+    """
+    if relative:
+        return np.floor(np.log(x) / np.log1p(binWidth)).astype(np.int64)
+    return np.floor(x / binWidth).astype(np.int64)
+
+
+def _getBinEdges(indexes: ndarray, binWidth: float, relative: bool) -> tuple[ndarray, ndarray]:
+    """
+    Lower and upper edges of the bins of ``indexes``.
+    """
+    if relative:
+        return (1 + binWidth) ** indexes.astype(np.float64), (1 + binWidth) ** (indexes + 1.0)
+    return indexes * binWidth, (indexes + 1.0) * binWidth
+
+
+def _mergeBins(indexes: ndarray, sums: ndarray) -> tuple[ndarray, ndarray]:
+    """
+    Sums the columns of ``sums`` sharing a bin index, giving the sorted unique indexes and their sums.
+    """
+    unique, inverse = np.unique(indexes, return_inverse=True)
+    return unique, np.stack([np.bincount(inverse, weights=row, minlength=unique.size) for row in sums])
+
+
+def readMeasuredData(filepath: str, dtype: type = None, binWidth: float = None, relative: bool = False,
+                     progress: Callable[[float], None] = None, chunkSize: int = chunkRows) -> ndarray:
+    """
+    ``readMeasuredData``
+    --------------------
+
+    Reads a measured spectrum or event list in chunks, so files far larger than memory can be imported when rebinned.
+    The format is found by ``sniffFormat``. Rows whose x-coords or y-coords are not finite are dropped.
+
+    When rebinned, each bin holds the mean x-coord and y-coord of its points, its memory being that of the bins rather
+    than of the points. Event data, a single column of x-coords such as times of flight, is always histogrammed, each
+    bin holding its centre and its number of events per unit x.
+
+    Args:
+        - ``filepath`` (str): Filepath of the csv, txt or dat file.
+
+        - ``dtype`` (type, optional): Type the values are parsed as. Defaults to None, float32 for files larger than
+        ``float32Size`` and float64 otherwise.
+
+        - ``binWidth`` (float, optional): Width of the bins to rebin into, or the ratio of their width to their lower
+        edge if ``relative``. Defaults to None, no rebinning, or ``eventResolution`` relative bins for event data.
+
+        - ``relative`` (bool, optional): Whether bins are logarithmic, of constant dx/x, dropping points at x <= 0.
+        Defaults to False.
+
+        - ``progress`` (Callable[[float], None], optional): Called with the fraction of the file read after each
+        chunk. Defaults to None.
+
+        - ``chunkSize`` (int, optional): Number of rows parsed at a time. Defaults to ``chunkRows``.
+
+    Raises:
+        ValueError: ``binWidth`` is not positive, or a field is not numeric.
+        pandas.errors.EmptyDataError: The file has no numeric data.
+
+    Returns:
+        ndarray: Array of shape (2, n), x-coords in row 0 and y-coords in row 1, the bins being in ascending order.
+    """
+    csvFormat = sniffFormat(filepath)
+    isEvents = len(csvFormat["usecols"]) == 1
+    if isEvents and binWidth is None:
+        binWidth, relative = eventResolution, True
+    if binWidth is not None and not binWidth > 0:
+        raise ValueError(f"Bin width must be positive, not {binWidth}")
+    fileSize = os.path.getsize(filepath)
+    if dtype is None:
+        dtype = np.float32 if fileSize > float32Size else np.float64
+
+    points = []
+    binIndexes, binSums = np.zeros(0, dtype=np.int64), np.zeros((3, 0))
+    with open(filepath, "rb") as file:
+        reader = pandas.read_csv(file, header=None, dtype=dtype, engine="c",
+                                 chunksize=chunkSize, comment="#", skip_blank_lines=True, **csvFormat)
+        for chunk in reader:
+            chunk = chunk.to_numpy().T
+            x = chunk[0]
+            y = np.ones_like(x) if isEvents else chunk[1]
+            keep = np.isfinite(x) & np.isfinite(y)
+            if relative:
+                keep &= x > 0
+            if binWidth is None:
+                points.append(chunk[:, keep])
+            elif keep.any():
+                x, y = x[keep], y[keep]
+                binIndexes, binSums = _mergeBins(np.concatenate([binIndexes, _getBinIndexes(x, binWidth, relative)]),
+                                                 np.hstack([binSums, [x, y, np.ones_like(x)]]))
+            if progress is not None:
+                progress(min(file.tell() / max(fileSize, 1), 1.0))
+
+    if binWidth is None:
+        if not points:
+            raise pandas.errors.EmptyDataError(f"No numeric data in {os.path.basename(filepath)}")
+        return np.ascontiguousarray(np.hstack(points))
+    if binIndexes.size == 0:
+        raise pandas.errors.EmptyDataError(f"No numeric data in {os.path.basename(filepath)}")
+    if isEvents:
+        lower, upper = _getBinEdges(binIndexes, binWidth, relative)
+        return np.stack([(lower + upper) / 2, binSums[1] / (upper - lower)])
+    return np.stack([binSums[0] / binSums[2], binSums[1] / binSums[2]])
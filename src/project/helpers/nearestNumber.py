@@ -21,3 +21,28 @@ def nearestnumber(x: list[float], target: float) -> float:
     ).argmin()  # Finds the absolute difference between the value and the target
     # then gives the smallest number in the array and returns it
     return array[value_index]
+
+
+def nearestnumbers(x: list[float], targets: list[float]) -> np.ndarray:
+    """
+    Vectorised ``nearestnumber``, finds the closest value in a list to each target value
+
+    Args:
+        x (list[float]): List of values, in any order
+        targets (list[float]): Target values
+
+    Returns:
+        ndarray: Nearest value in x from each target, the first in x on ties
+    """
+    array = np.asarray(x, dtype=np.float64)
+    targets = np.asarray(targets, dtype=np.float64)
+    order = np.argsort(array, kind="stable")
+    sortedArray = array[order]
+    right = np.clip(np.searchsorted(sortedArray, targets, side="left"), 0, array.size - 1)
+    left = np.clip(right - 1, 0, None)
+    # Repeated values are in their original order, the first of each is the first in x.
+    leftFirst = np.searchsorted(sortedArray, sortedArray[left], side="left")
+    leftDistance = np.abs(sortedArray[left] - targets)
+    rightDistance = np.abs(sortedArray[right] - targets)
+    useLeft = (leftDistance < rightDistance) | ((leftDistance == rightDistance) & (order[leftFirst] < order[right]))
+    return np.where(useLeft, sortedArray[left], sortedArray[right])
@@ -1,7 +1,43 @@
 import numpy as np
+from math import comb
 
 
-def smooth(arr: np.ndarray, it: int):
+def _smoothRows(arr: np.ndarray, it: int) -> np.ndarray:
+    """
+    ``_smoothRows``
+    ---------------
+    Smooths the last axis of an array, every other axis being independent rows. The outermost points are set to 0 on
+    each iteration.
+    inputs:
+        - arr: (np.ndarray):
+            float array to smooth.
+        - it: (int)
+            number of iterations
+    outputs:
+        - smoothed array of the same shape"""
+    out = np.array(arr, dtype=np.float64)
+    size = out.shape[-1]
+    if it <= 0:
+        return out
+    if size < 3:
+        return np.zeros_like(out)
+    if it == 1 or size <= 4 * it + 2:
+        for _ in range(it):
+            out[..., 1:-1] = (out[..., :-2] + 2 * out[..., 1:-1] + out[..., 2:]) / 4
+            out[..., [0, -1]] = 0.
+        return out
+
+    # Away from the edges ``it`` passes of {1 2 1}/4 are a single pass of the binomial kernel of width 2 * it + 1.
+    kernel = np.array([comb(2 * it, k) for k in range(2 * it + 1)], dtype=np.float64) / 4 ** it
+    windows = np.lib.stride_tricks.sliding_window_view(arr, 2 * it + 1, axis=-1)
+    out[..., it:size - it] = windows @ kernel
+    # Points within ``it`` of an edge see the zeroed edges, these only depend on the outermost 2 * it + 1 points.
+    out[..., :it] = _smoothRows(arr[..., :2 * it + 1], it)[..., :it]
+    out[..., size - it:] = _smoothRows(arr[..., size - 2 * it - 1:], it)[..., it + 1:]
+    return out
+
+
+def smooth(arr: np.ndarray, it: int, batched: bool = False):
     """
     ``smooth``
     ----------
@@ -12,22 +48,17 @@ def smooth(arr: np.ndarray, it: int):
             numpy array to smooth.
         -it: (int)
             number of iterations
+        - batched: (bool)
+            True: every row of a 2-D array is smoothed independently, i.e. many spectra at once.
+            False: a 2-D array is treated as x and y rows.
     outputs:
         - smoothed array"""
     if not isinstance(it, int):
         return
-    if len(np.shape(arr)) > 1:
-        arr0 = np.copy(arr)[1]
-    else:
-        arr0 = np.copy(arr)
-    for j in range(it):
-        temp = [0.]
-        for i in range(1, np.size(arr0) - 1):
-            temp.append((arr0[i - 1] + 2 * arr0[i] + arr0[i + 1]) / 4)
-        temp.append(0.)
-        arr0 = np.copy(np.array(temp))
-    if len(np.shape(arr)) > 1 and np.shape(arr)[0] > 1:
-        arr0 = [arr[0], arr0]
-        for i in range(2, np.shape(arr)[0]):
-            arr0.append(arr[i])
-    return np.array(arr0)
+    arr = np.asarray(arr)
+    if batched or arr.ndim == 1:
+        return _smoothRows(arr, it)
+    smoothed = _smoothRows(arr[1], it)
+    if arr.shape[0] > 1:
+        smoothed = np.array([arr[0], smoothed, *arr[2:]])
+    return smoothed
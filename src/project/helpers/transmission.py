@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import numpy as np
+from numpy import ndarray
+
+avogadro = 6.02214076e23
+# Square centimetres in a barn.
+barn = 1e-24
+
+
+def arealDensity(thickness: float | ndarray, density: float, molarMass: float) -> float | ndarray:
+    """
+    ``arealDensity``
+    ----------------
+
+    Args:
+        - ``thickness`` (float | ndarray): Sample thickness(es) in cm.
+
+        - ``density`` (float): Sample density in g/cm^3.
+
+        - ``molarMass`` (float): Molar mass of the sample in g/mol.
+
+    Returns:
+        float | ndarray: Areal density for each thickness in atoms/b.
+    """
+    return np.asarray(thickness, dtype=np.float64) * density * avogadro / molarMass * barn
+
+
+def transmission(crossSection: ndarray, arealDensity: float | ndarray) -> ndarray:
+    """
+    ``transmission``
+    ----------------
+
+    Fraction of neutrons passing through a sample without interacting, exp(-n·σ).
+
+    Args:
+        - ``crossSection`` (ndarray): Total cross-section (b) at each energy, of shape (m,), or (k, m) for k
+        materials.
+
+        - ``arealDensity`` (float | ndarray): Areal density (atoms/b) of the sample, or of shape (t,) for t
+        thicknesses.
+
+    Returns:
+        ndarray: Transmission of shape ``arealDensity.shape + crossSection.shape``, e.g. (t, m) for t thicknesses.
+    """
+    return np.exp(-np.multiply.outer(arealDensity, np.asarray(crossSection, dtype=np.float64)))
+
+
+def captureYield(totalCrossSection: ndarray, captureCrossSection: ndarray,
+                 arealDensity: float | ndarray) -> ndarray:
+    """
+    ``captureYield``
+    ----------------
+
+    Fraction of neutrons captured in a sample, (1 - exp(-n·σt))·σg/σt, neglecting multiple scattering.
+
+    Args:
+        - ``totalCrossSection`` (ndarray): Total cross-section (b) at each energy, of shape (m,) or (k, m).
+
+        - ``captureCrossSection`` (ndarray): Capture cross-section (b) at the same energies.
+
+        - ``arealDensity`` (float | ndarray): Areal density (atoms/b) of the sample, or of shape (t,) for t
+        thicknesses.
+
+    Returns:
+        ndarray: Capture yield of shape ``arealDensity.shape + totalCrossSection.shape``, 0 where the total
+        cross-section is not positive.
+    """
+    totalCrossSection = np.asarray(totalCrossSection, dtype=np.float64)
+    captureCrossSection = np.asarray(captureCrossSection, dtype=np.float64)
+    captured = np.divide(captureCrossSection, totalCrossSection, out=np.zeros_like(totalCrossSection),
+                         where=totalCrossSection > 0)
+    return -np.expm1(-np.multiply.outer(arealDensity, totalCrossSection)) * captured
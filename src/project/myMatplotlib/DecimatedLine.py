@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import numpy as np
+from numpy import ndarray
+from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
+
+
+class MinMaxPyramid:
+    """
+    Multi-resolution pyramid of a series, level ``k`` holding the index of the lowest and highest point of each block
+    of ``2 ** k`` consecutive points. Envelopes are built from these indexes, so every point drawn is a point of the
+    series and the extremes of each pixel column, such as resonance peaks, are kept exactly.
+    """
+
+    x: ndarray
+    y: ndarray
+    minIndexes: list[ndarray]
+    maxIndexes: list[ndarray]
+
+    def __init__(self, x: ndarray, y: ndarray) -> None:
+        """
+        Args:
+            - ``x`` (ndarray): x-coords of the series.
+
+            - ``y`` (ndarray): y-coords of the series.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if x.size > 1 and not (x[1:] >= x[:-1]).all():
+            order = np.argsort(x, kind='stable')
+            x, y = x[order], y[order]
+        self.x, self.y = x, y
+
+        indexes = np.arange(x.size, dtype=np.int64)
+        self.minIndexes, self.maxIndexes = [indexes], [indexes]
+        while self.maxIndexes[-1].size > 1:
+            self.minIndexes.append(self._reduce(self.minIndexes[-1], np.less))
+            self.maxIndexes.append(self._reduce(self.maxIndexes[-1], np.greater))
+
+    def _reduce(self, indexes: ndarray, compare) -> ndarray:
+        """
+        Merges each pair of blocks, keeping the index of the point which ``compare`` prefers.
+        """
+        first = indexes[0::2]
+        second = indexes[1::2]
+        if second.size < first.size:
+            second = np.append(second, first[-1])
+        return np.where(compare(self.y[second], self.y[first]), second, first)
+
+    def envelope(self, left: float = -np.inf, right: float = np.inf, columns: int = 1000,
+                 log: bool = False) -> tuple[ndarray, ndarray]:
+        """
+        ``envelope``
+        ------------
+
+        Returns the lowest and highest point within each pixel column of the view, in the order of the series. Views
+        with few points return every point, along with one point either side so the line reaches the edges.
+
+        Args:
+            - ``left`` (float, optional): Left limit of the view. Defaults to -inf.
+
+            - ``right`` (float, optional): Right limit of the view. Defaults to inf.
+
+            - ``columns`` (int, optional): Number of pixel columns across the view. Defaults to 1000.
+
+            - ``log`` (bool, optional): Whether the x-axis is logarithmic, spacing the columns evenly in log(x).
+            Defaults to False.
+
+        Returns:
+            tuple[ndarray, ndarray]: x-coords and y-coords of the envelope.
+        """
+        left, right = min(left, right), max(left, right)
+        columns = max(int(columns), 1)
+        low = max(int(np.searchsorted(self.x, left, side='left')) - 1, 0)
+        high = min(int(np.searchsorted(self.x, right, side='right')) + 1, self.x.size)
+        count = high - low
+        if count <= 4 * columns:
+            return self.x[low:high], self.y[low:high]
+
+        left, right = max(left, self.x[0]), min(right, self.x[-1])
+        if log:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                left, right = np.log10(left), np.log10(right)
+        scale = columns / (right - left) if np.isfinite(left) and np.isfinite(right) and right > left else 0
+
+        def getColumns(indexes: ndarray) -> ndarray:
+            x = self.x[indexes]
+            if log:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    x = np.log10(x)
+            column = np.clip(np.floor((x - left) * scale), -1, columns)
+            return np.nan_to_num(column, nan=-1).astype(np.int64)
+
+        # Starting from between 4 and 8 blocks per column, blocks which straddle a column edge are split into their
+        # halves until each lies within one column.
+        level = min(int(np.log2(count / (4 * columns))), len(self.maxIndexes) - 1)
+        blocks = np.arange(low >> level, ((high - 1) >> level) + 1)
+        candidates = []
+        while blocks.size:
+            starts = blocks << level
+            ends = np.minimum(starts + (1 << level), self.x.size) - 1
+            straddling = getColumns(starts) != getColumns(ends)
+            whole = blocks[~straddling]
+            candidates += [self.minIndexes[level][whole], self.maxIndexes[level][whole]]
+            blocks = (blocks[straddling, None] * 2 + [0, 1]).ravel()
+            level -= 1
+            blocks = blocks[blocks << level < self.x.size] if level >= 0 else blocks[:0]
+        candidates = np.concatenate(candidates)
+        column = getColumns(candidates)
+
+        order = np.lexsort((self.y[candidates], column))
+        starts = np.flatnonzero(np.diff(column[order], prepend=-2))
+        ends = np.append(starts[1:], order.size) - 1
+        selected = np.unique(np.concatenate([candidates[order[starts]], candidates[order[ends]]]))
+        return self.x[selected], self.y[selected]
+
+
+class DecimatedLine(Line2D):
+    """
+    Line drawing a min-max envelope of its series, recalculated from a ``MinMaxPyramid`` whenever the x-limits of
+    its axes change, so redraws cost in proportion to the width of the axes rather than the length of the series.
+    """
+
+    pyramid: MinMaxPyramid
+
+    def __init__(self, x: ndarray, y: ndarray, **kwargs) -> None:
+        """
+        Args:
+            - ``x`` (ndarray): x-coords of the series.
+
+            - ``y`` (ndarray): y-coords of the series.
+
+            - ``**kwargs``: Passed to ``Line2D``.
+        """
+        self.pyramid = MinMaxPyramid(x, y)
+        super().__init__(*self.pyramid.envelope(), **kwargs)
+        self._xlimConnection = None
+
+    @classmethod
+    def plot(cls, ax: Axes, x: ndarray, y: ndarray, **kwargs) -> DecimatedLine:
+        """
+        ``plot``
+        --------
+
+        Adds a decimated line to ``ax`` in place of ``ax.plot``, autoscaling the axes to the whole series.
+
+        Args:
+            - ``ax`` (Axes): Axes to plot on.
+
+            - ``x`` (ndarray): x-coords of the series.
+
+            - ``y`` (ndarray): y-coords of the series.
+
+            - ``**kwargs``: Passed to ``Line2D``.
+
+        Returns:
+            DecimatedLine: The line added.
+        """
+        line = cls(x, y, **kwargs)
+        ax.add_line(line)
+        ax.autoscale_view()
+        line._xlimConnection = ax.callbacks.connect('xlim_changed', line.onXlimChanged)
+        line.onXlimChanged(ax)
+        return line
+
+    def setSeries(self, x: ndarray, y: ndarray) -> None:
+        """
+        ``setSeries``
+        -------------
+
+        Replaces the series, e.g. after converting its x-coords.
+
+        Args:
+            - ``x`` (ndarray): x-coords of the series.
+
+            - ``y`` (ndarray): y-coords of the series.
+        """
+        self.pyramid = MinMaxPyramid(x, y)
+        self.onXlimChanged(self.axes)
+
+    def onXlimChanged(self, ax: Axes) -> None:
+        """
+        ``onXlimChanged``
+        -----------------
+
+        Sets the data of the line to the envelope of the current view of ``ax``.
+
+        Args:
+            - ``ax`` (Axes): Axes whose x-limits changed.
+        """
+        if ax is None or self.axes is not ax:
+            return
+        left, right = ax.get_xlim()
+        self.set_data(*self.pyramid.envelope(left, right, ax.bbox.width, ax.get_xscale() == 'log'))
+
+    def remove(self) -> None:
+        if self._xlimConnection is not None and self.axes is not None:
+            self.axes.callbacks.disconnect(self._xlimConnection)
+            self._xlimConnection = None
+        super().remove()
@@ -0,0 +1,177 @@
+from __future__ import annotations
+from typing import Callable
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class SpectraTaskSignals(QObject):
+    """
+    Signals of a ``SpectraTask``, emitted from the worker thread and delivered to the thread of their receivers.
+    """
+    finished = pyqtSignal(object, object)
+    failed = pyqtSignal(object, object)
+
+
+class SpectraTask(QRunnable):
+    """
+    Runnable loading one spectra, emitting the task along with the result or the exception raised. Once cancelled,
+    nothing is emitted.
+    """
+
+    def __init__(self, title: str, load: Callable[[], object]) -> None:
+        """
+        Args:
+            - ``title`` (str): Title of the spectra, e.g. '29-Cu-63_n-g-Energy'.
+
+            - ``load`` (Callable[[], object]): Function loading and analysing the spectra, run on the worker thread.
+        """
+        super(SpectraTask, self).__init__()
+        self.setAutoDelete(False)
+        self.title = title
+        self.load = load
+        self.signals = SpectraTaskSignals()
+        self.isCancelled = False
+
+    def run(self) -> None:
+        if self.isCancelled:
+            return
+        try:
+            result = self.load()
+        except Exception as error:
+            if not self.isCancelled:
+                self.signals.failed.emit(self, error)
+            return
+        if not self.isCancelled:
+            self.signals.finished.emit(self, result)
+
+
+class SpectraLoader(QObject):
+    """
+    Loads and analyses spectra on a background thread, so the GUI stays responsive while large spectra are read and
+    their peaks found. Results are delivered on the GUI thread through ``finished`` and ``failed``, tasks cancelled
+    before they are delivered are discarded.
+
+    A single worker thread is used, the spectra store and the isotope caches being shared with the GUI thread.
+    """
+    finished = pyqtSignal(str, object)
+    failed = pyqtSignal(str, object)
+    progressChanged = pyqtSignal(int, int)
+    # Title of a spectra and the fraction of its file read, see ``reportProgress``.
+    taskProgressChanged = pyqtSignal(str, float)
+
+    def __init__(self, parent: QObject = None) -> None:
+        super(SpectraLoader, self).__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.tasks: dict[str, SpectraTask] = {}
+        self.done = 0
+        self.total = 0
+
+    def isLoading(self, title: str = None) -> bool:
+        """
+        ``isLoading``
+        -------------
+
+        Args:
+            - ``title`` (str, optional): Title of the spectra. Defaults to None, checking for any spectra.
+
+        Returns:
+            bool: Whether the spectra, or any spectra, is still loading.
+        """
+        return bool(self.tasks) if title is None else title in self.tasks
+
+    def submit(self, title: str, load: Callable[[], object]) -> None:
+        """
+        ``submit``
+        ----------
+
+        Queues a spectra to be loaded, cancelling any earlier task for the same title.
+
+        Args:
+            - ``title`` (str): Title of the spectra, e.g. '29-Cu-63_n-g-Energy'.
+
+            - ``load`` (Callable[[], object]): Function loading and analysing the spectra, run on the worker thread.
+        """
+        self.cancel([title])
+        task = SpectraTask(title, load)
+        task.signals.finished.connect(self.onTaskFinished)
+        task.signals.failed.connect(self.onTaskFailed)
+        self.tasks[title] = task
+        self.total += 1
+        self.progressChanged.emit(self.done, self.total)
+        self.pool.start(task)
+
+    def cancel(self, titles: list[str] = None) -> list[str]:
+        """
+        ``cancel``
+        ----------
+
+        Cancels loading spectra, those not yet started are removed from the queue and the results of those running
+        are discarded.
+
+        Args:
+            - ``titles`` (list[str], optional): Titles of the spectra to cancel. Defaults to None, cancelling all.
+
+        Returns:
+            list[str]: Titles of the spectra cancelled.
+        """
+        titles = list(self.tasks) if titles is None else [title for title in titles if title in self.tasks]
+        for title in titles:
+            task = self.tasks.pop(title)
+            task.isCancelled = True
+            self.pool.tryTake(task)
+            self.total -= 1
+        if titles:
+            self.onProgress()
+        return titles
+
+    def waitForDone(self, msecs: int = -1) -> bool:
+        """
+        ``waitForDone``
+        ---------------
+
+        Blocks until the worker thread is idle, results are still delivered through the event loop.
+
+        Args:
+            - ``msecs`` (int, optional): Timeout in milliseconds. Defaults to -1, waiting indefinitely.
+
+        Returns:
+            bool: False if the timeout was reached.
+        """
+        return self.pool.waitForDone(msecs)
+
+    def reportProgress(self, title: str, fraction: float) -> None:
+        """
+        ``reportProgress``
+        ------------------
+
+        Reports how far a task has got, e.g. through reading a large file. May be called from the worker thread, the
+        signal being delivered on the GUI thread.
+
+        Args:
+            - ``title`` (str): Title of the spectra.
+
+            - ``fraction`` (float): Fraction of the task done.
+        """
+        self.taskProgressChanged.emit(title, fraction)
+
+    def onProgress(self) -> None:
+        if not self.tasks:
+            self.done = self.total = 0
+        self.progressChanged.emit(self.done, self.total)
+
+    def onTaskFinished(self, task: SpectraTask, result: object) -> None:
+        if self.tasks.get(task.title, None) is not task:
+            return
+        del self.tasks[task.title]
+        self.done += 1
+        self.onProgress()
+        self.finished.emit(task.title, result)
+
+    def onTaskFailed(self, task: SpectraTask, error: Exception) -> None:
+        if self.tasks.get(task.title, None) is not task:
+            return
+        del self.tasks[task.title]
+        self.done += 1
+        self.onProgress()
+        self.failed.emit(task.title, error)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+import sys
+import os
+import numpy as np
+from scipy.integrate import trapezoid
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from helpers.broadening import boltzmann, broaden, getBroadened, getMassNumber
+from helpers.conversion import tofToEnergy
+
+
+def moments(x: np.ndarray, y: np.ndarray) -> tuple[float, float, float]:
+    """
+    Area, mean and standard deviation of a peak.
+    """
+    area = trapezoid(y, x)
+    mean = trapezoid(x * y, x) / area
+    return area, mean, np.sqrt(trapezoid((x - mean) ** 2 * y, x) / area)
+
+
+class TestBroadening(TestCase):
+
+    def setUp(self) -> None:
+        self.length = 22.804
+        # A narrow resonance of unit area at 500 us on an ascending energy axis.
+        self.tof = np.linspace(200, 1000, 20001)[::-1]
+        self.energy = tofToEnergy(self.tof, self.length)
+        self.y = np.exp(-0.5 * ((self.tof - 500) / 0.2) ** 2) / (0.2 * np.sqrt(2 * np.pi))
+        return super().setUp()
+
+    def test_broaden_none(self):
+        self.assertTrue(np.array_equal(broaden(self.energy, self.y, self.length), self.y))
+
+    def test_broaden_timeResolution(self):
+        broadened = broaden(self.energy, self.y, self.length, timeResolution=2)
+        area, mean, sigma = moments(self.tof[::-1], broadened[::-1])
+        self.assertAlmostEqual(area, 1, places=3)
+        self.assertAlmostEqual(mean, 500, places=2)
+        self.assertAlmostEqual(sigma, np.hypot(0.2, 2), delta=0.02)
+
+    def test_broaden_lengthResolution(self):
+        broadened = broaden(self.energy, self.y, self.length, lengthResolution=self.length * 0.004)
+        _, _, sigma = moments(self.tof[::-1], broadened[::-1])
+        # The resolution is 0.4% of the time of flight.
+        self.assertAlmostEqual(sigma, np.hypot(0.2, 2), delta=0.02)
+        broadened = broaden(self.energy, self.y, self.length, timeResolution=2, lengthResolution=self.length * 0.004)
+        _, _, sigma = moments(self.tof[::-1], broadened[::-1])
+        # The widths add in quadrature, to within the linearisation of the combined resolution.
+        self.assertAlmostEqual(sigma, np.sqrt(0.2 ** 2 + 2 * 2 ** 2), delta=0.05)
+
+    def test_broaden_doppler(self):
+        energy = np.linspace(0.5, 1.5, 20001)
+        y = 1 + np.exp(-0.5 * ((energy - 1) / 1e-3) ** 2)
+        broadened = broaden(energy, y, self.length, temperature=300, mass=100)
+        area, mean, sigma = moments(energy, broadened - 1)
+        # The free gas Doppler width at 1 eV is sqrt(2EkT / A).
+        self.assertAlmostEqual(area, np.sqrt(2 * np.pi) * 1e-3, places=5)
+        # Broadening in the square root of energy raises the mean energy by about kT / A.
+        self.assertAlmostEqual(mean, 1 + boltzmann * 300 / 100, places=4)
+        self.assertAlmostEqual(sigma, np.hypot(1e-3, np.sqrt(2 * boltzmann * 300 / 100)), delta=5e-4)
+        # Flat cross-sections are left unchanged, the edges included.
+        self.assertTrue(np.allclose(broaden(energy, np.ones_like(energy), self.length, 2, 0, 300, 100), 1))
+        # Doppler broadening needs the mass.
+        self.assertTrue(np.array_equal(broaden(energy, y, self.length, temperature=300), y))
+
+    def test_getBroadened(self):
+        broadened = getBroadened("test", self.energy, self.y, self.length, 2)
+        self.assertFalse(broadened.flags.writeable)
+        self.assertIs(getBroadened("test", self.energy, self.y, self.length, 2), broadened)
+        self.assertIsNot(getBroadened("test", self.energy, self.y, self.length, 1), broadened)
+        self.assertIsNot(getBroadened("test", self.energy, self.y * 2, self.length, 2), broadened)
+
+    def test_getMassNumber(self):
+        self.assertEqual(getMassNumber("29-Cu-63_n-g"), 63)
+        self.assertEqual(getMassNumber("52-Te-121m_n-tot"), 121)
+        self.assertIsNone(getMassNumber("compound_water_n-g"))
+        self.assertIsNone(getMassNumber("element_29-Cu_n-g"))
+        self.assertAlmostEqual(getMassNumber("element_29-Cu_n-g", {"29-Cu-63": 0.75, "29-Cu-65": 0.25}), 63.5)
+
+
+if __name__ == '__main__':
+    main()
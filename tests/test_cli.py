@@ -0,0 +1,128 @@
+from __future__ import annotations
+import sys
+import os
+import io
+import tempfile
+import pandas as pd
+from contextlib import redirect_stdout, redirect_stderr
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from NRTI_NRCA_CLI import createSpectra, main as cliMain
+
+
+class TestCLI(TestCase):
+
+    def run_cli(self, *args) -> tuple[int, str]:
+        stdout = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+            try:
+                code = cliMain(list(args))
+            except SystemExit as exit:
+                code = exit.code
+        return code, stdout.getvalue()
+
+    def test_list(self):
+        code, output = self.run_cli("list", "29-Cu-*_n-g")
+        self.assertEqual(code, 0)
+        self.assertEqual(output.split(), ["29-Cu-63_n-g", "29-Cu-65_n-g"])
+
+    def test_peaks(self):
+        with tempfile.TemporaryDirectory() as outputDir:
+            code, _ = self.run_cli("peaks", "29-Cu-63_n-g", "-t", "4.3", "-o", f"{outputDir}/peaks.csv",
+                                   "--limits", f"{outputDir}/limits.csv")
+            self.assertEqual(code, 0)
+            tableData = pd.read_csv(f"{outputDir}/peaks.csv")
+            limits = pd.read_csv(f"{outputDir}/limits.csv", header=None)
+        spectra = createSpectra("29-Cu-63_n-g", threshold=4.3)
+        self.assertEqual(tableData.shape[0], spectra.maxima.shape[1])
+        self.assertEqual(limits.shape, (tableData.shape[0], 2))
+
+    def test_distributions(self):
+        natural = createSpectra("element_29-Cu_n-g", recalculate=False)
+        altered = createSpectra("element_29-Cu_n-g", distributions={"29-Cu-65": 1}, recalculate=False)
+        self.assertTrue(natural.graphData[1].max() != altered.graphData[1].max())
+        code, _ = self.run_cli("export", "29-Cu-63_n-g", "-d", "29-Cu-65=1")
+        self.assertEqual(code, 1)
+        code, _ = self.run_cli("export", "29-Cu-63_n-g", "-l", "n-x=1")
+        self.assertEqual(code, 1)
+
+    def test_length(self):
+        short = createSpectra("29-Cu-63_n-g", tof=True, length={"n-g": 10}, recalculate=False)
+        long = createSpectra("29-Cu-63_n-g", tof=True, length={"n-g": 20}, recalculate=False)
+        self.assertAlmostEqual(long.graphData[0].iloc[-1] / short.graphData[0].iloc[-1], 2)
+
+    def test_length_element(self):
+        code, output = self.run_cli("peaks", "element_29-Cu_n-g", "-t", "4.3")
+        self.assertEqual(code, 0)
+        tableData = pd.read_csv(io.StringIO(output))
+        peak = tableData.iloc[(tableData["Energy (eV)"] - 578).abs().argmin()]
+        self.assertAlmostEqual(peak["TOF (us)"], 68.72, places=2)
+        code, output = self.run_cli("peaks", "element_29-Cu_n-g", "-t", "4.3", "--length", "n-g=10")
+        self.assertEqual(code, 0)
+        tableData = pd.read_csv(io.StringIO(output))
+        peak = tableData.iloc[(tableData["Energy (eV)"] - 578).abs().argmin()]
+        self.assertAlmostEqual(peak["TOF (us)"], 68.72 * 10 / 22.804, places=1)
+
+    def test_find(self):
+        code, output = self.run_cli("find", "6.664", "--tolerance", "1e-4", "--mode", "n-g")
+        self.assertEqual(code, 0)
+        self.assertIn("76-Os-186", output)
+        code, _ = self.run_cli("find", "Cu")
+        self.assertEqual(code, 1)
+
+    def test_match(self):
+        with tempfile.TemporaryDirectory() as outputDir:
+            code, _ = self.run_cli("export", "29-Cu-63_n-g", "-o", f"{outputDir}/sample.csv")
+            self.assertEqual(code, 0)
+            code, output = self.run_cli("match", f"{outputDir}/sample.csv", "-n", "1")
+        self.assertEqual(code, 0)
+        self.assertEqual(output.splitlines()[1].split(",")[:2], ["29-Cu-63", "n-g"])
+
+    def test_fit(self):
+        with tempfile.TemporaryDirectory() as outputDir:
+            code, _ = self.run_cli("export", "element_29-Cu_n-g", "-o", f"{outputDir}/sample.csv")
+            self.assertEqual(code, 0)
+            code, output = self.run_cli("fit", f"{outputDir}/sample.csv", "-e", "Cu,Au", "--window", "1e3-1e5")
+        self.assertEqual(code, 0)
+        self.assertEqual(output.splitlines()[1].split(",")[:2], ["element_29-Cu", "n-g"])
+
+    def test_transmission(self):
+        code, output = self.run_cli("transmission", "29-Cu-63_n-g", "-n", "0,0.01")
+        self.assertEqual(code, 0)
+        model = pd.read_csv(io.StringIO(output))
+        self.assertEqual(model.columns.tolist(), ["Energy (eV)", "0", "0.01"])
+        self.assertTrue((model["0"] == 1).all())
+        spectra = createSpectra("29-Cu-63_n-g", recalculate=False)
+        self.assertEqual(model.shape[0], spectra.graphArray.x.size)
+        self.assertTrue(((model["0.01"] > 0) & (model["0.01"] < 1)).all())
+        code, output = self.run_cli("transmission", "29-Cu-63_n-g", "--capture", "-n", "0.01", "--tof")
+        self.assertEqual(code, 0)
+        self.assertEqual(output.splitlines()[0], "TOF (us),0.01")
+
+    def test_export_broadened(self):
+        code, output = self.run_cli("export", "29-Cu-63_n-g")
+        self.assertEqual(code, 0)
+        pointWise = pd.read_csv(io.StringIO(output), header=None)
+        code, output = self.run_cli("export", "29-Cu-63_n-g", "--resolution", "0.5", "--temperature", "300")
+        self.assertEqual(code, 0)
+        broadened = pd.read_csv(io.StringIO(output), header=None)
+        self.assertTrue((broadened[0] == pointWise[0]).all())
+        self.assertLess(broadened[1].max(), pointWise[1].max())
+        self.assertEqual(self.run_cli("export", "29-Cu-63_n-g", "--temperature", "-1")[0], 1)
+
+    def test_fit_rebin(self):
+        with tempfile.TemporaryDirectory() as outputDir:
+            spectra = createSpectra("element_29-Cu_n-g", recalculate=False)
+            spectra.graphData.to_csv(f"{outputDir}/copper.csv", index=False, header=["Energy (eV)", "Cross section"])
+            code, output = self.run_cli("fit", f"{outputDir}/copper.csv", "-e", "Cu,Cd", "--rebin", "0.01",
+                                        "--relative")
+        self.assertEqual(code, 0)
+        fit = pd.read_csv(io.StringIO(output))
+        self.assertEqual(fit.loc[0, "Name"], "element_29-Cu")
+        self.assertAlmostEqual(fit.loc[0, "Proportion"], 1, delta=0.05)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import sys
+import os
+import numpy as np
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from element.CompositionFit import fitComposition, getCandidateSpectra
+from element.IsotopeBasis import getIsotopeBasis
+
+
+class TestCompositionFit(TestCase):
+
+    def test_getCandidateSpectra(self):
+        spectraNames = ["29-Cu-63_n-g", "29-Cu-65_n-g", "29-Cu-65_n-tot", "element_29-Cu_n-g", "79-Au-197_n-g"]
+        self.assertEqual(getCandidateSpectra(["Cu", "Au"], "n-g", spectraNames=spectraNames),
+                         ["element_29-Cu_n-g", "79-Au-197_n-g"])
+        self.assertEqual(getCandidateSpectra(["29-Cu"], "n-g", isotopes=True, spectraNames=spectraNames),
+                         ["29-Cu-63_n-g", "29-Cu-65_n-g"])
+        self.assertRaises(ValueError, getCandidateSpectra, ["Au"], "n-tot", spectraNames=spectraNames)
+
+    def test_fitComposition(self):
+        candidates = getCandidateSpectra(["Cu", "Cd", "Au"], "n-g")
+        sample = getIsotopeBasis(candidates[:2]).combine(np.array([0.7, 0.3]))
+        x, y = sample[0].to_numpy(), sample[1].to_numpy()
+        fit = fitComposition(x, y, candidates, blockSize=4096)
+        self.assertEqual(fit.points, x.size)
+        self.assertTrue(np.allclose(fit.weights, [0.7, 0.3, 0], atol=1e-3))
+        self.assertAlmostEqual(fit.proportions.sum(), 1)
+        table = fit.toDataFrame()
+        self.assertEqual(table["Name"].tolist(), ["element_29-Cu", "element_48-Cd", "element_79-Au"])
+
+        window = fitComposition(x, y, candidates, window=(1e3, 1e4))
+        self.assertTrue(window.points < fit.points)
+        self.assertTrue(np.allclose(window.weights, [0.7, 0.3, 0], atol=1e-2))
+        self.assertRaises(ValueError, fitComposition, x, y, candidates, window=(-2, -1))
+
+    def test_byElement(self):
+        candidates = getCandidateSpectra(["Cu"], "n-g", isotopes=True)
+        sample = getIsotopeBasis(candidates).combine(np.array([0.5, 0.25]))
+        fit = fitComposition(sample[0].to_numpy(), sample[1].to_numpy(), candidates)
+        table = fit.toDataFrame(byElement=True)
+        self.assertEqual(table["Name"].tolist(), ["element_29-Cu"])
+        self.assertAlmostEqual(table["Weight"][0], 0.75, places=3)
+
+
+if __name__ == '__main__':
+    main()
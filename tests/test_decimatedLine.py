@@ -0,0 +1,74 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+import matplotlib
+from unittest import TestCase, main
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+sys.path.append(os.path.abspath("./src/project/"))
+from myMatplotlib.DecimatedLine import DecimatedLine, MinMaxPyramid  # noqa: E402
+
+
+libraryFilepath = f"{os.path.dirname(os.path.dirname(__file__))}/src/project/data/Graph Data/"
+
+
+class TestMinMaxPyramid(TestCase):
+
+    def setUp(self) -> None:
+        graphData = pd.read_csv(f"{libraryFilepath}92-U-238_n-tot.csv", header=None)
+        self.x = graphData[0].to_numpy()
+        self.y = graphData[1].to_numpy()
+        self.pyramid = MinMaxPyramid(self.x, self.y)
+        return super().setUp()
+
+    def test_envelope_full(self):
+        x, y = self.pyramid.envelope(columns=800, log=True)
+        self.assertLessEqual(x.size, 2 * 802)
+        self.assertTrue((np.diff(x) >= 0).all())
+        self.assertTrue(np.isin(x, self.x).all())
+        self.assertEqual(y.max(), self.y.max())
+        self.assertEqual(y.min(), self.y.min())
+
+    def test_envelope_columns(self):
+        left, right, columns = 1, 1e4, 500
+        x, y = self.pyramid.envelope(left, right, columns, log=True)
+        edges = np.logspace(0, 4, 51)
+        # Each bin spans ten columns, so its extremes are those of the series.
+        for start, end in zip(edges[:-1], edges[1:]):
+            inView = (self.x >= start) & (self.x < end)
+            inEnvelope = (x >= start) & (x < end)
+            self.assertEqual(y[inEnvelope].max(), self.y[inView].max())
+            self.assertEqual(y[inEnvelope].min(), self.y[inView].min())
+
+    def test_envelope_zoomed(self):
+        x, y = self.pyramid.envelope(6.6, 6.8, 1000, log=True)
+        inView = np.flatnonzero((self.x >= 6.6) & (self.x <= 6.8))
+        self.assertTrue(np.array_equal(x, self.x[inView[0] - 1:inView[-1] + 2]))
+
+    def test_descending(self):
+        pyramid = MinMaxPyramid(self.x[::-1], self.y[::-1])
+        self.assertTrue(np.array_equal(pyramid.envelope(columns=300)[1], self.pyramid.envelope(columns=300)[1]))
+
+
+class TestDecimatedLine(TestCase):
+
+    def test_xlim_changed(self):
+        figure, ax = plt.subplots()
+        graphData = pd.read_csv(f"{libraryFilepath}92-U-238_n-tot.csv", header=None)
+        line = DecimatedLine.plot(ax, graphData[0], graphData[1], label="U-238")
+        ax.set_xscale("log")
+        ax.set_xlim(6, 7)
+        x = line.get_xdata()
+        self.assertLess(x.size, graphData.shape[0])
+        self.assertLessEqual(x[0], 6)
+        self.assertGreaterEqual(x[-1], 7)
+        line.remove()
+        self.assertEqual(len(ax.lines), 0)
+        plt.close(figure)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+from __future__ import annotations
+import sys
+import os
+import numpy as np
+import pandas as pd
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+sys.path.append(os.path.abspath("./src/project/element"))
+from SpectraDataStructure import SpectraData
+from element.PeakDetection import PeakDetector
+from helpers.fitBoxes import fitBoxes
+from helpers.smooth import smooth
+
+
+filepath = f"{os.path.dirname(__file__)}"
+libraryFilepath = f"{os.path.dirname(filepath)}/src/project/data/Graph Data/"
+
+
+def definePeaksReference(graphData: pd.DataFrame, maxima: np.ndarray) -> tuple[dict]:
+    """
+    Point-by-point implementation of the Alsina-Ferrer peak limit algorithm, as originally used by
+    ``SpectraData.definePeaks``, kept as the reference for the vectorised version.
+    """
+    params = {'prangemax': 500, 'maxleftslope': 3000, 'maxouterslope': 10, 'slopedrop': .1, 'dboxes': 100,
+              'itersmooth': 1}
+    x, y = graphData.iloc[:, 0].to_numpy(), graphData.iloc[:, 1].to_numpy()
+    limitsX, limitsY = {}, {}
+    derivative = np.array([(y[i + 1] - y[i]) / (x[i + 1] - x[i]) for i in range(x.size - 1)])
+    indexPosDer = np.nonzero(np.int32(derivative < 0) == 0)[0][0]
+    target = np.hstack((np.ones((indexPosDer)), np.zeros((np.size(derivative) - indexPosDer))))
+    derivative = derivative * (np.int64(np.abs(derivative) < params['maxleftslope']) * target + (1 - target))
+    smoothDer = smooth(derivative, params['itersmooth'])
+
+    maxIndexes = [np.nonzero(x == max)[0][0] for max in maxima[0]]
+    for i, max in enumerate(maxima[0]):
+        nleft = maxIndexes[i]
+        nright = x.size - nleft - 1
+        if i == 0 or i == np.size(maxima[0]) - 1:
+            prange = min(params['prangemax'], nleft, nright)
+        else:
+            prange = min(params['prangemax'], maxIndexes[i + 1] - maxIndexes[i - 1], nleft, nright)
+
+        maxIndex = maxIndexes[i]
+        derRegion = smoothDer[maxIndex - prange: maxIndex + prange + 1]
+        for k in range(1, 10):
+            fit, _ = fitBoxes(derRegion, params['dboxes'] * k)
+            temp1, temp2 = np.unique(fit, return_counts=True)
+            if not (temp2 == 1).all():
+                break
+        outerslope = temp1[np.argmax(temp2)]
+        if abs(outerslope) > params['maxouterslope']:
+            outerslope = 0
+        lims = []
+        for sign in [-1, 1]:
+            lock = False
+            for j in range(maxIndex, maxIndex + sign * (prange + 1), sign):
+                decreasing = smoothDer[j + sign] < smoothDer[j]
+                increasing = smoothDer[j + sign] > smoothDer[j]
+                if not lock:
+                    if (decreasing if sign == -1 else increasing):
+                        lock = True
+                        derMax = smoothDer[j]
+                if lock:
+                    if abs((derivative[j] - outerslope) / (derMax - outerslope)) <= params['slopedrop']:
+                        lims.append(j)
+                        break
+                    if smoothDer[j + sign] * smoothDer[j] <= 0:
+                        lims.append(j + sign if j == maxIndex else j)
+                        break
+                    if j == maxIndex + sign * (prange):
+                        lims.append(maxIndex + sign)
+                        break
+        if len(lims) == 2:
+            limitsX[max] = (x[lims[0]], x[lims[1]])
+            limitsY[max] = (y[lims[0]], y[lims[1]])
+    return limitsX, limitsY
+
+
+class TestDefinePeaks(TestCase):
+
+    def assertLimitsEqual(self, graphData: pd.DataFrame, threshold: float = 100) -> None:
+        spectra = SpectraData(name="test", numPeaks=None, tableData=None, graphData=None, graphColour=(0, 0, 0),
+                              isToF=False, distributions=None, defaultDist=None)
+        spectra.graphData = graphData
+        spectra.maxima = np.array(PeakDetector().maxima(graphData, threshold))
+        spectra.definePeaks()
+        limitsX, limitsY = definePeaksReference(graphData, spectra.maxima)
+        self.assertEqual(spectra.maxPeakLimitsX, limitsX)
+        self.assertEqual(spectra.maxPeakLimitsY, limitsY)
+
+    def test_definePeaks_testData(self):
+        for name in ["element_29-Cu_n-g", "element_48-Cd_n-g"]:
+            with self.subTest(name=name):
+                self.assertLimitsEqual(pd.read_csv(f"{filepath}/test_data/graphData/{name}.csv", header=None))
+
+    def test_definePeaks_library(self):
+        for name in ["92-U-238_n-tot", "29-Cu-63_n-g", "element_48-Cd_n-tot", "26-Fe-56_n-g"]:
+            with self.subTest(name=name):
+                self.assertLimitsEqual(pd.read_csv(f"{libraryFilepath}{name}.csv", header=None))
+
+    def test_definePeaks_threshold(self):
+        graphData = pd.read_csv(f"{libraryFilepath}79-Au-197_n-g.csv", header=None)
+        for threshold in [0, 10, 1000]:
+            with self.subTest(threshold=threshold):
+                self.assertLimitsEqual(graphData, threshold)
+
+    def test_updatePeaks_threshold_sweep(self):
+        graphData = pd.read_csv(f"{libraryFilepath}79-Au-197_n-g.csv", header=None)
+        spectra = SpectraData(name="test", numPeaks=None, tableData=None, graphData=None, graphColour=(0, 0, 0),
+                              isToF=False, distributions=None, defaultDist=None)
+        spectra.graphData = graphData
+        for threshold in [1000, 10, 100, 0, 1000]:
+            with self.subTest(threshold=threshold):
+                expected = SpectraData(name="test", numPeaks=None, tableData=None, graphData=None,
+                                       graphColour=(0, 0, 0), isToF=False, distributions=None, defaultDist=None)
+                expected.graphData = graphData.copy()
+                expected.threshold = threshold
+                expected.maxima = np.array(PeakDetector().maxima(expected.graphData, threshold))
+                expected.definePeaks()
+                expected.recalculatePeakData()
+                spectra.threshold = threshold
+                spectra.updatePeaks()
+                self.assertTrue(np.array_equal(spectra.maxima, expected.maxima))
+                self.assertEqual(spectra.maxPeakLimitsX, expected.maxPeakLimitsX)
+                self.assertEqual(spectra.maxPeakLimitsY, expected.maxPeakLimitsY)
+                pd.testing.assert_frame_equal(spectra.tableData, expected.tableData)
+
+
+if __name__ == '__main__':
+    main()
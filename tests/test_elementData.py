@@ -1,5 +1,6 @@
 import sys
 import os
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_frame_equal
 from unittest import TestCase, main
@@ -112,6 +113,47 @@ class TestElemenetData(TestCase):
 
         self.assertNotEqual(element.graphData.shape, self.graphData.shape)
 
+    def test_ElementData_asView(self):
+        dist = {"29-Cu-63": 0.691500, "29-Cu-65": 0.308500}
+        energy = SpectraData(name="element_29-Cu_n-g", numPeaks=None, tableData=None, graphData=self.graphData,
+                             graphColour=(0, 0, 0), isToF=False, distributions=dist, defaultDist=dist)
+        tof = SpectraData(name="element_29-Cu_n-g", numPeaks=None, tableData=None, graphData=self.graphData,
+                          graphColour=(0, 0, 0), isToF=True, distributions=dist, defaultDist=dist)
+
+        view = energy.asView(True)
+        self.assertEqual(view, tof)
+        self.assertTrue(np.shares_memory(view.graphArray.y, energy.graphArray.y))
+        self.assertTrue(np.array_equal(view.maxima, tof.maxima))
+        self.assertEqual(view.maxPeakLimitsX, tof.maxPeakLimitsX)
+        self.assertIs(view.tableData, energy.tableData)
+
+        view = tof.asView(False)
+        self.assertEqual(view, energy)
+        self.assertTrue(np.array_equal(view.maxima, energy.maxima))
+        self.assertEqual(view.maxPeakLimitsX, energy.maxPeakLimitsX)
+
+        # Changing the threshold of a view leaves the other unchanged.
+        tof.threshold = 1000
+        tof.updatePeaks()
+        self.assertLess(tof.maxima.shape[1], energy.maxima.shape[1])
+        self.assertEqual(view.maxima.shape, energy.maxima.shape)
+
+    def test_ElementData_getCrossSection(self):
+        dist = {"29-Cu-63": 0.691500, "29-Cu-65": 0.308500}
+        tof = SpectraData(name="element_29-Cu_n-g", numPeaks=None, tableData=None, graphData=self.graphData,
+                          graphColour=(0, 0, 0), isToF=True, distributions=dist, defaultDist=dist)
+        self.assertTrue(np.array_equal(tof.energyGraphArray.x, self.graphData[0].to_numpy()))
+        self.assertIs(tof.getCrossSection("n-g"), tof.energyGraphArray.y)
+        total = tof.getCrossSection("n-tot")
+        self.assertEqual(total.shape, tof.energyGraphArray.y.shape)
+        # Elastic scattering adds to the total cross-section.
+        self.assertTrue(np.median(total / tof.energyGraphArray.y) > 1)
+
+        imported = SpectraData(name="sample", numPeaks=None, tableData=None, graphData=self.graphData,
+                               graphColour=(0, 0, 0), isToF=False, distributions=None, defaultDist=None,
+                               isImported=True)
+        self.assertRaises(ValueError, imported.getCrossSection, "n-tot")
+
     def test_ElementData_energyToTOF(self):
         element = SpectraData(
             name="element_48-Cd_n-g",
@@ -145,5 +187,46 @@ class TestElemenetData(TestCase):
         self.assertFalse(all(element.graphData[0] == self.graphData[0]))
 
 
+class TestUpdateDistribution(TestCase):
+
+    natural = {"29-Cu-63": 0.6915, "29-Cu-65": 0.3085}
+
+    def createSpectra(self, distributions: dict, isToF: bool = False) -> SpectraData:
+        graphData = pd.read_csv(f"{filepath}/test_data/graphData/element_29-Cu_n-g.csv", header=None)
+        return SpectraData(name="element_29-Cu_n-g", numPeaks=None, tableData=None, graphData=graphData,
+                           graphColour=None, isToF=isToF, distributions=distributions, defaultDist=self.natural,
+                           threshold=1)
+
+    def getExpected(self, distributions: dict, isToF: bool = False) -> SpectraData:
+        # As documented by updateDistribution, the distribution applied and the peaks detected again in full.
+        expected = self.createSpectra({"29-Cu-63": 0.6915, "29-Cu-65": 0.2})
+        expected.distributions = distributions
+        expected.isDistAltered = True
+        expected.onDistChange()
+        expected.updatePeaks()
+        return expected.asView(isToF)
+
+    def assertSpectraEqual(self, spectra: SpectraData, expected: SpectraData) -> None:
+        self.assertTrue(np.allclose(spectra.graphData.to_numpy(), expected.graphData.to_numpy(), rtol=1e-12))
+        self.assertTrue(np.allclose(spectra.maxima, expected.maxima, rtol=1e-12))
+        self.assertEqual(spectra.maxPeakLimitsX.keys(), expected.maxPeakLimitsX.keys())
+        for peak, limits in expected.maxPeakLimitsX.items():
+            self.assertTrue(np.allclose(spectra.maxPeakLimitsX[peak], limits, rtol=1e-12))
+            self.assertTrue(np.allclose(spectra.maxPeakLimitsY[peak], expected.maxPeakLimitsY[peak], rtol=1e-12))
+
+    def test_updateDistribution(self):
+        for isToF in [False, True]:
+            spectra = self.createSpectra({"29-Cu-63": 0.6915, "29-Cu-65": 0.2}, isToF)
+            for distributions in [{"29-Cu-63": 0.6915, "29-Cu-65": 0.4}, {"29-Cu-63": 0.5, "29-Cu-65": 0.4}]:
+                self.assertTrue(spectra.updateDistribution(distributions))
+                self.assertSpectraEqual(spectra, self.getExpected(distributions, isToF))
+
+    def test_updateDistribution_new_isotope(self):
+        spectra = self.createSpectra({"29-Cu-63": 1, "29-Cu-65": 0})
+        self.assertFalse(spectra.updateDistribution(self.natural))
+        self.assertEqual(spectra.graphData.shape, self.createSpectra({"29-Cu-63": 0.6915,
+                                                                      "29-Cu-65": 0.3}).graphData.shape)
+
+
 if __name__ == '__main__':
     main()
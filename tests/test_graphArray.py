@@ -0,0 +1,62 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from element.GraphArray import GraphArray
+from helpers.nearestNumber import nearestnumber, nearestnumbers
+
+
+filepath = f"{os.path.dirname(__file__)}"
+
+
+class TestGraphArray(TestCase):
+
+    def setUp(self) -> None:
+        self.graphData = pd.read_csv(f"{filepath}/test_data/graphData/element_29-Cu_n-g.csv", header=None)
+        self.graphArray = GraphArray.fromGraphData(self.graphData)
+        return super().setUp()
+
+    def test_fromGraphData(self):
+        self.assertTrue(np.shares_memory(self.graphArray.x, self.graphData[0].to_numpy()))
+        self.assertTrue(self.graphArray.frame.equals(self.graphData))
+        self.assertTrue(np.shares_memory(self.graphArray.frame[1].to_numpy(), self.graphArray.y))
+        self.assertTrue(GraphArray.fromGraphData(pd.DataFrame()).empty)
+
+    def test_sorted(self):
+        graphArray = GraphArray.fromXY([3, 1, 2, 1], [30, 10, 20, 11])
+        self.assertEqual(graphArray.x.tolist(), [1, 1, 2, 3])
+        self.assertEqual(graphArray.y.tolist(), [10, 11, 20, 30])
+        # Descending x-coords are reversed, keeping the order of the line through repeated x-coords.
+        graphArray = GraphArray.fromXY([3, 2, 2, 1], [30, 20, 21, 10])
+        self.assertEqual(graphArray.y.tolist(), [10, 21, 20, 30])
+
+    def test_window(self):
+        left, right = self.graphArray.x[100] - 1e-9, self.graphArray.x[250]
+        window = self.graphArray.window(left, right)
+        expected = self.graphData[(self.graphData[0] >= left) & (self.graphData[0] <= right)]
+        self.assertTrue(np.array_equal(window.data, expected.to_numpy().T))
+        self.assertTrue(np.shares_memory(window.x, self.graphArray.x))
+
+    def test_withX(self):
+        tofX = 1 / np.sqrt(self.graphArray.x)
+        graphArray = self.graphArray.withX(tofX)
+        self.assertTrue(np.array_equal(graphArray.x, np.sort(tofX)))
+        self.assertTrue(np.array_equal(graphArray.y, self.graphArray.y[::-1]))
+        self.assertTrue(np.shares_memory(graphArray.y, self.graphArray.y))
+        self.assertTrue(np.array_equal(graphArray.frame.to_numpy(), graphArray.data.T))
+
+    def test_nearestIndexes(self):
+        x = self.graphArray.x
+        targets = np.concatenate([x[::97], (x[1::97] + x[:-1:97]) / 2, [x[0] - 1, x[-1] + 1]])
+        expected = [nearestnumber(x, target) for target in targets]
+        self.assertEqual(x[self.graphArray.nearestIndexes(targets)].tolist(), expected)
+        self.assertEqual(nearestnumbers(self.graphArray.y, targets).tolist(),
+                         [nearestnumber(self.graphArray.y, target) for target in targets])
+
+
+if __name__ == '__main__':
+    main()
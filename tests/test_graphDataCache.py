@@ -0,0 +1,52 @@
+import sys
+import os
+import tempfile
+import shutil
+import pandas as pd
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from helpers.graphDataCache import loadGraphArray, convertGraphData
+
+
+filepath = f"{os.path.dirname(__file__)}"
+
+
+class TestGraphDataCache(TestCase):
+
+    def setUp(self) -> None:
+        self.tempDir = tempfile.mkdtemp()
+        self.dataDir = f"{self.tempDir}/Graph Data/"
+        self.cacheDir = f"{self.tempDir}/Cache/"
+        os.makedirs(self.dataDir)
+        shutil.copy(f"{filepath}/test_data/graphData/element_29-Cu_n-g.csv", self.dataDir)
+        self.source = f"{self.dataDir}element_29-Cu_n-g.csv"
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tempDir)
+        return super().tearDown()
+
+    def test_loadGraphArray_matches_csv(self):
+        graphData = pd.read_csv(self.source, header=None)
+        array = loadGraphArray(self.source, self.dataDir, self.cacheDir)
+        self.assertEqual(array.shape, (2, graphData.shape[0]))
+        self.assertTrue((array[0] == graphData[0].to_numpy()).all())
+        self.assertTrue((array[1] == graphData[1].to_numpy()).all())
+        self.assertTrue(os.path.exists(f"{self.cacheDir}element_29-Cu_n-g.npy"))
+
+    def test_loadGraphArray_invalidated(self):
+        loadGraphArray(self.source, self.dataDir, self.cacheDir)
+        with open(self.source, "w") as file:
+            file.write("1.0,2.0\n3.0,4.0\n")
+        array = loadGraphArray(self.source, self.dataDir, self.cacheDir)
+        self.assertEqual(array.tolist(), [[1.0, 3.0], [2.0, 4.0]])
+
+    def test_convertGraphData(self):
+        self.assertEqual(len(convertGraphData(self.dataDir, self.cacheDir)), 1)
+        self.assertEqual(convertGraphData(self.dataDir, self.cacheDir), [])
+
+
+if __name__ == '__main__':
+    main()
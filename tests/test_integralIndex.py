@@ -0,0 +1,76 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+import scipy
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from element.IntegralIndex import IntegralIndex
+from helpers.integration import integrate_simps, integrate_trapz
+
+
+filepath = f"{os.path.dirname(__file__)}"
+# scipy.integrate.simpson integrates windows with an odd number of intervals as IntegralIndex does from 1.11.
+isSimpsonCorrected = tuple(int(part) for part in scipy.__version__.split(".")[:2]) >= (1, 11)
+
+
+class TestIntegralIndex(TestCase):
+
+    def setUp(self) -> None:
+        self.graphData = pd.read_csv(f"{filepath}/test_data/graphData/element_29-Cu_n-g.csv", header=None)
+        self.index = IntegralIndex.fromGraphData(self.graphData)
+        x = self.graphData.iloc[:, 0].to_numpy()
+        rng = np.random.default_rng(0)
+        starts = rng.integers(0, x.size - 40, 200)
+        # Window sizes covering both parities and single intervals, with limits either on or between points.
+        self.leftLimits = x[starts] - rng.uniform(0, 1e-4, 200) * x[starts]
+        self.rightLimits = x[starts + rng.integers(1, 40, 200)]
+        return super().setUp()
+
+    def assertClose(self, expected: float, result: float) -> None:
+        self.assertAlmostEqual(result, expected, delta=1e-9 * max(1, abs(expected)))
+
+    def test_simpson(self):
+        integrals = self.index.integrate(self.leftLimits, self.rightLimits)
+        x = self.graphData.iloc[:, 0].to_numpy()
+        for left, right, result in zip(self.leftLimits, self.rightLimits, integrals):
+            intervals = np.count_nonzero((x >= left) & (x <= right)) - 1
+            if intervals % 2 == 0 or isSimpsonCorrected:
+                self.assertClose(integrate_simps(self.graphData, left, right), result)
+
+    def test_simpson_quadratic(self):
+        # Simpson's rule with the last interval correction of scipy 1.11 is exact for quadratics, whatever the
+        # installed scipy, on uneven grids and windows of either parity.
+        x = np.sort(np.random.default_rng(1).uniform(0, 10, 40))
+        index = IntegralIndex(x, 3 * x ** 2 - 2 * x + 1)
+        first, last = np.array([0, 3, 2, 1]), np.array([39, 20, 4, 8])
+        antiderivative = x ** 3 - x ** 2 + x
+        self.assertTrue(np.allclose(index.simpson(first, last), antiderivative[last] - antiderivative[first],
+                                    rtol=1e-12, atol=1e-10))
+        # A single interval is a trapezium.
+        self.assertAlmostEqual(float(index.simpson(5, 6)), float(index.trapezoid(5, 6)))
+
+    def test_trapezoid(self):
+        integrals = self.index.integrate(self.leftLimits, self.rightLimits, method="trapezoid")
+        for left, right, result in zip(self.leftLimits, self.rightLimits, integrals):
+            self.assertClose(integrate_trapz(self.graphData, left, right), result)
+
+    def test_scalar_limits(self):
+        left, right = self.leftLimits[0], self.rightLimits[0]
+        self.assertIsInstance(self.index.integrate(left, right), float)
+        self.assertClose(integrate_simps(self.graphData, left, right), self.index.integrate(left, right))
+
+    def test_nearest_limits(self):
+        x = self.graphData.iloc[:, 0].to_numpy()
+        left, right = x[10] + 1e-9, x[10] + 2e-9
+        self.assertClose(integrate_simps(self.graphData, left, right), self.index.integrate(left, right))
+
+    def test_unsorted(self):
+        with self.assertRaises(ValueError):
+            IntegralIndex(np.array([1., 0., 2.]), np.ones(3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+import sys
+import os
+import numpy as np
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from element.IsotopeBasis import IsotopeBasis, getIsotopeBasis
+from element.IsotopeCache import getIsotopeCache
+from helpers.getSpacedElements import getSpacedElements
+
+
+class TestIsotopeBasis(TestCase):
+
+    def setUp(self) -> None:
+        self.names = ["29-Cu-63_n-g", "29-Cu-65_n-g"]
+        self.arrays = [getIsotopeCache().getArray(name) for name in self.names]
+        self.basis = IsotopeBasis(self.names, self.arrays)
+        return super().setUp()
+
+    def test_grid(self):
+        self.assertTrue((np.diff(self.basis.x) > 0).all())
+        for array in self.arrays:
+            self.assertTrue(np.isin(getSpacedElements(array[0], array.shape[1] // 2), self.basis.x).all())
+
+    def test_combine(self):
+        graphData = self.basis.combine({"29-Cu-63_n-g": 0.6915, "29-Cu-65_n-g": 0.3085})
+        expected = sum(np.interp(self.basis.x, array[0], array[1]) * dist
+                       for array, dist in zip(self.arrays, [0.6915, 0.3085]))
+        self.assertTrue(np.array_equal(graphData[0].to_numpy(), self.basis.x))
+        self.assertTrue(np.allclose(graphData[1].to_numpy(), expected, rtol=1e-12))
+
+    def test_missing_weights(self):
+        graphData = self.basis.combine({"29-Cu-65_n-g": 1})
+        self.assertTrue(np.array_equal(graphData[1].to_numpy(), self.basis.matrix[1]))
+
+    def test_getIsotopeBasis(self):
+        self.assertIs(getIsotopeBasis(self.names), getIsotopeBasis(self.names))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from element.IsotopeCache import IsotopeCache, getIsotopeCache
+from element.SpectraDataStructure import SpectraData
+
+
+libraryFilepath = f"{os.path.dirname(os.path.dirname(__file__))}/src/project/data/Graph Data/"
+
+
+class TestIsotopeCache(TestCase):
+
+    def setUp(self) -> None:
+        self.cache = IsotopeCache()
+        return super().setUp()
+
+    def test_getGraphData(self):
+        graphData = pd.read_csv(f"{libraryFilepath}29-Cu-63_n-g.csv", header=None, names=['x', 'y'])
+        self.assertTrue(np.array_equal(self.cache.getGraphData("29-Cu-63_n-g", names=['x', 'y']).to_numpy(),
+                                       graphData.to_numpy()))
+
+    def test_hits_and_misses(self):
+        for _ in range(3):
+            self.cache.getGraphData("29-Cu-63_n-g")
+            self.cache.getIntegralIndex("29-Cu-65_n-g")
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual(self.cache.hits, 4)
+        self.cache.clear()
+        self.assertEqual(self.cache.info["entries"], 0)
+
+    def test_read_only(self):
+        with self.assertRaises(ValueError):
+            self.cache.getArray("29-Cu-63_n-g")[1, 0] = 0
+
+    def test_eviction(self):
+        size = self.cache.getArray("29-Cu-63_n-g").nbytes
+        self.cache = IsotopeCache(maxBytes=size)
+        self.cache.getArray("29-Cu-63_n-g")
+        self.cache.getArray("29-Cu-65_n-g")
+        self.assertNotIn("29-Cu-63_n-g", self.cache)
+        self.assertIn("29-Cu-65_n-g", self.cache)
+        self.assertLessEqual(self.cache.nbytes, max(size, self.cache.getArray("29-Cu-65_n-g").nbytes))
+
+    def test_peakIntegrals_lookups(self):
+        distributions = {"29-Cu-63": 0.6915, "29-Cu-65": 0.3085}
+        graphData = pd.read_csv(f"{libraryFilepath}element_29-Cu_n-g.csv", header=None)
+        spectra = SpectraData("element_29-Cu_n-g", None, None, graphData, None, False, distributions, distributions)
+        cache = getIsotopeCache()
+        lookups = cache.hits + cache.misses
+        integrals = spectra.peakIntegrals(np.array([570, 2600]), np.array([590, 2700]))
+        self.assertTrue((integrals > 0).all())
+        # Only the integral index of each isotope is looked up, its graph data being read only as a fallback.
+        self.assertEqual(cache.hits + cache.misses - lookups, 2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from helpers.measuredData import readMeasuredData, sniffFormat
+
+
+class TestMeasuredData(TestCase):
+
+    def setUp(self) -> None:
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.rng = np.random.default_rng(0)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.tempDir.cleanup()
+        return super().tearDown()
+
+    def writeFile(self, name: str, text: str) -> str:
+        filepath = os.path.join(self.tempDir.name, name)
+        with open(filepath, "w") as file:
+            file.write(text)
+        return filepath
+
+    def test_sniffFormat(self):
+        self.assertEqual(sniffFormat(self.writeFile("a.csv", "Energy (eV),Cross section (b)\n1,2\n3,4\n")),
+                         {"sep": ",", "decimal": ".", "skiprows": 1, "usecols": [0, 1]})
+        self.assertEqual(sniffFormat(self.writeFile("b.dat", "# run 12\n# x y\n 1.5e-3   2\n3\t4\n")),
+                         {"sep": r"\s+", "decimal": ".", "skiprows": 2, "usecols": [0, 1]})
+        self.assertEqual(sniffFormat(self.writeFile("c.txt", "x;y;error\n1,5;2,25;0,1\n")),
+                         {"sep": ";", "decimal": ",", "skiprows": 1, "usecols": [0, 1]})
+        self.assertEqual(sniffFormat(self.writeFile("d.txt", "ToF\n101.5\n")),
+                         {"sep": r"\s+", "decimal": ".", "skiprows": 1, "usecols": [0]})
+        with self.assertRaises(pd.errors.EmptyDataError):
+            sniffFormat(self.writeFile("e.csv", "x,y\n"))
+
+    def test_readMeasuredData(self):
+        array = self.rng.uniform(1, 100, (2, 1000))
+        filepath = self.writeFile("a.csv", "x,y\n" + "\n".join(f"{x:.17g},{y:.17g}" for x, y in array.T) + "\n")
+        progress = []
+        read = readMeasuredData(filepath, progress=progress.append, chunkSize=300)
+        self.assertEqual(read.dtype, np.float64)
+        self.assertTrue(np.allclose(read, array, rtol=1e-14, atol=0))
+        self.assertEqual(len(progress), 4)
+        self.assertEqual(progress, sorted(progress))
+        self.assertEqual(progress[-1], 1)
+        self.assertEqual(readMeasuredData(filepath, dtype=np.float32).dtype, np.float32)
+        with self.assertRaises(ValueError):
+            readMeasuredData(self.writeFile("b.csv", "1,2\n3,a\n"))
+
+    def test_readMeasuredData_rebin(self):
+        x = np.sort(self.rng.uniform(0, 10, 10000))
+        y = self.rng.normal(size=x.size)
+        filepath = self.writeFile("a.csv", "\n".join(f"{a:.17g},{b:.17g}" for a, b in zip(x, y)) + "\n")
+        read = readMeasuredData(filepath, binWidth=0.5, chunkSize=777)
+        bins = np.floor(x / 0.5)
+        self.assertEqual(read.shape, (2, 20))
+        for i, xBin in enumerate(np.unique(bins)):
+            self.assertAlmostEqual(read[0, i], x[bins == xBin].mean())
+            self.assertAlmostEqual(read[1, i], y[bins == xBin].mean())
+        read = readMeasuredData(filepath, binWidth=0.1, relative=True, chunkSize=777)
+        self.assertTrue((np.diff(read[0]) > 0).all())
+        # Logarithmic bins each span a tenth of their lower edge.
+        self.assertEqual(read.shape[1], np.unique(np.floor(np.log(x[x > 0]) / np.log(1.1))).size)
+        with self.assertRaises(ValueError):
+            readMeasuredData(filepath, binWidth=0)
+
+    def test_readMeasuredData_events(self):
+        events = self.rng.normal(500, 5, 20000)
+        filepath = self.writeFile("events.txt", "\n".join(f"{event:.17g}" for event in events) + "\n")
+        histogram = readMeasuredData(filepath, binWidth=1, chunkSize=3000)
+        self.assertAlmostEqual(histogram[1].sum(), events.size)
+        self.assertAlmostEqual(histogram[0][np.argmax(histogram[1])], 500, delta=3)
+        # Events are histogrammed at the default resolution when none is given, as counts per unit x.
+        histogram = readMeasuredData(filepath)
+        widths = histogram[0] * 1e-3
+        self.assertAlmostEqual((histogram[1] * widths).sum(), events.size, delta=events.size * 1e-3)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+import scipy as sp
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from element.GraphArray import GraphArray
+from element.PeakDetection import PeakDetector, peakDtype
+
+
+filepath = f"{os.path.dirname(__file__)}"
+libraryFilepath = f"{os.path.dirname(filepath)}/src/project/data/Graph Data/"
+
+
+def findPeaksReference(graphData: pd.DataFrame, wlen: int, invert: bool = False, **kwargs) -> np.ndarray:
+    """
+    Point-by-point implementation of ``PeakDetector`` as originally written, each limit being the first point sharing
+    the x-coord of the rounded limit position, kept as the reference for the vectorised version.
+    """
+    sign = -1 if invert else 1
+    x, y = graphData.iloc[:, 0].to_numpy(), sign * graphData.iloc[:, 1].to_numpy()
+    peaks, _ = sp.signal.find_peaks(y, **kwargs)
+    width = sp.signal.peak_widths(y, peaks, rel_height=1, wlen=wlen)
+    result = np.empty(peaks.size, dtype=peakDtype)
+    for i, peak in enumerate(peaks.tolist()):
+        first = np.flatnonzero(x == x[round(width[2][i])])[0]
+        second = np.flatnonzero(x == x[round(width[3][i])])[0]
+        result[i] = (peak, x[peak], sign * y[peak], x[first], sign * y[first], x[second], sign * y[second])
+    return result
+
+
+class TestPeakDetector(TestCase):
+
+    def assertPeaksEqual(self, peaks: np.ndarray, expected: np.ndarray) -> None:
+        self.assertEqual(peaks.dtype, peakDtype)
+        for field in peakDtype.names:
+            self.assertTrue(np.array_equal(peaks[field], expected[field]), field)
+
+    def assertDetected(self, graphData: pd.DataFrame, threshold: float) -> None:
+        expectedMaxima = findPeaksReference(graphData, 110, height=threshold)
+        expectedMinima = findPeaksReference(graphData, 300, invert=True, height=-0.90, prominence=0.0035)
+        for data in [graphData, GraphArray.fromXY(graphData[0], graphData[1])]:
+            detector = PeakDetector()
+            self.assertPeaksEqual(detector.maxima(data, threshold, structured=True), expectedMaxima)
+            self.assertPeaksEqual(detector.minima(data, structured=True), expectedMinima)
+            maxima, minima = detector.maxima(data, threshold), detector.minima(data)
+            self.assertTrue(np.array_equal(maxima[0], expectedMaxima["x"]))
+            self.assertTrue(np.array_equal(maxima[1], expectedMaxima["y"]))
+            self.assertTrue(np.array_equal(minima[0], expectedMinima["x"]))
+            self.assertTrue(np.array_equal(minima[1], expectedMinima["y"]))
+            # The limits of the minima keep the y-coords of the inverted data.
+            for peak in expectedMaxima:
+                self.assertEqual(detector.maxPeakLimitsX[f"{peak['x']}_first"], peak["leftX"])
+                self.assertEqual(detector.maxPeakLimitsY[f"{peak['x']}_second"], peak["rightY"])
+            for peak in expectedMinima:
+                self.assertEqual(detector.minPeakLimitsX[f"{peak['x']}_second"], peak["rightX"])
+                self.assertEqual(detector.minPeakLimitsY[f"{peak['x']}_first"], -peak["leftY"])
+
+    def test_reference_testData(self):
+        for name, threshold in [("element_29-Cu_n-g", 4.3), ("element_48-Cd_n-g", 100)]:
+            with self.subTest(name=name):
+                self.assertDetected(pd.read_csv(f"{filepath}/test_data/graphData/{name}.csv", header=None),
+                                    threshold)
+
+    def test_reference_library(self):
+        for name, threshold in [("92-U-238_n-tot", 100), ("92-U-238_n-g", 100), ("29-Cu-63_n-g", 4.3),
+                                ("26-Fe-56_n-g", 100)]:
+            with self.subTest(name=name):
+                self.assertDetected(pd.read_csv(f"{libraryFilepath}{name}.csv", header=None), threshold)
+
+    def test_known_values(self):
+        # Values found by the original point-by-point implementation.
+        graphData = pd.read_csv(f"{libraryFilepath}92-U-238_n-g.csv", header=None)
+        detector = PeakDetector()
+        maxima = detector.maxima(graphData, 100, structured=True)
+        self.assertEqual(maxima.size, 128)
+        self.assertTrue(np.array_equal(maxima["x"][:3], [4.8506, 6.392, 7.08463]))
+        self.assertTrue(np.array_equal(maxima["y"][:3], [179.163, 425.605, 117.317]))
+        self.assertEqual((maxima["leftX"][0], maxima["rightX"][0], maxima["leftY"][0]), (4.69361, 5.00847, 8.95364))
+        minima = detector.minima(graphData)
+        self.assertEqual(minima[0].size, 1299)
+        self.assertTrue(np.array_equal(minima[0][:2], [65.1621, 67.778]))
+        self.assertTrue(np.array_equal(minima[1][:2], [0.890191, 0.507545]))
+
+        graphData = pd.read_csv(f"{libraryFilepath}92-U-238_n-tot.csv", header=None)
+        maxima = detector.maxima(graphData, 100)
+        self.assertEqual(maxima[0].size, 458)
+        self.assertTrue(np.array_equal(maxima[0][:3], [0.273577, 1.13552, 3.61231]))
+        self.assertEqual(detector.minima(graphData, structured=True).size, 0)
+
+        graphData = pd.read_csv(f"{libraryFilepath}29-Cu-63_n-g.csv", header=None)
+        maxima = detector.maxima(graphData, 4.3, structured=True)
+        self.assertEqual(maxima.size, 11)
+        self.assertEqual((maxima["x"][0], maxima["y"][0]), (578.033, 428.328))
+        self.assertEqual((maxima["leftX"][0], maxima["leftY"][0], maxima["rightX"][0]), (574.926, 28.655, 581.117))
+        self.assertEqual(detector.maxPeakLimitsX["578.033_first"], 574.926)
+        self.assertEqual(detector.minima(graphData)[0].size, 353)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+import sys
+import os
+import io
+import tempfile
+from contextlib import redirect_stderr
+import numpy as np
+import pandas as pd
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from element.PeakTables import calculatePeakTables, getThreshold, main as peakTablesMain, regeneratePeakTables
+from element.SpectraManifest import readThresholds
+
+
+class TestPeakTables(TestCase):
+
+    def test_getThreshold(self):
+        thresholds = readThresholds()
+        self.assertEqual(thresholds["Cu"], (20, 4.3))
+        self.assertEqual(getThreshold("29-Cu-63_n-tot", thresholds), 20)
+        self.assertEqual(getThreshold("element_29-Cu_n-g", thresholds), 4.3)
+        self.assertEqual(getThreshold("01-H-1_n-g", thresholds), 100)
+
+    def test_calculatePeakTables(self):
+        tableData, limits = calculatePeakTables("29-Cu-63_n-g", 4.3)
+        self.assertEqual(limits.shape, (tableData.shape[0], 2))
+        self.assertTrue(np.array_equal(tableData["Rank by Integral"], np.arange(tableData.shape[0])))
+        self.assertTrue((np.diff(tableData["Integral"]) <= 0).all())
+        self.assertTrue(((limits[0] < tableData["Energy (eV)"]) & (tableData["Energy (eV)"] < limits[1])).all())
+
+    def test_regeneratePeakTables(self):
+        with tempfile.TemporaryDirectory() as outputDir:
+            outputDir = os.path.join(outputDir, "")
+            name, numPeaks, _, error = regeneratePeakTables("29-Cu-63_n-g", 4.3, outputDir)
+            self.assertIsNone(error)
+            tableData = pd.read_csv(f"{outputDir}Peak information/{name}.csv")
+            limits = pd.read_csv(f"{outputDir}Peak Limit Information/{name}.csv", header=None)
+            self.assertEqual(tableData.shape, (numPeaks, 10))
+            self.assertEqual(limits.shape, (numPeaks, 2))
+            self.assertEqual(sorted(os.listdir(f"{outputDir}Peak information")), [f"{name}.csv"])
+
+    def test_regeneratePeakTables_error(self):
+        with tempfile.TemporaryDirectory() as outputDir:
+            _, _, _, error = regeneratePeakTables("02-He-4_n-g", 100, os.path.join(outputDir, ""))
+            self.assertTrue(error.startswith("EmptyDataError"))
+            self.assertEqual(os.listdir(outputDir), [])
+
+    def test_regeneratePeakTables_writeError(self):
+        with tempfile.TemporaryDirectory() as outputDir:
+            outputDir = os.path.join(outputDir, "")
+            # A file in place of the Peak information folder.
+            open(f"{outputDir}Peak information", "w").close()
+            _, _, _, error = regeneratePeakTables("29-Cu-63_n-g", 4.3, outputDir)
+            self.assertTrue(error.startswith("FileExistsError"))
+            self.assertEqual(os.listdir(outputDir), ["Peak information"])
+
+    def test_main_output(self):
+        # Writing over the data folder must be asked for.
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as exit:
+            peakTablesMain(["29-Cu-63_n-g"])
+        self.assertEqual(exit.exception.code, 2)
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            peakTablesMain(["29-Cu-63_n-g", "-o", "out", "--in-place"])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+import sys
+import os
+import numpy as np
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from element.ResonanceIndex import ResonanceIndex, getResonanceIndex, parseEnergyQuery, resonanceDtype
+
+
+class TestResonanceIndex(TestCase):
+
+    def setUp(self) -> None:
+        peaks = np.zeros(4, dtype=resonanceDtype)
+        peaks["energy"] = [10, 1, 5, 5.1]
+        peaks["tof"] = [1 / np.sqrt(e) for e in peaks["energy"]]
+        peaks["spectrum"] = [0, 1, 1, 0]
+        self.index = ResonanceIndex(peaks, ["29-Cu-63_n-g", "29-Cu-65_n-tot"])
+        return super().setUp()
+
+    def test_query(self):
+        self.assertEqual(self.index.query(1, 5.1)["energy"].tolist(), [1, 5, 5.1])
+        self.assertEqual(self.index.query(1, 5.1, mode="n-g")["energy"].tolist(), [5.1])
+        self.assertEqual(self.index.query(0.3, 0.5, tof=True)["energy"].tolist(), [10, 5.1, 5])
+        self.assertEqual(self.index.query(20, 30).size, 0)
+
+    def test_near(self):
+        self.assertEqual(self.index.near(5.08, tolerance=0.05)["energy"].tolist(), [5.1, 5])
+        table = self.index.toDataFrame(self.index.near(5.08, tolerance=0.05))
+        self.assertEqual(table["Isotope"].tolist(), ["29-Cu-63", "29-Cu-65"])
+        self.assertEqual(table["Mode"].tolist(), ["n-g", "n-tot"])
+
+    def test_match(self):
+        peaks = np.zeros(7, dtype=resonanceDtype)
+        peaks["energy"] = [1, 2, 3, 2.01, 2.5, 2.98, 30]
+        peaks["tof"] = 1 / np.sqrt(peaks["energy"])
+        peaks["spectrum"] = [0, 0, 0, 1, 1, 1, 1]
+        index = ResonanceIndex(peaks, ["29-Cu-63_n-g", "29-Cu-65_n-tot"])
+        candidates = index.match([3, 1, 2, 2])
+        self.assertEqual(candidates["Isotope"].tolist(), ["29-Cu-63", "29-Cu-65"])
+        self.assertEqual(candidates["Matched Peaks"].tolist(), [3, 2])
+        self.assertEqual(candidates["Library Peaks"].tolist(), [3, 3])
+        self.assertAlmostEqual(candidates["Score"][0], 1)
+        self.assertTrue(candidates["Score"][1] < 0.5)
+        self.assertEqual(index.match([1, 2, 3], mode="n-tot")["Isotope"].tolist(), ["29-Cu-65"])
+        self.assertEqual(index.match(1 / np.sqrt([1, 2, 3]), tof=True)["Isotope"][0], "29-Cu-63")
+        self.assertTrue(index.match([100]).empty)
+
+    def test_parseEnergyQuery(self):
+        self.assertEqual(parseEnergyQuery("10", tolerance=0.1), (9, 11))
+        self.assertEqual(parseEnergyQuery("6.8-6.6"), (6.6, 6.8))
+        self.assertEqual(parseEnergyQuery("6.6 to 6.8"), (6.6, 6.8))
+        self.assertEqual(parseEnergyQuery("1e2:2e2"), (100, 200))
+        self.assertEqual(parseEnergyQuery("5±1"), (4, 6))
+        self.assertEqual(parseEnergyQuery("5+-1"), (4, 6))
+        self.assertRaises(ValueError, parseEnergyQuery, "Cu")
+
+    def test_build(self):
+        index = getResonanceIndex()
+        self.assertTrue(len(index) > 0)
+        self.assertFalse(any(name.startswith("element") for name in index.spectra))
+        self.assertTrue(np.all(np.diff(index.peaks["energy"]) >= 0))
+        # The 6.664 eV resonance of Os-186, in both modes.
+        self.assertEqual(index.toDataFrame(index.near(6.664, tolerance=1e-4))["Isotope"].tolist(), ["76-Os-186"] * 2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+import sys
+import os
+import numpy as np
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from helpers.smooth import smooth
+from helpers.fitBoxes import fitBoxes
+
+
+def smoothReference(arr: np.ndarray, it: int) -> np.ndarray:
+    """
+    Point-by-point {1 2 1}/4 smoothing of a 1-D array, zeroing the edges on each iteration.
+    """
+    arr0 = np.copy(arr)
+    for _ in range(it):
+        arr0 = np.array([0., *[(arr0[i - 1] + 2 * arr0[i] + arr0[i + 1]) / 4 for i in range(1, arr0.size - 1)], 0.])
+    return arr0
+
+
+class TestSmooth(TestCase):
+
+    def setUp(self) -> None:
+        self.rng = np.random.default_rng(0)
+        return super().setUp()
+
+    def test_smooth_single(self):
+        arr = self.rng.normal(size=1000)
+        self.assertTrue(np.array_equal(smooth(arr, 1), smoothReference(arr, 1)))
+        self.assertTrue(np.array_equal(smooth(arr, 0), arr))
+
+    def test_smooth_iterations(self):
+        for size in [5, 12, 1000]:
+            arr = self.rng.normal(size=size)
+            for it in range(2, 6):
+                with self.subTest(size=size, it=it):
+                    self.assertTrue(np.allclose(smooth(arr, it), smoothReference(arr, it), rtol=1e-12, atol=1e-15))
+
+    def test_smooth_xy(self):
+        arr = self.rng.normal(size=(2, 100))
+        smoothed = smooth(arr, 2)
+        self.assertTrue(np.array_equal(smoothed[0], arr[0]))
+        self.assertTrue(np.allclose(smoothed[1], smoothReference(arr[1], 2)))
+
+    def test_smooth_batched(self):
+        arr = self.rng.normal(size=(4, 200))
+        expected = np.array([smoothReference(row, 3) for row in arr])
+        self.assertTrue(np.allclose(smooth(arr, 3, batched=True), expected))
+
+    def test_smooth_invalid_iterations(self):
+        self.assertIsNone(smooth(np.ones(10), 1.5))
+
+    def test_fitBoxes_batched(self):
+        arr = self.rng.normal(size=(3, 50))
+        fit, boxwidth = fitBoxes(arr, 100, axis=1)
+        for i, row in enumerate(arr):
+            rowFit, rowBoxwidth = fitBoxes(row, 100)
+            self.assertTrue(np.array_equal(fit[i], rowFit))
+            self.assertEqual(boxwidth[i], rowBoxwidth)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+import sys
+import os
+import threading
+from unittest import TestCase, main
+from PyQt6.QtCore import QCoreApplication
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from myPyQt.SpectraLoader import SpectraLoader
+
+
+class TestSpectraLoader(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+        return super().setUpClass()
+
+    def setUp(self) -> None:
+        self.loader = SpectraLoader()
+        self.finished, self.failed, self.progress = [], [], []
+        self.loader.finished.connect(lambda title, result: self.finished.append((title, result)))
+        self.loader.failed.connect(lambda title, error: self.failed.append((title, type(error))))
+        self.loader.progressChanged.connect(lambda done, total: self.progress.append((done, total)))
+        return super().setUp()
+
+    def wait(self) -> None:
+        self.loader.waitForDone()
+        QCoreApplication.processEvents()
+
+    def test_finished(self):
+        self.loader.submit("a-Energy", lambda: threading.current_thread() is threading.main_thread())
+        self.assertTrue(self.loader.isLoading("a-Energy"))
+        self.wait()
+        self.assertEqual(self.finished, [("a-Energy", False)])
+        self.assertFalse(self.loader.isLoading())
+        self.assertEqual(self.progress, [(0, 1), (0, 0)])
+
+    def test_reportProgress(self):
+        reported = []
+        self.loader.taskProgressChanged.connect(lambda title, fraction: reported.append((title, fraction)))
+
+        def load():
+            for fraction in [0.5, 1.0]:
+                self.loader.reportProgress("a-Energy", fraction)
+            return "a"
+
+        self.loader.submit("a-Energy", load)
+        self.wait()
+        # Progress reported on the worker thread is delivered on this one, before the result.
+        self.assertEqual(reported, [("a-Energy", 0.5), ("a-Energy", 1.0)])
+        self.assertEqual(self.finished, [("a-Energy", "a")])
+
+    def test_failed(self):
+        self.loader.submit("a-Energy", lambda: 1 / 0)
+        self.wait()
+        self.assertEqual(self.failed, [("a-Energy", ZeroDivisionError)])
+
+    def test_cancel(self):
+        started, release = threading.Event(), threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+            return "a"
+
+        self.loader.submit("a-Energy", block)
+        self.loader.submit("b-Energy", lambda: "b")
+        started.wait()
+        self.assertEqual(self.loader.cancel(), ["a-Energy", "b-Energy"])
+        release.set()
+        self.wait()
+        self.assertEqual(self.finished, [])
+        self.assertFalse(self.loader.isLoading())
+
+
+if __name__ == '__main__':
+    main()
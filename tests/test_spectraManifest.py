@@ -0,0 +1,83 @@
+import sys
+import os
+import tempfile
+import shutil
+import zlib
+import pandas as pd
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from element.SpectraManifest import SpectraManifest, loadSpectraManifest
+
+
+filepath = f"{os.path.dirname(__file__)}"
+
+
+class TestSpectraManifest(TestCase):
+
+    def setUp(self) -> None:
+        self.dataDir = f"{tempfile.mkdtemp()}/"
+        for directory in ["Graph Data/Compound Data", "Distribution Information"]:
+            os.makedirs(f"{self.dataDir}{directory}")
+        shutil.copy(f"{filepath}/test_data/graphData/element_29-Cu_n-g.csv", f"{self.dataDir}Graph Data/")
+        with open(f"{self.dataDir}Graph Data/29-Cu-63_n-tot.csv", "w") as file:
+            file.write("1.0,2.0\n\n2.0,3.0\n3.0")
+        with open(f"{self.dataDir}Distribution Information/element_29-Cu_n-g.csv", "w") as file:
+            file.write("29-Cu-63,0.6915\n29-Cu-65,0.3085\n")
+        with open(f"{self.dataDir}threshold_exceptions.txt", "w") as file:
+            file.write("Cu (20, 4.3)\n")
+        self.filepath = f"{self.dataDir}Cache/manifest.json"
+        self.manifest = SpectraManifest.build(self.dataDir, self.filepath)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.dataDir)
+        return super().tearDown()
+
+    def test_index(self):
+        self.assertEqual(self.manifest.spectraNames, ["29-Cu-63_n-tot", "element_29-Cu_n-g"])
+        self.assertEqual(self.manifest.modes, {"29-Cu-63": ["n-tot"], "element_29-Cu": ["n-g"]})
+        self.assertEqual(self.manifest.distributions["element_29-Cu_n-g"], {"29-Cu-63": 0.6915, "29-Cu-65": 0.3085})
+        self.assertEqual(self.manifest.thresholds, {"Cu": (20, 4.3)})
+
+    def test_points(self):
+        graphData = pd.read_csv(f"{self.dataDir}Graph Data/element_29-Cu_n-g.csv", header=None)
+        self.assertEqual(self.manifest.getPoints("element_29-Cu_n-g"), graphData.shape[0])
+        self.assertEqual(self.manifest.getPoints("29-Cu-63_n-tot"), 3)
+        with open(f"{self.dataDir}Graph Data/29-Cu-63_n-tot.csv", "rb") as file:
+            self.assertEqual(self.manifest.getChecksum("29-Cu-63_n-tot"), zlib.crc32(file.read()))
+
+    def test_load(self):
+        manifest = loadSpectraManifest(self.dataDir, self.filepath)
+        self.assertEqual(manifest.index, self.manifest.index)
+        shutil.copy(f"{self.dataDir}Graph Data/29-Cu-63_n-tot.csv", f"{self.dataDir}Graph Data/Compound Data/c_n-g.csv")
+        self.assertTrue(manifest.isStale(self.dataDir))
+        manifest = loadSpectraManifest(self.dataDir, self.filepath)
+        self.assertEqual(manifest.compoundNames, ["c_n-g"])
+        self.assertFalse(SpectraManifest.load(self.filepath).isStale(self.dataDir))
+
+    def test_load_overwritten(self):
+        # Files overwritten in place leave their directory's entries and modification time unchanged.
+        def overwrite(filepath: str, text: str) -> None:
+            directoryStat = os.stat(os.path.dirname(filepath))
+            with open(filepath, "w") as file:
+                file.write(text)
+            os.utime(filepath, ns=(directoryStat.st_atime_ns, directoryStat.st_mtime_ns + 10 ** 9))
+            os.utime(os.path.dirname(filepath), ns=(directoryStat.st_atime_ns, directoryStat.st_mtime_ns))
+
+        overwrite(f"{self.dataDir}Distribution Information/element_29-Cu_n-g.csv", "29-Cu-63,0.5\n29-Cu-65,0.5\n")
+        overwrite(f"{self.dataDir}Graph Data/29-Cu-63_n-tot.csv", "1.0,2.0\n2.0,3.0\n")
+        self.assertTrue(self.manifest.isStale(self.dataDir))
+        manifest = loadSpectraManifest(self.dataDir, self.filepath)
+        self.assertEqual(manifest.distributions["element_29-Cu_n-g"], {"29-Cu-63": 0.5, "29-Cu-65": 0.5})
+        self.assertEqual(manifest.getPoints("29-Cu-63_n-tot"), 2)
+
+    def test_load_invalid(self):
+        with open(self.filepath, "w") as file:
+            file.write("{")
+        self.assertEqual(loadSpectraManifest(self.dataDir, self.filepath).spectraNames, self.manifest.spectraNames)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+import sys
+import os
+import tempfile
+import shutil
+import pandas as pd
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from element.SpectraStore import SpectraStore
+
+
+filepath = f"{os.path.dirname(__file__)}"
+
+
+class TestSpectraStore(TestCase):
+
+    def setUp(self) -> None:
+        self.dataDir = f"{tempfile.mkdtemp()}/"
+        for directory in ["Graph Data", "Peak information", "Peak Limit Information", "Distribution Information"]:
+            os.makedirs(f"{self.dataDir}{directory}")
+        shutil.copy(f"{filepath}/test_data/graphData/element_29-Cu_n-g.csv", f"{self.dataDir}Graph Data/")
+        shutil.copy(f"{filepath}/test_data/tableData/element_29-Cu_n-g.csv", f"{self.dataDir}Peak information/")
+        with open(f"{self.dataDir}Peak Limit Information/29-Cu_n-g.csv", "w") as file:
+            file.write("578.0,590.5\n2640.0,2655.0\n")
+        with open(f"{self.dataDir}Distribution Information/element_29-Cu_n-g.csv", "w") as file:
+            file.write("29-Cu-63,0.6915\n29-Cu-65,0.3085\n")
+        self.store = SpectraStore.build(self.dataDir, f"{self.dataDir}Cache/spectra.store")
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.dataDir)
+        return super().tearDown()
+
+    def test_getGraphData(self):
+        graphData = pd.read_csv(f"{self.dataDir}Graph Data/element_29-Cu_n-g.csv", header=None)
+        self.assertIn("element_29-Cu_n-g", self.store)
+        self.assertTrue((self.store.getGraphData("element_29-Cu_n-g").to_numpy() == graphData.to_numpy()).all())
+
+    def test_getPeakInformation(self):
+        tableData = pd.read_csv(f"{self.dataDir}Peak information/element_29-Cu_n-g.csv", header=0)
+        self.assertTrue(self.store.getPeakInformation("element_29-Cu_n-g").equals(tableData))
+        self.assertIsNone(self.store.getPeakInformation("element_48-Cd_n-g"))
+
+    def test_getPeakLimits(self):
+        self.assertTrue(self.store.hasPeakLimits("29-Cu_n-g"))
+        self.assertEqual(self.store.getPeakLimits("29-Cu_n-g")["right"].tolist(), [590.5, 2655.0])
+
+    def test_distributions(self):
+        self.assertEqual(self.store.distributions["element_29-Cu_n-g"], {"29-Cu-63": 0.6915, "29-Cu-65": 0.3085})
+
+    def test_isStale(self):
+        self.assertFalse(self.store.isStale(self.dataDir))
+        os.remove(f"{self.dataDir}Peak Limit Information/29-Cu_n-g.csv")
+        self.assertTrue(self.store.isStale(self.dataDir))
+
+    def test_isStale_overwritten(self):
+        # Files overwritten in place leave the directory's entries and modification time unchanged.
+        limitsPath = f"{self.dataDir}Peak Limit Information/29-Cu_n-g.csv"
+        directoryStat = os.stat(os.path.dirname(limitsPath))
+        with open(limitsPath, "w") as file:
+            file.write("578.0,591.5\n2640.0,2655.0\n")
+        os.utime(limitsPath, ns=(directoryStat.st_atime_ns, directoryStat.st_mtime_ns + 10 ** 9))
+        os.utime(os.path.dirname(limitsPath), ns=(directoryStat.st_atime_ns, directoryStat.st_mtime_ns))
+        self.assertTrue(self.store.isStale(self.dataDir))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+import sys
+import os
+import re
+import subprocess
+from unittest import TestCase, main
+
+
+explorerFilepath = os.path.abspath("./src/project/NRTI_NRCA_Explorer.py")
+
+
+def runPython(*args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "QT_QPA_PLATFORM": "offscreen"}
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env, timeout=120)
+
+
+class TestStartup(TestCase):
+
+    def test_deferred_imports(self):
+        # Modules deferred until after the first paint, or no longer needed by the GUI, must not creep back in.
+        code = ("import sys; sys.path.insert(0, sys.argv[1]); import NRTI_NRCA_Explorer as explorer; "
+                "print(' '.join(m for m in [*explorer.deferredModules, 'scipy.integrate', 'scipy.optimize', "
+                "'matplotlib.pyplot'] if m in sys.modules))")
+        result = runPython("-c", code, os.path.dirname(explorerFilepath))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_startup_report(self):
+        result = runPython(explorerFilepath, "--startup-report")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        report = re.search(r"Startup: import ([\d.]+)s, init ([\d.]+)s, first paint ([\d.]+)s, total ([\d.]+)s",
+                           result.stdout)
+        self.assertIsNotNone(report, result.stdout)
+        stages = [float(seconds) for seconds in report.groups()]
+        self.assertAlmostEqual(sum(stages[:3]), stages[3], delta=0.002)
+
+
+if __name__ == '__main__':
+    main()
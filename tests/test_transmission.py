@@ -0,0 +1,43 @@
+import sys
+import os
+import numpy as np
+from unittest import TestCase, main
+
+
+sys.path.append(os.path.abspath("./src/project/"))
+from helpers.transmission import arealDensity, captureYield, transmission
+
+
+class TestTransmission(TestCase):
+
+    def test_transmission(self):
+        crossSection = np.array([0, 1, 10, 100])
+        self.assertTrue(np.allclose(transmission(crossSection, 0.01), np.exp(-0.01 * crossSection)))
+        densities = np.array([0, 0.01, 0.1])
+        sweep = transmission(crossSection, densities)
+        self.assertEqual(sweep.shape, (3, 4))
+        self.assertTrue(np.all(sweep[0] == 1))
+        self.assertTrue(np.allclose(sweep[2], np.exp(-0.1 * crossSection)))
+        # Materials and thicknesses broadcast together.
+        self.assertEqual(transmission(np.ones((2, 4)), densities).shape, (3, 2, 4))
+
+    def test_captureYield(self):
+        total = np.array([0, 10, 10, 1e4])
+        capture = np.array([0, 0, 5, 1e4])
+        yields = captureYield(total, capture, [1e-4, 1])
+        self.assertEqual(yields.shape, (2, 4))
+        self.assertTrue(np.all(yields[:, :2] == 0))
+        # Thin samples capture n·σg, thick samples every neutron reaching a purely capturing resonance.
+        self.assertAlmostEqual(yields[0, 2], 1e-4 * 5, places=6)
+        self.assertAlmostEqual(yields[1, 3], 1)
+        # Where every interaction is a capture, each neutron is either captured or transmitted.
+        self.assertTrue(np.allclose(yields[:, 3] + transmission(total, [1e-4, 1])[:, 3], 1))
+
+    def test_arealDensity(self):
+        # 1 cm of copper is 0.0849 atoms/b.
+        self.assertAlmostEqual(arealDensity(1, 8.96, 63.546), 0.0849, places=4)
+        self.assertTrue(np.allclose(arealDensity([0.5, 2], 8.96, 63.546), [0.04246, 0.16982], atol=1e-5))
+
+
+if __name__ == '__main__':
+    main()